@@ -0,0 +1,34 @@
+"""Cover phone number value lookups with contact_id
+
+Revision ID: 5e8a1f3c7b20
+Revises: c41d7e9b2a58
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a1f3c7b20"
+down_revision: Union[str, Sequence[str], None] = "c41d7e9b2a58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_phone_number_value_contact",
+        "phone_numbers",
+        ["value", "contact_id"],
+        unique=False,
+    )
+    op.drop_index("idx_phone_number_value", table_name="phone_numbers")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_phone_number_value", "phone_numbers", ["value"], unique=False)
+    op.drop_index("idx_phone_number_value_contact", table_name="phone_numbers")
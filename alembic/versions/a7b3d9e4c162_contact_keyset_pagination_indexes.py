@@ -0,0 +1,38 @@
+"""Contact keyset pagination indexes
+
+Revision ID: a7b3d9e4c162
+Revises: 5e8a1f3c7b20
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b3d9e4c162"
+down_revision: Union[str, Sequence[str], None] = "5e8a1f3c7b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_contact_name_id", "contacts", ["display_name", "id"], unique=False
+    )
+    op.create_index(
+        "idx_contact_updated_id", "contacts", ["updated_at", "id"], unique=False
+    )
+    # Superseded by idx_contact_name_id, which has display_name as its prefix
+    op.drop_index("idx_contact_display_name", table_name="contacts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "idx_contact_display_name", "contacts", ["display_name"], unique=False
+    )
+    op.drop_index("idx_contact_updated_id", table_name="contacts")
+    op.drop_index("idx_contact_name_id", table_name="contacts")
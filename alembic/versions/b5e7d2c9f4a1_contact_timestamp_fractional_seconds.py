@@ -0,0 +1,36 @@
+"""Give server-defaulted contact timestamps fractional seconds
+
+Revision ID: b5e7d2c9f4a1
+Revises: f3a8c5d1e6b9
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e7d2c9f4a1"
+down_revision: Union[str, Sequence[str], None] = "f3a8c5d1e6b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows defaulted by SQLite's CURRENT_TIMESTAMP are stored as
+    # 'YYYY-MM-DD HH:MM:SS'; SQLAlchemy writes and binds '...HH:MM:SS.ffffff'.
+    # Pad them so text comparisons order both formats the same way.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for column in ("created_at", "updated_at"):
+        op.execute(
+            f"UPDATE contacts SET {column} = {column} || '.000000' "
+            f"WHERE length({column}) = 19"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The padded values are valid in the old format as well
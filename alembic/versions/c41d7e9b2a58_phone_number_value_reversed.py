@@ -0,0 +1,60 @@
+"""Phone number reversed value for suffix search
+
+Revision ID: c41d7e9b2a58
+Revises: 8f2c4e6a1d93
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.types import Uuid
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e9b2a58"
+down_revision: Union[str, Sequence[str], None] = "8f2c4e6a1d93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "phone_numbers", sa.Column("value_reversed", sa.String(), nullable=True)
+    )
+    op.create_index(
+        "idx_phone_number_value_reversed",
+        "phone_numbers",
+        ["value_reversed"],
+        unique=False,
+    )
+
+    # Backfill existing rows; SQLite has no reverse() SQL function
+    phone_numbers = sa.table(
+        "phone_numbers",
+        sa.column("id", Uuid(as_uuid=True)),
+        sa.column("value", sa.String()),
+        sa.column("value_reversed", sa.String()),
+    )
+    bind = op.get_bind()
+    rows = [
+        {"phone_id": row.id, "reversed": row.value[::-1]}
+        for row in bind.execute(sa.select(phone_numbers.c.id, phone_numbers.c.value))
+    ]
+    if rows:
+        bind.execute(
+            phone_numbers.update()
+            .where(phone_numbers.c.id == sa.bindparam("phone_id"))
+            .values(value_reversed=sa.bindparam("reversed")),
+            rows,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_phone_number_value_reversed", table_name="phone_numbers")
+    with op.batch_alter_table("phone_numbers") as batch_op:
+        batch_op.drop_column("value_reversed")
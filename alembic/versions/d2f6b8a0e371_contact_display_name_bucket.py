@@ -0,0 +1,66 @@
+"""Contact display name letter bucket
+
+Revision ID: d2f6b8a0e371
+Revises: a7b3d9e4c162
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.types import Uuid
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f6b8a0e371"
+down_revision: Union[str, Sequence[str], None] = "a7b3d9e4c162"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _bucket(display_name: str | None) -> str:
+    """Letter group rule as of this revision (A-Z upper-cased, else '#')."""
+    first = (display_name or "")[:1]
+    return first.upper() if first.isascii() and first.isalpha() else "#"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "contacts", sa.Column("display_name_bucket", sa.String(length=1), nullable=True)
+    )
+    op.create_index(
+        "idx_contact_bucket_name_id",
+        "contacts",
+        ["display_name_bucket", "display_name", "id"],
+        unique=False,
+    )
+
+    # Backfill existing rows in Python, matching the rule used on write
+    contacts = sa.table(
+        "contacts",
+        sa.column("id", Uuid(as_uuid=True)),
+        sa.column("display_name", sa.String()),
+        sa.column("display_name_bucket", sa.String()),
+    )
+    bind = op.get_bind()
+    rows = [
+        {"contact_id": row.id, "bucket": _bucket(row.display_name)}
+        for row in bind.execute(sa.select(contacts.c.id, contacts.c.display_name))
+    ]
+    if rows:
+        bind.execute(
+            contacts.update()
+            .where(contacts.c.id == sa.bindparam("contact_id"))
+            .values(display_name_bucket=sa.bindparam("bucket")),
+            rows,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_contact_bucket_name_id", table_name="contacts")
+    with op.batch_alter_table("contacts") as batch_op:
+        batch_op.drop_column("display_name_bucket")
@@ -0,0 +1,54 @@
+"""Partial list indexes on active contacts
+
+Revision ID: e9c4a2f7d815
+Revises: d2f6b8a0e371
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9c4a2f7d815"
+down_revision: Union[str, Sequence[str], None] = "d2f6b8a0e371"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match the predicate the queries use: deleted.is_(False)
+ACTIVE = sa.column("deleted", sa.Boolean()).is_(False)
+
+# (partial index, full index it replaces, columns)
+INDEXES = [
+    ("idx_contact_active_name", "idx_contact_name_id", ["display_name", "id"]),
+    ("idx_contact_active_updated", "idx_contact_updated_id", ["updated_at", "id"]),
+    (
+        "idx_contact_active_bucket",
+        "idx_contact_bucket_name_id",
+        ["display_name_bucket", "display_name", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for partial, full, columns in INDEXES:
+        op.create_index(
+            partial,
+            "contacts",
+            columns,
+            unique=False,
+            sqlite_where=ACTIVE,
+            postgresql_where=ACTIVE,
+        )
+        op.drop_index(full, table_name="contacts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for partial, full, columns in INDEXES:
+        op.create_index(full, "contacts", columns, unique=False)
+        op.drop_index(partial, table_name="contacts")
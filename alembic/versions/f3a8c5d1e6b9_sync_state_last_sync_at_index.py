@@ -0,0 +1,29 @@
+"""Index sync states by last sync time
+
+Revision ID: f3a8c5d1e6b9
+Revises: e9c4a2f7d815
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a8c5d1e6b9"
+down_revision: Union[str, Sequence[str], None] = "e9c4a2f7d815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_sync_state_last_sync_at", "sync_states", ["last_sync_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_sync_state_last_sync_at", table_name="sync_states")
@@ -9,11 +9,7 @@ alembic upgrade head
 
 echo "Migrations complete. Starting application..."
 
-# Convert LOG_LEVEL to lowercase for uvicorn (it requires lowercase)
-LOG_LEVEL_LOWER=$(echo "${LOG_LEVEL:-info}" | tr '[:upper:]' '[:lower:]')
-
 # Start the application
-exec uvicorn google_contacts_cisco.main:app \
-    --host "${HOST:-0.0.0.0}" \
-    --port "${PORT:-8000}" \
-    --log-level "${LOG_LEVEL_LOWER}"
+# Host, port, log level and trusted proxies are read from HOST, PORT,
+# LOG_LEVEL and TRUSTED_PROXIES by the application settings
+exec python -m google_contacts_cisco
@@ -42,10 +42,12 @@ export interface Contact {
  */
 export interface ContactListResponse {
   contacts: Contact[]
-  total: number
+  /** Null on keyset (cursor) pages, which skip the count */
+  total: number | null
   offset: number
   limit: number
   has_more: boolean
+  next_cursor?: string | null
 }
 
 /**
@@ -1,14 +1,44 @@
-import { defineConfig } from 'vite'
+import { defineConfig, type Plugin } from 'vite'
 import vue from '@vitejs/plugin-vue'
 import path from 'path'
-import { readFileSync } from 'fs'
+import { readFileSync, writeFileSync } from 'fs'
+import { brotliCompressSync, constants as zlibConstants, gzipSync } from 'zlib'
 
 // Read package.json to get version
 const pkg = JSON.parse(readFileSync('./package.json', 'utf-8'))
 
+// Write .br and .gz siblings for text assets so the backend can serve them
+// precompressed instead of shipping the raw bundles
+function precompressAssets(): Plugin {
+  const compressible = /\.(js|css|svg|json)$/
+  let outDir = ''
+  return {
+    name: 'precompress-assets',
+    apply: 'build',
+    configResolved(config) {
+      outDir = path.resolve(config.root, config.build.outDir)
+    },
+    writeBundle(_options, bundle) {
+      for (const fileName of Object.keys(bundle)) {
+        if (!compressible.test(fileName)) continue
+        const filePath = path.resolve(outDir, fileName)
+        const source = readFileSync(filePath)
+        if (source.length < 1024) continue
+        writeFileSync(`${filePath}.gz`, gzipSync(source, { level: 9 }))
+        writeFileSync(
+          `${filePath}.br`,
+          brotliCompressSync(source, {
+            params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 11 },
+          }),
+        )
+      }
+    },
+  }
+}
+
 // https://vitejs.dev/config/
 export default defineConfig({
-  plugins: [vue()],
+  plugins: [vue(), precompressAssets()],
   define: {
     __APP_VERSION__: JSON.stringify(pkg.version),
   },
@@ -0,0 +1,6 @@
+"""Run the application server with ``python -m google_contacts_cisco``."""
+
+from .main import run
+
+if __name__ == "__main__":
+    run()
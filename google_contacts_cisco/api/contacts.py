@@ -7,15 +7,21 @@ This module provides FastAPI endpoints for:
 - /api/search - Search contacts by name or phone number
 """
 
+import base64
+import binascii
+import json
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from ..models import get_db
+from ..models.contact import Contact
 from ..repositories.contact_repository import ContactRepository
 from ..schemas.contact import (
     ContactListResponse,
@@ -62,12 +68,52 @@ class SearchResultsResponse(BaseModel):
     elapsed_ms: float
 
 
+def encode_cursor(contact: Union[Contact, Row], sort_by_recent: bool) -> str:
+    """Encode the keyset cursor pointing just past a contact.
+
+    Args:
+        contact: Last contact (or contact row) on the current page
+        sort_by_recent: Whether the list is sorted by updated_at
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    key = contact.updated_at.isoformat() if sort_by_recent else contact.display_name
+    payload = json.dumps([key, str(contact.id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str, sort_by_recent: bool) -> tuple[Any, UUID]:
+    """Decode a keyset cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string from a previous page's ``next_cursor``
+        sort_by_recent: Whether the list is sorted by updated_at
+
+    Returns:
+        Tuple of (sort key, contact id)
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        key, contact_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        sort_key = datetime.fromisoformat(key) if sort_by_recent else str(key)
+        return sort_key, UUID(contact_id)
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+
+
 @router.get("/contacts", response_model=ContactListResponse)
-async def get_contacts(
+def get_contacts(
     limit: int = Query(
         default=30, ge=1, le=100, description="Number of contacts per page"
     ),
     offset: int = Query(default=0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor",
+    ),
     sort: Optional[str] = Query(
         default="name", description="Sort order: 'name' or 'recent'"
     ),
@@ -79,13 +125,15 @@ async def get_contacts(
     """Get a paginated list of contacts.
 
     Returns contacts with support for:
-    - Pagination via limit and offset
+    - Pagination via limit and offset, or via a keyset cursor
     - Sorting by name or recently updated
     - Filtering by first letter of display name
 
     Args:
         limit: Maximum number of contacts to return (1-100, default 30)
         offset: Number of contacts to skip for pagination (default 0)
+        cursor: Keyset cursor; when given, offset is ignored and no total is
+            counted
         sort: Sort order - 'name' (alphabetical) or 'recent' (by updated_at)
         group: Filter by first letter - A-Z for letters, '#' for numbers/special chars
         db: Database session
@@ -102,39 +150,43 @@ async def get_contacts(
     try:
         # Determine sort order
         sort_by_recent = sort == "recent"
+        after = decode_cursor(cursor, sort_by_recent) if cursor else None
+        page_args: dict[str, Any] = {"limit": limit, "sort_by_recent": sort_by_recent}
+        if after is None:
+            page_args["offset"] = offset
+        else:
+            # Fetch one extra row to learn whether another page follows
+            page_args.update(limit=limit + 1, after=after)
 
-        # Get contacts
+        # Get contacts as plain rows; the page is read-only
+        letter: Optional[str] = None
         if group:
-            # Filter by first letter
-            if group == "#":
-                # Get contacts starting with numbers or special characters
-                contacts = repo.get_contacts_by_letter_group(
-                    "#", limit=limit, offset=offset, sort_by_recent=sort_by_recent
-                )
-                total = repo.count_contacts_by_letter_group("#")
-            elif len(group) == 1 and group.isalpha():
-                # Get contacts starting with specific letter
-                contacts = repo.get_contacts_by_letter_group(
-                    group.upper(),
-                    limit=limit,
-                    offset=offset,
-                    sort_by_recent=sort_by_recent,
-                )
-                total = repo.count_contacts_by_letter_group(group.upper())
-            else:
+            # Filter by first letter; '#' covers numbers and special characters
+            if group != "#" and not (len(group) == 1 and group.isalpha()):
                 raise HTTPException(
                     status_code=400,
                     detail="Group must be a single letter (A-Z) or '#' for numbers",
                 )
+            letter = group.upper()
+        contacts = repo.get_contact_rows(letter, **page_args)
+
+        # Offset pages need the COUNT for page numbers; keyset pages skip it
+        total: Optional[int] = None
+        if after is None:
+            if letter is not None:
+                total = repo.count_contacts_by_letter_group(letter)
+            else:
+                total = repo.count_contacts()
+            has_more = offset + len(contacts) < total
         else:
-            # Get all contacts
-            contacts = repo.get_contacts(
-                limit=limit, offset=offset, sort_by_recent=sort_by_recent
-            )
-            total = repo.count_contacts()
+            has_more = len(contacts) > limit
+            contacts = contacts[:limit]
 
         # Convert to response models
-        contact_responses = [ContactResponse.from_orm(c) for c in contacts]
+        phones = repo.get_phone_number_rows([c.id for c in contacts])
+        contact_responses = [
+            ContactResponse.from_row(c, phones.get(c.id, ())) for c in contacts
+        ]
 
         elapsed_ms = (time.time() - start_time) * 1000
 
@@ -153,7 +205,10 @@ async def get_contacts(
             total=total,
             offset=offset,
             limit=limit,
-            has_more=offset + len(contacts) < total,
+            has_more=has_more,
+            next_cursor=(
+                encode_cursor(contacts[-1], sort_by_recent) if has_more else None
+            ),
         )
 
     except HTTPException:
@@ -166,7 +221,7 @@ async def get_contacts(
 
 
 @router.get("/contacts/stats", response_model=ContactStatsResponse)
-async def get_contact_stats(
+def get_contact_stats(
     db: Session = Depends(get_db),
 ) -> ContactStatsResponse:
     """Get contact statistics.
@@ -194,7 +249,7 @@ async def get_contact_stats(
 
 
 @router.get("/contacts/{contact_id}", response_model=ContactResponse)
-async def get_contact_by_id(
+def get_contact_by_id(
     contact_id: UUID,
     db: Session = Depends(get_db),
 ) -> ContactResponse:
@@ -238,7 +293,7 @@ async def get_contact_by_id(
 
 
 @router.get("/search", response_model=SearchResultsResponse)
-async def search_contacts(
+def search_contacts(
     q: str = Query(..., description="Search query (name or phone number)"),
     limit: int = Query(
         default=50, ge=1, le=100, description="Maximum results to return"
@@ -81,7 +81,7 @@ def _error_response(message: str) -> Response:
 
 
 @router.get("")
-async def get_main_directory(
+def get_main_directory(
     request: Request,
     db: Session = Depends(get_db),
 ) -> Response:
@@ -116,7 +116,7 @@ async def get_main_directory(
 
 
 @router.get("/groups/{group}")
-async def get_group_directory(
+def get_group_directory(
     group: str,
     request: Request,
     db: Session = Depends(get_db),
@@ -167,7 +167,7 @@ async def get_group_directory(
 
 
 @router.get("/contacts/{contact_id}")
-async def get_contact_directory(
+def get_contact_directory(
     contact_id: UUID,
     request: Request,
     db: Session = Depends(get_db),
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from ..models import get_db
+from ..schemas.contact import PhoneNumberResponse
 from ..services.search_service import get_search_service
 from ..utils.logger import get_logger
 
@@ -25,18 +26,6 @@ router = APIRouter(prefix="/api/contacts", tags=["contacts"])
 # Response Models
 
 
-class PhoneNumberResponse(BaseModel):
-    """Phone number response schema."""
-
-    id: UUID
-    value: str
-    display_value: str
-    type: Optional[str] = None
-    primary: bool = False
-
-    model_config = {"from_attributes": True}
-
-
 class ContactResponse(BaseModel):
     """Contact response schema."""
 
@@ -64,7 +53,7 @@ class SearchResponse(BaseModel):
 
 
 @router.get("/search", response_model=SearchResponse)
-async def search_contacts(
+def search_contacts(
     q: str = Query(
         ...,
         description="Search query (name or phone number)",
@@ -152,7 +141,7 @@ async def search_contacts(
 
 
 @router.get("/search/by-name", response_model=SearchResponse)
-async def search_contacts_by_name(
+def search_contacts_by_name(
     q: str = Query(
         ...,
         description="Search query (name only)",
@@ -232,7 +221,7 @@ async def search_contacts_by_name(
 
 
 @router.get("/search/by-phone", response_model=SearchResponse)
-async def search_contacts_by_phone(
+def search_contacts_by_phone(
     q: str = Query(
         ...,
         description="Phone number to search",
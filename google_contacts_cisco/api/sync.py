@@ -105,7 +105,7 @@ class ClearHistoryResponse(BaseModel):
 
 
 @router.get("/status", response_model=SyncStatusResponse)
-async def get_sync_status(db: Session = Depends(get_db)) -> SyncStatusResponse:
+def get_sync_status(db: Session = Depends(get_db)) -> SyncStatusResponse:
     """Get current synchronization status.
 
     Returns information about the last sync operation, including:
@@ -124,7 +124,7 @@ async def get_sync_status(db: Session = Depends(get_db)) -> SyncStatusResponse:
 
 
 @router.post("/full", response_model=SyncTriggerResponse)
-async def trigger_full_sync(
+def trigger_full_sync(
     db: Session = Depends(get_db),
 ) -> SyncTriggerResponse:
     """Trigger full synchronization of Google Contacts.
@@ -191,7 +191,7 @@ async def trigger_full_sync(
 
 
 @router.post("/incremental", response_model=SyncTriggerResponse)
-async def trigger_incremental_sync(
+def trigger_incremental_sync(
     db: Session = Depends(get_db),
 ) -> SyncTriggerResponse:
     """Trigger incremental synchronization of Google Contacts.
@@ -259,7 +259,7 @@ async def trigger_incremental_sync(
 
 
 @router.post("", response_model=SyncTriggerResponse)
-async def trigger_auto_sync(
+def trigger_auto_sync(
     db: Session = Depends(get_db),
 ) -> SyncTriggerResponse:
     """Trigger automatic synchronization of Google Contacts.
@@ -332,7 +332,7 @@ async def trigger_auto_sync(
 
 
 @router.get("/needs-sync")
-async def check_needs_sync(db: Session = Depends(get_db)) -> dict[str, Any]:
+def check_needs_sync(db: Session = Depends(get_db)) -> dict[str, Any]:
     """Check if a full sync is required.
 
     A full sync is needed if:
@@ -363,7 +363,7 @@ async def check_needs_sync(db: Session = Depends(get_db)) -> dict[str, Any]:
 
 
 @router.post("/safe", response_model=SyncTriggerResponse)
-async def trigger_safe_sync(
+def trigger_safe_sync(
     db: Session = Depends(get_db),
 ) -> SyncTriggerResponse | JSONResponse:
     """Trigger sync with concurrency protection.
@@ -426,7 +426,7 @@ async def trigger_safe_sync(
 
 
 @router.get("/history", response_model=SyncHistoryResponse)
-async def get_sync_history(
+def get_sync_history(
     limit: int = Query(default=10, ge=1, le=100, description="Number of records"),
     db: Session = Depends(get_db),
 ) -> SyncHistoryResponse:
@@ -447,7 +447,7 @@ async def get_sync_history(
 
 
 @router.get("/statistics", response_model=SyncStatisticsResponse)
-async def get_sync_statistics(
+def get_sync_statistics(
     db: Session = Depends(get_db),
 ) -> SyncStatisticsResponse:
     """Get comprehensive sync statistics.
@@ -472,7 +472,7 @@ async def get_sync_statistics(
 
 
 @router.delete("/history", response_model=ClearHistoryResponse)
-async def clear_sync_history(
+def clear_sync_history(
     keep_latest: bool = Query(
         default=True,
         description="Keep the most recent sync state",
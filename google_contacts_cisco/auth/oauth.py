@@ -11,19 +11,29 @@ This module handles the complete OAuth 2.0 flow for Google authentication:
 
 import logging
 import os
+import tempfile
+import threading
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional, cast
+from typing import TYPE_CHECKING, Optional
 
 import requests
 from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import Flow  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter
 
 from ..config import settings
 
+if TYPE_CHECKING:
+    from google_auth_oauthlib.flow import Flow  # type: ignore[import-untyped]
+
 logger = logging.getLogger(__name__)
 
+# Parsed credentials keyed on (token path, mtime_ns, size) of the token file
+_credentials_cache: Optional[tuple[tuple[str, int, int], Credentials]] = None
+_credentials_cache_lock = threading.Lock()
+
 
 class OAuthError(Exception):
     """Base exception for OAuth-related errors."""
@@ -49,18 +59,52 @@ class TokenRefreshError(OAuthError):
     pass
 
 
-def get_scopes() -> list[str]:
+@lru_cache(maxsize=1)
+def get_scopes() -> tuple[str, ...]:
     """Get the configured OAuth scopes.
 
+    The scopes are read from settings once and cached as an immutable
+    tuple; call ``get_scopes.cache_clear()`` after changing settings.
+
     Returns:
-        List of OAuth scope strings
+        Tuple of OAuth scope strings
     """
-    return settings.google_oauth_scopes
+    return tuple(settings.google_oauth_scopes)
 
 
-def get_oauth_client() -> Flow:
+@lru_cache(maxsize=1)
+def _build_client_config(client_id: str, client_secret: str, redirect_uri: str) -> dict:
+    """Build the OAuth client configuration for the given credentials.
+
+    The result is cached so the nested dictionary is only built once per
+    distinct set of credentials.
+
+    Args:
+        client_id: Google OAuth client ID
+        client_secret: Google OAuth client secret
+        redirect_uri: OAuth redirect URI
+
+    Returns:
+        Client configuration in the format expected by ``Flow``
+    """
+    return {
+        "web": {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "redirect_uris": [redirect_uri],
+        }
+    }
+
+
+def get_oauth_client() -> "Flow":
     """Create OAuth 2.0 client.
 
+    A new Flow is returned on every call because it carries per-flow state
+    (PKCE code verifier and fetched token); only the client configuration
+    is cached.
+
     Returns:
         Flow: OAuth flow instance configured for Google
 
@@ -73,15 +117,14 @@ def get_oauth_client() -> Flow:
             "Set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET environment variables."
         )
 
-    client_config = {
-        "web": {
-            "client_id": settings.google_client_id,
-            "client_secret": settings.google_client_secret,
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "redirect_uris": [settings.google_redirect_uri],
-        }
-    }
+    # Imported lazily: oauthlib is only needed while running the OAuth flow
+    from google_auth_oauthlib.flow import Flow
+
+    client_config = _build_client_config(
+        settings.google_client_id,
+        settings.google_client_secret,
+        settings.google_redirect_uri,
+    )
 
     flow = Flow.from_client_config(
         client_config,
@@ -101,37 +144,55 @@ def get_token_path() -> Path:
     return settings.token_path
 
 
-def get_credentials() -> Optional[Credentials]:
-    """Get stored credentials or None if not authenticated.
+def _load_credentials(refresh: bool = True) -> Optional[Credentials]:
+    """Load stored credentials from the token file.
 
-    This function attempts to load credentials from the token file,
-    and will automatically refresh them if expired.
+    Args:
+        refresh: Whether to refresh expired credentials with Google. When
+            False, expired credentials that have a refresh token are
+            returned as-is without any network call.
 
     Returns:
-        Credentials if authenticated and valid, None otherwise
+        Credentials if usable, None otherwise
     """
+    global _credentials_cache
+
     token_path = get_token_path()
 
-    if not token_path.exists():
+    try:
+        token_stat = os.stat(token_path)
+    except FileNotFoundError:
         logger.debug("Token file does not exist at %s", token_path)
         return None
 
-    try:
-        creds = Credentials.from_authorized_user_file(str(token_path), get_scopes())
-    except Exception as e:
-        logger.error("Error loading credentials from %s: %s", token_path, e)
-        return None
+    cache_key = (str(token_path), token_stat.st_mtime_ns, token_stat.st_size)
+    with _credentials_cache_lock:
+        cached = _credentials_cache
+
+    if cached is not None and cached[0] == cache_key:
+        creds = cached[1]
+    else:
+        try:
+            creds = Credentials.from_authorized_user_file(str(token_path), get_scopes())
+        except Exception as e:
+            logger.error("Error loading credentials from %s: %s", token_path, e)
+            return None
+        if creds:
+            with _credentials_cache_lock:
+                _credentials_cache = (cache_key, creds)
 
     # Check if credentials are valid
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
+            if not refresh:
+                return creds
             # Try to refresh
             try:
                 logger.info("Refreshing expired access token")
                 creds.refresh(Request())
                 save_credentials(creds)
                 logger.info("Access token refreshed successfully")
-                return cast(Credentials, creds)
+                return creds
             except RefreshError as e:
                 logger.error("Error refreshing token: %s", e)
                 return None
@@ -142,7 +203,68 @@ def get_credentials() -> Optional[Credentials]:
             logger.debug("Credentials invalid and cannot be refreshed")
             return None
 
-    return cast(Credentials, creds)
+    return creds
+
+
+def get_credentials() -> Optional[Credentials]:
+    """Get stored credentials or None if not authenticated.
+
+    This function attempts to load credentials from the token file,
+    and will automatically refresh them if expired.
+
+    Returns:
+        Credentials if authenticated and valid, None otherwise
+    """
+    return _load_credentials(refresh=True)
+
+
+def _clear_credentials_cache() -> None:
+    """Forget any cached credentials so the next load reads the token file."""
+    global _credentials_cache
+
+    with _credentials_cache_lock:
+        _credentials_cache = None
+
+
+@cache
+def _ensure_token_dir(directory: Path) -> Path:
+    """Create the token directory once per process.
+
+    Args:
+        directory: Directory that holds the token file
+
+    Returns:
+        The directory path
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _write_token_file(token_path: Path, data: bytes) -> None:
+    """Atomically write token data with owner-only permissions.
+
+    The data is written to a uniquely named sibling temporary file, which
+    ``tempfile.mkstemp`` creates with mode 0o600, flushed to disk, and then
+    renamed over the token file so readers never see a partially written or
+    world-readable token. Concurrent saves each use their own temp file.
+
+    Args:
+        token_path: Destination token file
+        data: Serialized credentials
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=token_path.parent, prefix=token_path.name + ".", suffix=".tmp"
+    )
+    try:
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, token_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 def save_credentials(creds: Credentials) -> None:
@@ -155,20 +277,27 @@ def save_credentials(creds: Credentials) -> None:
         OSError: If unable to write to the token file
     """
     token_path = get_token_path()
+    data = creds.to_json().encode("utf-8")
 
-    # Ensure directory exists
-    token_path.parent.mkdir(parents=True, exist_ok=True)
+    # Ensure directory exists (only hits the filesystem on first save)
+    _ensure_token_dir(token_path.parent)
 
     # Save credentials
-    with open(token_path, "w") as token_file:
-        token_file.write(creds.to_json())
-
-    # Set file permissions (owner read/write only) - 0o600
+    _clear_credentials_cache()
     try:
-        os.chmod(token_path, 0o600)
-    except OSError as e:
-        # On Windows, chmod may not work as expected
-        logger.warning("Could not set file permissions: %s", e)
+        _write_token_file(token_path, data)
+    except FileNotFoundError:
+        # Directory was removed after it was cached; recreate it
+        _ensure_token_dir.cache_clear()
+        _ensure_token_dir(token_path.parent)
+        _write_token_file(token_path, data)
+
+    if os.name == "nt":
+        # mkstemp's mode bits are not enforced on Windows
+        try:
+            os.chmod(token_path, 0o600)
+        except OSError as e:
+            logger.warning("Could not set file permissions: %s", e)
 
     logger.info("Credentials saved to %s", token_path)
 
@@ -180,6 +309,7 @@ def delete_token_file() -> bool:
         True if file was deleted, False if it didn't exist
     """
     token_path = get_token_path()
+    _clear_credentials_cache()
 
     if token_path.exists():
         token_path.unlink()
@@ -192,11 +322,32 @@ def delete_token_file() -> bool:
 def is_authenticated() -> bool:
     """Check if user is authenticated with valid credentials.
 
+    This is a local check only: expired credentials that carry a refresh
+    token count as authenticated, and no refresh request is made.
+
     Returns:
-        True if authenticated with valid credentials
+        True if authenticated with valid or refreshable credentials
     """
-    creds = get_credentials()
-    return creds is not None and creds.valid
+    creds = _load_credentials(refresh=False)
+    if creds is None:
+        return False
+    return bool(creds.valid or (creds.expired and creds.refresh_token))
+
+
+@lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """Get the shared HTTP session used for calls to Google's OAuth endpoints.
+
+    Reusing one session keeps the TLS connection to Google alive between
+    requests instead of opening a new one each time.
+
+    Returns:
+        Shared requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("https://", adapter)
+    return session
 
 
 def revoke_credentials() -> bool:
@@ -214,7 +365,7 @@ def revoke_credentials() -> bool:
     if creds and creds.token:
         # Attempt to revoke the token with Google
         try:
-            response = requests.post(
+            response = _get_http_session().post(
                 "https://oauth2.googleapis.com/revoke",
                 params={"token": creds.token},
                 headers={"content-type": "application/x-www-form-urlencoded"},
@@ -309,7 +460,8 @@ def get_auth_status() -> dict:
     Returns:
         Dictionary with authentication status details
     """
-    creds = get_credentials()
+    # Don't refresh here: the status should describe the stored token
+    creds = _load_credentials(refresh=False)
 
     if creds is None:
         return {
@@ -1,5 +1,6 @@
 """Application configuration."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +8,12 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=8)
+def _path_for(value: str) -> Path:
+    """Return a cached Path for a configured file path string."""
+    return Path(value)
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables or .env file."""
 
@@ -15,11 +22,16 @@ class Settings(BaseSettings):
     debug: bool = False
     log_level: str = "INFO"
     host: str = "0.0.0.0"
-    port: int = 8000
+    port: int = Field(default=8000, ge=1, le=65535)
 
     # Database Settings
     database_url: str = "sqlite:///./data/contacts.db"
     database_echo: bool = False  # Log SQL queries
+    database_strict_loads: bool = False  # Raise on unplanned lazy loads
+    database_pool_size: int = Field(default=10, ge=1)  # Persistent connections
+    database_max_overflow: int = Field(default=20, ge=0)  # Extra burst connections
+    database_pool_timeout: float = Field(default=30, gt=0)  # Checkout wait (s)
+    database_pool_recycle: int = Field(default=3600, ge=-1)  # Reconnect age (s)
 
     # Google OAuth Settings
     google_client_id: Optional[str] = None
@@ -42,16 +54,19 @@ class Settings(BaseSettings):
     )
 
     # Cisco Directory Settings
-    directory_max_entries_per_page: int = 32  # Max entries per Cisco XML page
+    # Max entries per Cisco XML page
+    directory_max_entries_per_page: int = Field(default=32, ge=1, le=100)
     directory_title: str = "Google Contacts"
 
     # Sync Settings
-    sync_batch_size: int = 100  # Number of contacts to process per batch
-    sync_delay_seconds: float = 0.1  # Delay between API requests
+    # Number of contacts to process per batch
+    sync_batch_size: int = Field(default=100, ge=1, le=1000)
+    sync_delay_seconds: float = Field(default=0.1, ge=0)  # Delay between API requests
 
     # Sync Scheduler Settings (optional)
     sync_scheduler_enabled: bool = False  # Enable background sync scheduler
-    sync_interval_minutes: int = 60  # Sync interval in minutes (min 5)
+    # Sync interval in minutes (5 minutes to 24 hours)
+    sync_interval_minutes: int = Field(default=60, ge=5, le=1440)
 
     # Timezone Settings
     timezone: str = (
@@ -60,7 +75,8 @@ class Settings(BaseSettings):
     )
 
     # Search Settings
-    search_results_limit: int = 50  # Max search results to return
+    # Max search results to return
+    search_results_limit: int = Field(default=50, ge=1, le=500)
 
     # Proxy Settings (for reverse proxy deployments)
     # List of trusted proxy IP addresses/CIDR ranges that can send X-Forwarded-* headers
@@ -85,56 +101,6 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of: {', '.join(valid_levels)}")
         return v
 
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v: int) -> int:
-        """Validate port is in valid range."""
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-
-    @field_validator("directory_max_entries_per_page")
-    @classmethod
-    def validate_max_entries(cls, v: int) -> int:
-        """Validate max entries per page is reasonable."""
-        if not 1 <= v <= 100:
-            raise ValueError("Max entries per page must be between 1 and 100")
-        return v
-
-    @field_validator("sync_batch_size")
-    @classmethod
-    def validate_batch_size(cls, v: int) -> int:
-        """Validate batch size is reasonable."""
-        if not 1 <= v <= 1000:
-            raise ValueError("Batch size must be between 1 and 1000")
-        return v
-
-    @field_validator("sync_delay_seconds")
-    @classmethod
-    def validate_sync_delay(cls, v: float) -> float:
-        """Validate sync delay is non-negative."""
-        if v < 0:
-            raise ValueError("Sync delay must be non-negative")
-        return v
-
-    @field_validator("search_results_limit")
-    @classmethod
-    def validate_search_limit(cls, v: int) -> int:
-        """Validate search results limit is reasonable."""
-        if not 1 <= v <= 500:
-            raise ValueError("Search results limit must be between 1 and 500")
-        return v
-
-    @field_validator("sync_interval_minutes")
-    @classmethod
-    def validate_sync_interval(cls, v: int) -> int:
-        """Validate sync interval is reasonable (minimum 5 minutes)."""
-        if not 5 <= v <= 1440:
-            raise ValueError(
-                "Sync interval must be between 5 and 1440 minutes (24 hours)"
-            )
-        return v
-
     @field_validator("trusted_proxies", mode="before")
     @classmethod
     def parse_trusted_proxies(cls, v):
@@ -177,7 +143,7 @@ class Settings(BaseSettings):
     @property
     def token_path(self) -> Path:
         """Get token file path."""
-        return Path(self.google_token_file)
+        return _path_for(self.google_token_file)
 
     def ensure_directories(self) -> None:
         """Ensure required directories exist."""
@@ -185,12 +151,14 @@ class Settings(BaseSettings):
         self.token_path.parent.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings instance.
 
-    This function creates a new Settings instance each time it's called,
-    which allows for proper testing with different configurations.
-    For production use, consider caching the settings instance.
+    The Settings instance is created once and cached so the environment and
+    ``.env`` file are only parsed on first use. Tests that change the
+    environment should call ``get_settings.cache_clear()`` to pick up the
+    new values.
     """
     return Settings()
 
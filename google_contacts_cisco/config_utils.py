@@ -5,6 +5,14 @@ from typing import Any
 
 from .config import Settings, settings
 
+# Fields that should be masked when configuration is displayed
+SENSITIVE_FIELDS = frozenset(
+    {
+        "google_client_secret",
+        "secret_key",
+    }
+)
+
 
 def generate_secret_key() -> str:
     """Generate a secure secret key.
@@ -56,19 +64,10 @@ def get_safe_config_dict(config: Settings | None = None) -> dict[str, Any]:
     if config is None:
         config = settings
 
-    # Fields that should be masked
-    sensitive_fields = {
-        "google_client_secret",
-        "secret_key",
-    }
-
-    result: dict[str, Any] = {}
-    for field_name in type(config).model_fields:
-        value = getattr(config, field_name)
-        if field_name in sensitive_fields and value:
+    result: dict[str, Any] = config.model_dump()
+    for field_name in SENSITIVE_FIELDS:
+        if result.get(field_name):
             result[field_name] = "***MASKED***"
-        else:
-            result[field_name] = value
 
     return result
 
@@ -1,15 +1,25 @@
 """Main application entry point."""
 
+import asyncio
+import hashlib
+import importlib
 import logging
+import mimetypes
+import os
+import sys
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Callable, Mapping
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
-from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+from starlette.datastructures import Headers
+from starlette.types import Scope
 
 from ._version import __version__
 from .api.contacts import router as contacts_router
@@ -20,25 +30,211 @@ from .api.search_routes import router as search_router
 from .api.sync import router as sync_router
 from .config import settings
 from .config_utils import print_configuration_summary, validate_configuration
-from .services.scheduler import start_sync_scheduler, stop_sync_scheduler
+from .utils.logger import configure_queue_logging
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Configure logging; records are formatted and written on a listener thread
+configure_queue_logging(settings.log_level)
 logger = logging.getLogger(__name__)
 
 # Get base directory
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static" / "dist"
 
+# Path prefixes handled by backend routes that must never fall back to the SPA
+BACKEND_PATH_PREFIXES = (
+    "api/",
+    "auth/",
+    "directory/",
+    "health",
+    "docs",
+    "openapi.json",
+)
+
+
+def build_static_file_table(
+    static_dir: Path, exclude: tuple[str, ...] = ()
+) -> Mapping[str, Path]:
+    """Index the files of the built frontend by their URL path.
+
+    The tree is walked once at startup so requests can be served with a
+    dictionary lookup instead of resolving and stat-ing paths per request.
+    Symlinks are skipped entirely, so every indexed path lies inside
+    ``static_dir`` without needing to be resolved. The returned mapping is
+    read-only; membership in it is what decides whether a file is served.
+
+    Args:
+        static_dir: Root directory of the built frontend
+        exclude: Top-level file or directory names to skip (e.g. mounted
+            assets, or files served by a dedicated handler)
+
+    Returns:
+        Read-only mapping of relative POSIX path to absolute file path
+    """
+    table: dict[str, Path] = {}
+    pending = [(static_dir, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_symlink() or (not prefix and entry.name in exclude):
+                    continue
+                rel_path = prefix + entry.name
+                if entry.is_dir():
+                    pending.append((Path(entry.path), rel_path + "/"))
+                elif entry.is_file():
+                    table[rel_path] = Path(entry.path)
+    return MappingProxyType(table)
+
+
+def accepted_encodings(accept_encoding: str) -> frozenset[str]:
+    """Parse the content codings a client accepts from Accept-Encoding.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        Lower-cased codings not refused with ``q=0``
+    """
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = params.strip().lower().removeprefix("q=")
+        if params and quality.replace(".", "").strip("0") == "":
+            continue
+        accepted.add(coding)
+    return frozenset(accepted)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves ``.br``/``.gz`` siblings produced at build time.
+
+    The frontend build writes Brotli and gzip copies of its text bundles.
+    They are indexed once at startup, and a request accepting one of those
+    codings gets the precompressed file with ``Content-Encoding`` set, so no
+    compression happens per request. Range requests always get the original
+    file, since their byte offsets refer to the uncompressed content.
+    """
+
+    # Preferred content codings and the file suffixes the build writes
+    ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+    def __init__(self, *, directory: Path, **kwargs: Any) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self.precompressed = frozenset(
+            rel_path
+            for rel_path in build_static_file_table(Path(directory))
+            if rel_path.endswith((".br", ".gz"))
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve a precompressed variant of ``path`` when the client accepts it."""
+        rel_path = path.replace(os.sep, "/")
+        variants = [
+            (encoding, rel_path + suffix)
+            for encoding, suffix in self.ENCODINGS
+            if rel_path + suffix in self.precompressed
+        ]
+        if not variants:
+            return await super().get_response(path, scope)
+
+        headers = Headers(scope=scope)
+        if "range" in headers:
+            accepted: frozenset[str] = frozenset()
+        else:
+            accepted = accepted_encodings(headers.get("accept-encoding", ""))
+        for encoding, variant in variants:
+            if encoding in accepted:
+                response = await super().get_response(variant, scope)
+                if response.status_code in (200, 304):
+                    response.headers["content-encoding"] = encoding
+                    # The variant's type is guessed from the original name
+                    response.headers["content-type"] = (
+                        mimetypes.guess_type(rel_path)[0] or "text/plain"
+                    )
+                break
+        else:
+            response = await super().get_response(path, scope)
+        response.headers["vary"] = "Accept-Encoding"
+        return response
+
+
+def stat_etag(stat_result: os.stat_result) -> str:
+    """Compute the ETag Starlette's FileResponse and StaticFiles send for a file.
+
+    Args:
+        stat_result: Result of stat-ing the file
+
+    Returns:
+        Quoted entity tag
+    """
+    etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+    digest = hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an entity tag.
+
+    Uses the weak comparison RFC 9110 requires for If-None-Match, so a
+    ``W/`` prefix added by a compressing proxy still matches.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Quoted entity tag of the current representation
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == target for tag in if_none_match.split(",")
+    )
+
+
+def build_index_responder(index_path: Path) -> Callable[[Request], Response]:
+    """Create a handler serving index.html from memory with ETag support.
+
+    index.html is small and only changes on redeploy, so it is read and
+    hashed once.
+
+    Args:
+        index_path: Path to the built index.html
+
+    Returns:
+        Function building the 200 or 304 response for a request
+    """
+    index_bytes = index_path.read_bytes()
+    index_digest = hashlib.md5(index_bytes, usedforsecurity=False).hexdigest()
+    index_etag = f'"{index_digest}"'
+    index_headers = {
+        "etag": index_etag,
+        "cache-control": "no-cache",
+    }
+
+    def index_response(request: Request) -> Response:
+        """Build the index.html response, honouring If-None-Match."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, index_etag):
+            return Response(status_code=304, headers=index_headers)
+        return Response(
+            content=index_bytes, media_type="text/html", headers=index_headers
+        )
+
+    return index_response
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup and shutdown events."""
     # Startup
     logger.info("Starting %s v%s", settings.app_name, __version__)
+    loop_type = type(asyncio.get_running_loop())
+    logger.info("Event loop: %s.%s", loop_type.__module__, loop_type.__name__)
     print_configuration_summary()
 
     is_valid, errors = validate_configuration()
@@ -57,8 +253,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Ensure required directories exist
     settings.ensure_directories()
 
-    # Start sync scheduler if configured
+    # Start sync scheduler if configured (imported only when it is used)
     if settings.sync_scheduler_enabled:
+        from .services.scheduler import start_sync_scheduler
+
         start_sync_scheduler(settings.sync_interval_minutes)
         logger.info(
             "Sync scheduler started (interval: %d minutes)",
@@ -71,7 +269,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     # Stop sync scheduler if running
-    stop_sync_scheduler()
+    if settings.sync_scheduler_enabled:
+        from .services.scheduler import stop_sync_scheduler
+
+        stop_sync_scheduler()
     logger.info("Shutting down %s", settings.app_name)
 
 
@@ -156,35 +357,50 @@ For issues and questions, check the troubleshooting guide or review application
     ],
 )
 
-# Proxy headers middleware (for reverse proxy deployments)
-# This must be added before other middleware to properly handle X-Forwarded-* headers
-if settings.trusted_proxies:
-    app.add_middleware(
-        ProxyHeadersMiddleware,
-        trusted_hosts=settings.trusted_proxies,
-    )
-    logger.info(
-        "Proxy headers middleware enabled - trusting X-Forwarded-* headers from: %s",
-        ", ".join(settings.trusted_proxies),
+
+def warn_if_trusted_proxies_unapplied() -> None:
+    """Warn when TRUSTED_PROXIES is set but the server was not started by run().
+
+    Proxy headers are handled by uvicorn, and only ``run()`` (used by
+    ``python -m google_contacts_cisco``) passes ``TRUSTED_PROXIES`` to it.
+    Under gunicorn or a bare ``uvicorn`` command the setting has no effect.
+    """
+    if not settings.trusted_proxies:
+        return
+    main_spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+    if main_spec is not None and main_spec.name == f"{__package__}.__main__":
+        return
+    logger.warning(
+        "TRUSTED_PROXIES is only applied by 'python -m google_contacts_cisco'. "
+        "When starting the app with gunicorn or uvicorn directly, pass "
+        "--forwarded-allow-ips=%s instead or X-Forwarded-* headers are ignored",
+        ",".join(settings.trusted_proxies),
     )
 
-# CORS middleware (for development)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=(
-        [
-            "http://localhost:5173",  # Vite dev server
-            "http://127.0.0.1:5173",
-            "http://localhost:8000",
-            "http://127.0.0.1:8000",
-        ]
-        if settings.debug
-        else []
-    ),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+
+warn_if_trusted_proxies_unapplied()
+
+# CORS middleware (for development only)
+# With no allowed origins it would never add headers, so skip it entirely in
+# production rather than paying for an extra middleware layer on every request
+cors_origins = (
+    [
+        "http://localhost:5173",  # Vite dev server
+        "http://127.0.0.1:5173",
+        "http://localhost:8000",
+        "http://127.0.0.1:8000",
+    ]
+    if settings.debug
+    else []
 )
+if cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 # Include API routers
 # Note: search_router must be included before contacts_router to ensure
@@ -197,75 +413,211 @@ app.include_router(google_router)
 app.include_router(sync_router)
 
 
+# Seconds a /health result is reused before the configuration is re-validated
+HEALTH_CACHE_TTL_SECONDS = 5.0
+
+# Clock used for the health cache; aliased so tests can control it without
+# patching the global time module
+_monotonic = time.monotonic
+
+# (checked_at, validation result, rendered JSON body) of the last health check
+_health_cache: tuple[float, tuple[bool, list[str]], bytes] | None = None
+
+
 @app.get("/health")
-async def health() -> dict[str, Any]:
-    """Health check endpoint."""
-    is_valid, errors = validate_configuration()
-    return {
-        "status": "healthy",
-        "version": __version__,
-        "debug": settings.debug,
-        "config_valid": is_valid,
-        "config_errors": errors if not is_valid else [],
-    }
+async def health() -> Response:
+    """Health check endpoint.
+
+    Liveness and load balancer probes hit this frequently, so the validation
+    result is cached for ``HEALTH_CACHE_TTL_SECONDS`` and the rendered body
+    is reused until the result changes. Each request still gets its own
+    Response, since FastAPI sets per-request state on the returned object.
+    """
+    global _health_cache
+
+    now = _monotonic()
+    if _health_cache is not None:
+        checked_at, cached_result, cached_body = _health_cache
+        if now - checked_at < HEALTH_CACHE_TTL_SECONDS:
+            return Response(content=cached_body, media_type="application/json")
+
+    result = validate_configuration()
+    if _health_cache is not None and result == _health_cache[1]:
+        body = _health_cache[2]
+    else:
+        is_valid, errors = result
+        body = orjson.dumps(
+            {
+                "status": "healthy",
+                "version": __version__,
+                "debug": settings.debug,
+                "config_valid": is_valid,
+                "config_errors": errors if not is_valid else [],
+            }
+        )
+    _health_cache = (now, result, body)
+    return Response(content=body, media_type="application/json")
+
 
+def _configure_spa(app: FastAPI, static_dir: Path) -> None:
+    """Serve the built Vue frontend, falling back to index.html for SPA routes.
 
-# Serve Vue static files (production)
-# Check if the built frontend exists
-if STATIC_DIR.exists() and (STATIC_DIR / "index.html").exists():
-    logger.info("Serving Vue frontend from %s", STATIC_DIR)
+    Args:
+        app: Application to register the asset mount and catch-all route on
+        static_dir: Resolved directory containing the built frontend
+    """
+    logger.info("Serving Vue frontend from %s", static_dir)
 
     # Mount static assets (JS, CSS, images)
-    assets_dir = STATIC_DIR / "assets"
-    if assets_dir.exists():
+    assets_dir = static_dir / "assets"
+    has_assets = assets_dir.exists()
+    if has_assets:
         app.mount(
             "/assets",
-            StaticFiles(directory=str(assets_dir)),
+            # Existence was checked above; Starlette's FileResponse already
+            # uses http.response.pathsend when the server advertises it
+            PrecompressedStaticFiles(directory=assets_dir, html=False, check_dir=False),
             name="assets",
         )
 
+    # Build the static file lookup table once; /assets is served by the mount
+    # and index.html is always served by index_response so it has one ETag
+    static_files = build_static_file_table(
+        static_dir, exclude=("assets", "index.html") if has_assets else ("index.html",)
+    )
+    # Built files don't change while the server runs, so stat them once; the
+    # ETag matches the one FileResponse and the /assets mount derive from stat
+    static_entries: dict[str, tuple[Path, os.stat_result, str]] = {}
+    for rel_path, path in static_files.items():
+        stat_result = path.stat()
+        static_entries[rel_path] = (path, stat_result, stat_etag(stat_result))
+    index_response = build_index_responder(static_dir / "index.html")
+
     # Serve index.html for all non-API routes (SPA fallback)
     @app.get("/{full_path:path}")
-    async def serve_spa(_request: Request, full_path: str) -> FileResponse:
+    async def serve_spa(request: Request, full_path: str) -> Response:
         """Serve Vue SPA for all non-API routes."""
         # Skip API and other backend routes
-        api_prefixes = ("api/", "auth/", "directory/", "health", "docs", "openapi.json")
-        if full_path.startswith(api_prefixes):
+        if full_path.startswith(BACKEND_PATH_PREFIXES):
             # Return 404 for non-existent API routes
-            from fastapi import HTTPException
-
             raise HTTPException(status_code=404, detail="Not found")
 
         # Check for static file first (e.g., vite.svg, favicon.ico)
-        # Prevent path traversal attacks by resolving and checking
-        # path is within STATIC_DIR
-        static_file = STATIC_DIR / full_path
-        resolved = static_file.resolve()
-        try:
-            resolved.relative_to(STATIC_DIR)
-        except ValueError:
-            # Path is outside STATIC_DIR, likely a path traversal attempt
+        # Only files indexed at startup are served, so paths outside
+        # the static directory can never be reached
+        static_entry = static_entries.get(full_path)
+        if static_entry is not None:
+            static_file, stat_result, etag = static_entry
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"etag": etag})
+            return FileResponse(static_file, stat_result=stat_result)
+
+        if ".." in full_path.split("/"):
+            # Likely a path traversal attempt
             raise HTTPException(status_code=403, detail="Forbidden")
 
-        if resolved.exists() and resolved.is_file():
-            return FileResponse(resolved)
-
         # Serve index.html for all other routes (SPA routing)
-        return FileResponse(STATIC_DIR / "index.html")
+        return index_response(request)
 
-else:
+
+def _configure_api_only(app: FastAPI) -> None:
+    """Register the JSON root endpoint used when the frontend is not built.
+
+    Args:
+        app: Application to register the root route on
+    """
     logger.info(
         "Vue frontend not built. "
         "Run 'cd frontend && npm run build' to build the frontend."
     )
 
+    # Settings don't change at runtime, so build the payload once
+    root_info = {
+        "message": f"{settings.app_name} API",
+        "version": __version__,
+        "docs": "/docs",
+        "note": "Frontend not built. Run 'npm run build' in frontend/.",
+    }
+
     # Root endpoint when frontend is not built
     @app.get("/")
     async def root() -> dict[str, str]:
         """Root endpoint (when frontend is not built)."""
-        return {
-            "message": f"{settings.app_name} API",
-            "version": __version__,
-            "docs": "/docs",
-            "note": "Frontend not built. Run 'npm run build' in frontend/.",
-        }
+        return root_info
+
+
+# Serve Vue static files (production) if the built frontend exists
+if (STATIC_DIR / "index.html").exists():
+    _configure_spa(app, STATIC_DIR)
+else:
+    _configure_api_only(app)
+
+
+def select_server_implementations() -> tuple[str, str]:
+    """Pick the uvicorn event loop and HTTP parser implementations.
+
+    uvloop and httptools are installed with ``uvicorn[standard]`` and are
+    used whenever they can be imported. If either is missing, production
+    mode refuses to start rather than silently running on the slower
+    asyncio loop or h11 parser; debug mode falls back with a warning.
+
+    Returns:
+        Tuple of (loop, http) names to pass to uvicorn
+
+    Raises:
+        RuntimeError: If uvloop or httptools is missing outside debug mode
+    """
+    implementations: list[str] = []
+    for module_name, fallback in (("uvloop", "asyncio"), ("httptools", "h11")):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            if not settings.debug:
+                raise RuntimeError(
+                    f"{module_name} is required in production; "
+                    "install uvicorn[standard]"
+                ) from None
+            logger.warning(
+                "%s not installed, falling back to %s", module_name, fallback
+            )
+            implementations.append(fallback)
+        else:
+            logger.info(
+                "Using %s %s",
+                module_name,
+                getattr(module, "__version__", "unknown"),
+            )
+            implementations.append(module_name)
+    return implementations[0], implementations[1]
+
+
+def run() -> None:
+    """Run the application with uvicorn using the configured server options.
+
+    X-Forwarded-* handling is done by uvicorn itself and is only enabled when
+    ``TRUSTED_PROXIES`` is set, so direct deployments don't pay for proxy
+    header parsing. Access logging is disabled; application logs are
+    unaffected.
+    """
+    import uvicorn
+
+    loop, http = select_server_implementations()
+
+    if settings.trusted_proxies:
+        logger.info(
+            "Proxy headers enabled - trusting X-Forwarded-* headers from: %s",
+            ", ".join(settings.trusted_proxies),
+        )
+
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=settings.port,
+        log_level=settings.log_level.lower(),
+        proxy_headers=bool(settings.trusted_proxies),
+        forwarded_allow_ips=settings.trusted_proxies or None,
+        access_log=False,
+        loop=loop,
+        http=http,
+    )
@@ -2,20 +2,55 @@
 
 # Create database directory if it doesn't exist
 from pathlib import Path
+from typing import Any
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from ..config import settings
 
 Path("data").mkdir(exist_ok=True)
 
+
+def pool_options(database_url: str) -> dict[str, Any]:
+    """Build connection pool arguments for ``create_engine``.
+
+    Sync runs many short transactions alongside web requests, so the pool is
+    larger than SQLAlchemy's default of 5. Connections to a database server
+    are pinged on checkout and recycled hourly so a dropped connection never
+    fails a request. Local SQLite connections cannot go stale and skip both.
+    In-memory SQLite uses a per-thread pool that takes no sizing options.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments for ``create_engine``
+    """
+    url = make_url(database_url)
+    is_sqlite = url.get_backend_name() == "sqlite"
+    if is_sqlite and url.database in (None, "", ":memory:"):
+        return {}
+
+    options: dict[str, Any] = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+    }
+    if not is_sqlite:
+        options["pool_pre_ping"] = True
+        options["pool_recycle"] = settings.database_pool_recycle
+    return options
+
+
 # Create engine with error handling
 try:
     engine = create_engine(
         settings.database_url,
         connect_args={"check_same_thread": False},  # Needed for SQLite
-        echo=settings.debug,  # Log SQL queries in debug mode
+        echo=settings.database_echo,  # Log SQL queries (DATABASE_ECHO)
+        **pool_options(settings.database_url),
     )
 except Exception as e:
     raise RuntimeError(
@@ -24,18 +59,61 @@ except Exception as e:
     ) from e
 
 
+# Per-connection SQLite tuning for a read-heavy directory service:
+# - WAL lets phone directory reads proceed while a sync is writing
+# - synchronous=NORMAL is durable under WAL and avoids an fsync per commit
+# - temp tables, a 256 MiB memory map and a 64 MiB page cache keep reads in RAM
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
-    """Enable foreign key constraints for SQLite."""
+    """Enable foreign key constraints and performance pragmas for SQLite."""
     if "sqlite" in settings.database_url:
         cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
         cursor.close()
 
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Key in Session.info under which transaction_cache() keeps its values
+_TRANSACTION_CACHE_KEY = "transaction_cache"
+
+
+def transaction_cache(session: Session) -> dict[str, Any]:
+    """Get the session's cache for values valid until its transaction ends.
+
+    Repositories keep lookups here instead of on themselves, so any number
+    of repositories can share a session without registering listeners on
+    it. One listener on ``Session`` drops the cache on commit and rollback.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Mutable dict scoped to the session's current transaction
+    """
+    cache: dict[str, Any] = session.info.setdefault(_TRANSACTION_CACHE_KEY, {})
+    return cache
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_transaction_cache(session: Session) -> None:
+    """Drop the transaction cache once the transaction it mirrors has ended."""
+    session.info.pop(_TRANSACTION_CACHE_KEY, None)
+
+
 # Create base class for models
 Base = declarative_base()
 
@@ -59,6 +137,7 @@ __all__ = [
     "engine",
     "SessionLocal",
     "get_db",
+    "transaction_cache",
     "Contact",
     "PhoneNumber",
     "SyncState",
@@ -3,32 +3,63 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, Index, String
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Uuid
 
 from . import Base
 
 
+def display_name_bucket(display_name: str | None) -> str:
+    """Return the letter group a display name is listed under.
+
+    Args:
+        display_name: Contact display name
+
+    Returns:
+        Upper-case first letter for A-Z names, otherwise '#'
+    """
+    first = (display_name or "")[:1]
+    return first.upper() if first.isascii() and first.isalpha() else "#"
+
+
+def _display_name_bucket_default(context) -> str:
+    """Default ``display_name_bucket`` from the inserted ``display_name``."""
+    return display_name_bucket(context.get_current_parameters().get("display_name"))
+
+
 class Contact(Base):  # type: ignore[misc, valid-type]
     """Contact model."""
 
     __tablename__ = "contacts"
 
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resource_name = Column(String, unique=True, nullable=False)
+    resource_name = Column(String, nullable=False)
     etag = Column(String, nullable=True)
     given_name = Column(String, nullable=True)
     family_name = Column(String, nullable=True)
     display_name = Column(String, nullable=False)
+    # Letter group (A-Z or '#') stored at write time so group filters are an
+    # indexed equality instead of substr()/ILIKE on every query
+    display_name_bucket = Column(
+        String(1), nullable=True, default=_display_name_bucket_default
+    )
     organization = Column(String, nullable=True)
     job_title = Column(String, nullable=True)
+    # Timestamps are written from Python so every row has the same stored
+    # format; SQLite's CURRENT_TIMESTAMP has whole seconds and no fraction,
+    # which breaks ordering and equality against Python-written values. The
+    # server default only covers rows inserted outside SQLAlchemy.
     created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False,
     )
     updated_at = Column(
         DateTime,
         default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
@@ -41,9 +72,35 @@ class Contact(Base):  # type: ignore[misc, valid-type]
     )
 
     # Indexes
+    # resource_name uniqueness is enforced by its named index alone, matching
+    # the migration; a column-level unique=True would add a second B-tree
     __table_args__ = (
-        Index("idx_contact_display_name", "display_name"),
-        Index("idx_contact_resource_name", "resource_name"),
+        # List indexes: sort key plus id tie-breaker for keyset pagination.
+        # Partial on active contacts, since every list query filters on
+        # deleted.is_(False); the query predicate must match for the planner.
+        Index(
+            "idx_contact_active_name",
+            "display_name",
+            "id",
+            sqlite_where=deleted.is_(False),
+            postgresql_where=deleted.is_(False),
+        ),
+        Index(
+            "idx_contact_active_updated",
+            "updated_at",
+            "id",
+            sqlite_where=deleted.is_(False),
+            postgresql_where=deleted.is_(False),
+        ),
+        Index(
+            "idx_contact_active_bucket",
+            "display_name_bucket",
+            "display_name",
+            "id",
+            sqlite_where=deleted.is_(False),
+            postgresql_where=deleted.is_(False),
+        ),
+        Index("idx_contact_resource_name", "resource_name", unique=True),
     )
 
     def __repr__(self):
@@ -2,13 +2,19 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Column, ForeignKey, Index, String
+from sqlalchemy import Boolean, Column, ColumnElement, ForeignKey, Index, String, and_
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Uuid
 
 from . import Base
 
 
+def _reversed_value(context) -> str | None:
+    """Default ``value_reversed`` to the inserted ``value`` spelled backwards."""
+    value = context.get_current_parameters().get("value")
+    return value[::-1] if value is not None else None
+
+
 class PhoneNumber(Base):  # type: ignore[misc, valid-type]
     """Phone number model."""
 
@@ -17,6 +23,8 @@ class PhoneNumber(Base):  # type: ignore[misc, valid-type]
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     contact_id = Column(Uuid(as_uuid=True), ForeignKey("contacts.id"), nullable=False)
     value = Column(String, nullable=False)
+    # Reversed copy of value so suffix searches become indexable prefix ranges
+    value_reversed = Column(String, nullable=True, default=_reversed_value)
     display_value = Column(String, nullable=False)
     type = Column(String, nullable=True)
     primary = Column(Boolean, default=False, nullable=False)
@@ -26,9 +34,28 @@ class PhoneNumber(Base):  # type: ignore[misc, valid-type]
 
     # Indexes
     __table_args__ = (
-        Index("idx_phone_number_value", "value"),
+        # contact_id rides along so phone lookups join to contacts index-only
+        Index("idx_phone_number_value_contact", "value", "contact_id"),
+        Index("idx_phone_number_value_reversed", "value_reversed"),
         Index("idx_phone_number_contact", "contact_id"),
     )
 
+    @classmethod
+    def value_endswith(cls, digits: str) -> ColumnElement[bool]:
+        """Build a condition matching phone numbers whose value ends in ``digits``.
+
+        The suffix match is expressed as a range over ``value_reversed`` so it
+        can use that column's index, unlike ``value LIKE '%digits'``.
+
+        Args:
+            digits: Non-empty string of digits to match at the end of the value
+
+        Returns:
+            SQLAlchemy condition for use in a WHERE clause
+        """
+        prefix = digits[::-1]
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return and_(cls.value_reversed >= prefix, cls.value_reversed < upper)
+
     def __repr__(self):
         return f"<PhoneNumber(id={self.id}, value='{self.value}', type='{self.type}')>"
@@ -3,7 +3,7 @@
 import uuid
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.types import Uuid
 
@@ -31,6 +31,12 @@ class SyncState(Base):  # type: ignore[misc, valid-type]
     )
     error_message = Column(String, nullable=True)
 
+    # Indexes
+    __table_args__ = (
+        # Every status lookup reads the newest row: ORDER BY last_sync_at DESC
+        Index("idx_sync_state_last_sync_at", "last_sync_at"),
+    )
+
     def __repr__(self):
         return (
             f"<SyncState(id={self.id}, status='{self.sync_status}', "
@@ -6,12 +6,27 @@ including CRUD operations, upsert logic, and query methods.
 
 import re
 from datetime import datetime, timezone
-from typing import List, Optional
-from uuid import UUID
-
-from sqlalchemy.orm import Session
-
-from ..models.contact import Contact
+from typing import Any, Callable, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    bindparam,
+    delete,
+    distinct,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session, raiseload, selectinload
+
+from ..config import settings
+from ..models import transaction_cache
+from ..models.contact import Contact, display_name_bucket
 from ..models.phone_number import PhoneNumber
 from ..schemas.contact import ContactCreateSchema
 from ..utils.logger import get_logger
@@ -19,6 +34,54 @@ from ..utils.phone_utils import get_phone_normalizer
 
 logger = get_logger(__name__)
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO UPDATE
+_UPSERT_INSERTS: dict[str, Callable[..., Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Point lookups run on every sync write; build them once so each call only
+# binds parameters and hits SQLAlchemy's compiled statement cache
+_BY_ID = select(Contact).where(Contact.id == bindparam("contact_id"))
+_BY_RESOURCE_NAME = select(Contact).where(
+    Contact.resource_name == bindparam("resource_name")
+)
+
+# Columns shown on a contact list page, read as plain rows so the read-only
+# list path skips ORM instance construction and the identity map
+_LIST_COLUMNS = (
+    Contact.id,
+    Contact.display_name,
+    Contact.given_name,
+    Contact.family_name,
+    Contact.created_at,
+    Contact.updated_at,
+)
+_LIST_PHONE_COLUMNS = (
+    PhoneNumber.id,
+    PhoneNumber.contact_id,
+    PhoneNumber.value,
+    PhoneNumber.display_value,
+    PhoneNumber.type,
+    PhoneNumber.primary,
+)
+
+
+def _phone_loader_options() -> tuple[Any, ...]:
+    """Build loader options for contact queries whose callers read phone numbers.
+
+    Phone numbers are fetched with one extra ``IN`` query. With
+    ``database_strict_loads`` enabled, touching any other relationship on the
+    results raises instead of silently issuing a lazy SELECT.
+
+    Returns:
+        Options to pass to ``Query.options()``
+    """
+    options: tuple[Any, ...] = (selectinload(Contact.phone_numbers),)
+    if settings.database_strict_loads:
+        options += (raiseload("*"),)
+    return options
+
 
 class ContactRepository:
     """Repository for contact database operations.
@@ -36,6 +99,18 @@ class ContactRepository:
         """
         self.db = db
 
+    @property
+    def _resource_name_cache(self) -> dict[str, Contact]:
+        """Contacts looked up by resource name in the current transaction.
+
+        Kept in the session's transaction cache, which is dropped on
+        commit/rollback so it never outlives the rows it mirrors.
+        """
+        cache: dict[str, Contact] = transaction_cache(self.db).setdefault(
+            "contacts_by_resource_name", {}
+        )
+        return cache
+
     def create_contact(self, contact_data: ContactCreateSchema) -> Contact:
         """Create a new contact with phone numbers.
 
@@ -46,11 +121,13 @@ class ContactRepository:
             Created contact entity with populated ID
         """
         contact = Contact(
+            id=uuid4(),  # Known before the row is written
             resource_name=contact_data.resource_name,
             etag=contact_data.etag,
             given_name=contact_data.given_name,
             family_name=contact_data.family_name,
             display_name=contact_data.display_name,
+            display_name_bucket=display_name_bucket(contact_data.display_name),
             organization=contact_data.organization,
             job_title=contact_data.job_title,
             deleted=contact_data.deleted,
@@ -58,18 +135,12 @@ class ContactRepository:
         )
 
         self.db.add(contact)
-        self.db.flush()  # Get contact ID
-
-        # Add phone numbers
-        for phone_data in contact_data.phone_numbers:
-            phone = PhoneNumber(
-                contact_id=contact.id,
-                value=phone_data.value,
-                display_value=phone_data.display_value,
-                type=phone_data.type,
-                primary=phone_data.primary,
-            )
-            self.db.add(phone)
+        if contact_data.phone_numbers:
+            # The phone INSERT bypasses the unit of work, so the contact row
+            # must be written first; otherwise it waits for the caller's flush
+            self.db.flush()
+            self._insert_phone_numbers(contact, contact_data)
+        self._resource_name_cache[contact_data.resource_name] = contact
 
         logger.debug("Created contact: %s (%s)", contact.display_name, contact.id)
         return contact
@@ -83,22 +154,30 @@ class ContactRepository:
         Returns:
             Contact or None if not found
         """
-        return self.db.query(Contact).filter(Contact.id == contact_id).first()
+        return self.db.scalars(_BY_ID, {"contact_id": contact_id}).first()
 
     def get_by_resource_name(self, resource_name: str) -> Optional[Contact]:
         """Get contact by Google resource name.
 
+        Repeat lookups within one transaction are answered from a cache on
+        the repository without querying the database.
+
         Args:
             resource_name: Google resource name (e.g., 'people/c12345')
 
         Returns:
             Contact or None if not found
         """
-        return (
-            self.db.query(Contact)
-            .filter(Contact.resource_name == resource_name)
-            .first()
-        )
+        cached = self._resource_name_cache.get(resource_name)
+        if cached is not None and cached in self.db:
+            return cached
+
+        contact = self.db.scalars(
+            _BY_RESOURCE_NAME, {"resource_name": resource_name}
+        ).first()
+        if contact is not None:
+            self._resource_name_cache[resource_name] = contact
+        return contact
 
     def upsert_contact(self, contact_data: ContactCreateSchema) -> Contact:
         """Insert or update contact.
@@ -112,13 +191,157 @@ class ContactRepository:
         Returns:
             Created or updated contact entity
         """
-        existing = self.get_by_resource_name(contact_data.resource_name)
-
-        if existing:
-            return self._update_contact(existing, contact_data)
-        else:
+        dialect_insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is None:
+            existing = self.get_by_resource_name(contact_data.resource_name)
+            if existing:
+                return self._update_contact(existing, contact_data)
             return self.create_contact(contact_data)
 
+        # One INSERT ... ON CONFLICT statement covers both the create and
+        # update paths; the original id survives an update
+        now = datetime.now(timezone.utc)
+        columns = self._contact_columns(contact_data)
+        stmt = dialect_insert(Contact).values(
+            id=uuid4(),
+            resource_name=contact_data.resource_name,
+            synced_at=now,
+            **columns,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Contact.resource_name],
+            set_={
+                **{name: stmt.excluded[name] for name in columns},
+                "synced_at": stmt.excluded.synced_at,
+                "updated_at": now,
+            },
+        )
+        contact: Contact = self.db.scalars(
+            stmt.returning(Contact),
+            execution_options={"populate_existing": True},
+        ).one()
+
+        self.db.execute(
+            delete(PhoneNumber).where(PhoneNumber.contact_id == contact.id),
+            execution_options={"synchronize_session": False},
+        )
+        self._insert_phone_numbers(contact, contact_data)
+        self._resource_name_cache[contact_data.resource_name] = contact
+
+        logger.debug("Upserted contact: %s (%s)", contact.display_name, contact.id)
+        return contact
+
+    def upsert_contacts(
+        self,
+        contacts: Sequence[ContactCreateSchema],
+        now: Optional[datetime] = None,
+    ) -> tuple[int, int]:
+        """Insert or update a batch of contacts with a fixed number of statements.
+
+        Existing contacts are found with one ``IN`` query, new contacts are
+        inserted and existing ones updated with one executemany each, and the
+        phone numbers of updated contacts are replaced with one DELETE and one
+        INSERT. If a resource name appears more than once, the last entry wins.
+
+        Args:
+            contacts: Contact data to insert or update
+            now: Sync timestamp to record; defaults to the current time
+
+        Returns:
+            Tuple of (created count, updated count)
+        """
+        by_resource_name = {
+            contact_data.resource_name: contact_data for contact_data in contacts
+        }
+        if not by_resource_name:
+            return 0, 0
+        now = now or datetime.now(timezone.utc)
+
+        existing_ids: dict[str, UUID] = {
+            row.resource_name: row.id
+            for row in self.db.execute(
+                select(Contact.resource_name, Contact.id).where(
+                    Contact.resource_name.in_(list(by_resource_name))
+                )
+            )
+        }
+
+        new_rows: list[dict[str, Any]] = []
+        updated_rows: list[dict[str, Any]] = []
+        phone_rows: list[dict[str, Any]] = []
+        for resource_name, contact_data in by_resource_name.items():
+            contact_id = existing_ids.get(resource_name)
+            row = {**self._contact_columns(contact_data), "synced_at": now}
+            if contact_id is None:
+                contact_id = uuid4()
+                # Timestamps are set here rather than left to column defaults
+                # so the whole batch shares the sync time, written in the same
+                # format keyset cursors bind
+                new_rows.append(
+                    {
+                        "id": contact_id,
+                        "resource_name": resource_name,
+                        "created_at": now,
+                        "updated_at": now,
+                        **row,
+                    }
+                )
+            else:
+                updated_rows.append({"id": contact_id, "updated_at": now, **row})
+            phone_rows.extend(
+                {
+                    "contact_id": contact_id,
+                    "value": phone_data.value,
+                    "display_value": phone_data.display_value,
+                    "type": phone_data.type,
+                    "primary": phone_data.primary,
+                }
+                for phone_data in contact_data.phone_numbers
+            )
+
+        if new_rows:
+            self.db.execute(insert(Contact), new_rows)
+        if updated_rows:
+            self.db.execute(update(Contact), updated_rows)
+            self.db.execute(
+                delete(PhoneNumber).where(
+                    PhoneNumber.contact_id.in_([row["id"] for row in updated_rows])
+                ),
+                execution_options={"synchronize_session": False},
+            )
+        self._insert_phone_rows(phone_rows)
+
+        # Bulk statements bypass the identity map; reload anything cached
+        self.db.expire_all()
+
+        logger.debug(
+            "Upserted contacts: %d created, %d updated",
+            len(new_rows),
+            len(updated_rows),
+        )
+        return len(new_rows), len(updated_rows)
+
+    @staticmethod
+    def _contact_columns(contact_data: ContactCreateSchema) -> dict[str, Any]:
+        """Map contact data onto the Contact columns a sync overwrites.
+
+        Args:
+            contact_data: Contact data from Google
+
+        Returns:
+            Column values keyed by column name
+        """
+        return {
+            "etag": contact_data.etag,
+            "given_name": contact_data.given_name,
+            "family_name": contact_data.family_name,
+            "display_name": contact_data.display_name,
+            "display_name_bucket": display_name_bucket(contact_data.display_name),
+            "organization": contact_data.organization,
+            "job_title": contact_data.job_title,
+            "deleted": contact_data.deleted,
+        }
+
     def _update_contact(
         self, existing: Contact, contact_data: ContactCreateSchema
     ) -> Contact:
@@ -131,36 +354,74 @@ class ContactRepository:
         Returns:
             Updated contact entity
         """
+        now = datetime.now(timezone.utc)
+
         # Update contact fields
         existing.etag = contact_data.etag  # type: ignore[assignment]
         existing.given_name = contact_data.given_name  # type: ignore[assignment]
         existing.family_name = contact_data.family_name  # type: ignore[assignment]
         existing.display_name = contact_data.display_name  # type: ignore[assignment]
+        existing.display_name_bucket = display_name_bucket(  # type: ignore[assignment]
+            contact_data.display_name
+        )
         existing.organization = contact_data.organization  # type: ignore[assignment]
         existing.job_title = contact_data.job_title  # type: ignore[assignment]
         existing.deleted = contact_data.deleted  # type: ignore[assignment]
-        existing.synced_at = datetime.now(timezone.utc)  # type: ignore[assignment]
-        existing.updated_at = datetime.now(timezone.utc)  # type: ignore[assignment]
+        existing.synced_at = now  # type: ignore[assignment]
+        existing.updated_at = now  # type: ignore[assignment]
 
-        # Delete old phone numbers
-        self.db.query(PhoneNumber).filter(
-            PhoneNumber.contact_id == existing.id
-        ).delete()
+        # Delete old phone numbers; the collection is reloaded afterwards, so
+        # the session needs no per-object bookkeeping
+        self.db.query(PhoneNumber).filter(PhoneNumber.contact_id == existing.id).delete(
+            synchronize_session=False
+        )
 
         # Add new phone numbers
-        for phone_data in contact_data.phone_numbers:
-            phone = PhoneNumber(
-                contact_id=existing.id,
-                value=phone_data.value,
-                display_value=phone_data.display_value,
-                type=phone_data.type,
-                primary=phone_data.primary,
-            )
-            self.db.add(phone)
+        self._insert_phone_numbers(existing, contact_data)
 
         logger.debug("Updated contact: %s (%s)", existing.display_name, existing.id)
         return existing
 
+    def _insert_phone_numbers(
+        self, contact: Contact, contact_data: ContactCreateSchema
+    ) -> None:
+        """Insert a contact's phone numbers with a single executemany INSERT.
+
+        The rows bypass the unit of work, so the contact's ``phone_numbers``
+        collection is expired and reloads the inserted rows on next access.
+
+        Args:
+            contact: Contact the phone numbers belong to (already flushed)
+            contact_data: Contact data holding the phone numbers
+        """
+        self._insert_phone_rows(
+            [
+                {
+                    "contact_id": contact.id,
+                    "value": phone_data.value,
+                    "display_value": phone_data.display_value,
+                    "type": phone_data.type,
+                    "primary": phone_data.primary,
+                }
+                for phone_data in contact_data.phone_numbers
+            ]
+        )
+        self.db.expire(contact, ["phone_numbers"])
+
+    def _insert_phone_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Insert phone number rows with one Core executemany.
+
+        The table-level INSERT runs on the session's connection, skipping the
+        ORM bulk-insert bookkeeping. Rows are bound per execution rather than
+        into one statement, so large batches stay within the database's
+        bound-parameter limit.
+
+        Args:
+            rows: Phone number column values keyed by column name
+        """
+        if rows:
+            self.db.connection().execute(insert(PhoneNumber.__table__), rows)
+
     def mark_as_deleted(self, resource_name: str) -> Optional[Contact]:
         """Mark a contact as deleted (soft delete).
 
@@ -172,13 +433,41 @@ class ContactRepository:
         """
         contact = self.get_by_resource_name(resource_name)
         if contact:
+            now = datetime.now(timezone.utc)
             contact.deleted = True  # type: ignore[assignment]
-            contact.synced_at = datetime.now(timezone.utc)  # type: ignore[assignment]
-            contact.updated_at = datetime.now(timezone.utc)  # type: ignore[assignment]
+            contact.synced_at = now  # type: ignore[assignment]
+            contact.updated_at = now  # type: ignore[assignment]
             logger.debug("Marked contact as deleted: %s", resource_name)
             return contact
         return None
 
+    def mark_many_as_deleted(
+        self, resource_names: Sequence[str], now: Optional[datetime] = None
+    ) -> int:
+        """Mark several contacts as deleted (soft delete) with one UPDATE.
+
+        Resource names with no local contact are ignored.
+
+        Args:
+            resource_names: Google resource names
+            now: Sync timestamp to record; defaults to the current time
+
+        Returns:
+            Number of contacts marked as deleted
+        """
+        if not resource_names:
+            return 0
+
+        now = now or datetime.now(timezone.utc)
+        result = self.db.execute(
+            update(Contact)
+            .where(Contact.resource_name.in_(list(resource_names)))
+            .values(deleted=True, synced_at=now, updated_at=now)
+        )
+        count: int = result.rowcount  # type: ignore[attr-defined]
+        logger.debug("Marked %d contacts as deleted", count)
+        return count
+
     def get_all_active(self) -> List[Contact]:
         """Get all non-deleted contacts.
 
@@ -186,7 +475,10 @@ class ContactRepository:
             List of active contacts
         """
         return (
-            self.db.query(Contact).filter(Contact.deleted == False).all()  # noqa: E712
+            self.db.query(Contact)
+            .options(*_phone_loader_options())
+            .filter(Contact.deleted.is_(False))
+            .all()
         )
 
     def get_all_active_with_phones(self) -> List[Contact]:
@@ -197,9 +489,8 @@ class ContactRepository:
         """
         return (
             self.db.query(Contact)
-            .join(Contact.phone_numbers)
-            .filter(Contact.deleted.is_(False))
-            .distinct()
+            .options(*_phone_loader_options())
+            .filter(Contact.deleted.is_(False), Contact.phone_numbers.any())
             .all()
         )
 
@@ -217,7 +508,7 @@ class ContactRepository:
         Returns:
             Total contact count
         """
-        return self.db.query(Contact).count()
+        return self.db.scalar(select(func.count(Contact.id))) or 0
 
     def count_active(self) -> int:
         """Count active (non-deleted) contacts.
@@ -226,32 +517,35 @@ class ContactRepository:
             Active contact count
         """
         return (
-            self.db.query(Contact)
-            .filter(Contact.deleted == False)  # noqa: E712
-            .count()
+            self.db.scalar(
+                select(func.count(Contact.id)).where(Contact.deleted.is_(False))
+            )
+            or 0
         )
 
     def delete_all(self) -> int:
         """Delete all contacts (hard delete).
 
-        Used for testing or resetting the database.
+        Used for testing or resetting the database. Contacts already loaded
+        in the session are not updated and should not be used afterwards.
 
         Returns:
             Number of contacts deleted
         """
-        # First delete all phone numbers
-        self.db.query(PhoneNumber).delete()
-        # Then delete all contacts
-        count = self.db.query(Contact).delete()
+        # First delete all phone numbers, then all contacts, without matching
+        # the deletes against objects loaded in the session
+        self.db.query(PhoneNumber).delete(synchronize_session=False)
+        count = self.db.query(Contact).delete(synchronize_session=False)
+        self._resource_name_cache.clear()
         logger.info("Deleted all contacts: %d", count)
         return count
 
     def search_by_phone(self, phone_number: str) -> List[Contact]:
         """Search contacts by phone number.
 
-        Normalizes the input phone number and searches against normalized
-        values in the database. Falls back to digit-only suffix matching
-        if normalization fails.
+        Matches stored values equal to the normalized input and, when the
+        input has at least seven digits, stored values ending in those digits.
+        Both conditions run in a single query.
 
         Args:
             phone_number: Phone number to search (any format)
@@ -261,61 +555,57 @@ class ContactRepository:
         """
         normalizer = get_phone_normalizer()
 
-        # Normalize search input
+        # Match the normalized value exactly, or the trailing digits for
+        # stored values whose format differs; both in one round trip
+        predicates = []
         normalized = normalizer.normalize_for_search(phone_number)
-
         if normalized:
-            # Search by normalized value (exact match)
-            return (
-                self.db.query(Contact)
-                .join(PhoneNumber)
-                .filter(
-                    Contact.deleted == False,  # noqa: E712
-                    PhoneNumber.value == normalized,
-                )
-                .distinct()
-                .all()
-            )
-        else:
-            # Fallback: search by digits only (suffix matching)
-            digits = re.sub(r"\D", "", phone_number)
-            if len(digits) >= 7:
-                # Use LIKE for suffix matching
-                pattern = f"%{digits}"
-                return (
-                    self.db.query(Contact)
-                    .join(PhoneNumber)
-                    .filter(
-                        Contact.deleted == False,  # noqa: E712
-                        PhoneNumber.value.like(pattern),
-                    )
-                    .distinct()
-                    .all()
-                )
+            predicates.append(PhoneNumber.value == normalized)
+        digits = re.sub(r"\D", "", phone_number)
+        if len(digits) >= 7:
+            predicates.append(PhoneNumber.value_endswith(digits))
+
+        if not predicates:
+            return []
 
-        return []
+        return (
+            self.db.query(Contact)
+            .options(*_phone_loader_options())
+            .join(PhoneNumber)
+            .filter(
+                Contact.deleted.is_(False),
+                or_(*predicates),
+            )
+            .distinct()
+            .all()
+        )
 
     def get_contacts(
-        self, limit: int = 30, offset: int = 0, sort_by_recent: bool = False
+        self,
+        limit: int = 30,
+        offset: int = 0,
+        sort_by_recent: bool = False,
+        after: Optional[tuple[Any, UUID]] = None,
     ) -> List[Contact]:
         """Get contacts with pagination and sorting.
 
         Args:
             limit: Maximum number of contacts to return
-            offset: Number of contacts to skip
+            offset: Number of contacts to skip (ignored when ``after`` is given)
             sort_by_recent: If True, sort by updated_at desc; otherwise by display_name
+            after: Keyset cursor, the sort key and id of the last contact on
+                the previous page
 
         Returns:
             List of active contacts
         """
-        query = self.db.query(Contact).filter(Contact.deleted == False)  # noqa: E712
-
-        if sort_by_recent:
-            query = query.order_by(Contact.updated_at.desc())
-        else:
-            query = query.order_by(Contact.display_name.asc())
+        query = (
+            self.db.query(Contact)
+            .options(*_phone_loader_options())
+            .filter(Contact.deleted.is_(False))
+        )
 
-        return query.offset(offset).limit(limit).all()
+        return self._paginate(query, limit, offset, sort_by_recent, after)
 
     def get_contacts_by_letter_group(
         self,
@@ -323,39 +613,125 @@ class ContactRepository:
         limit: int = 30,
         offset: int = 0,
         sort_by_recent: bool = False,
+        after: Optional[tuple[Any, UUID]] = None,
     ) -> List[Contact]:
         """Get contacts filtered by first letter of display name.
 
         Args:
             letter: First letter to filter by (A-Z) or '#' for non-alphabetic
             limit: Maximum number of contacts to return
-            offset: Number of contacts to skip
+            offset: Number of contacts to skip (ignored when ``after`` is given)
             sort_by_recent: If True, sort by updated_at desc; otherwise by display_name
+            after: Keyset cursor, the sort key and id of the last contact on
+                the previous page
 
         Returns:
             List of active contacts starting with the specified letter
         """
-        query = self.db.query(Contact).filter(Contact.deleted == False)  # noqa: E712
+        query = (
+            self.db.query(Contact)
+            .options(*_phone_loader_options())
+            .filter(
+                Contact.deleted.is_(False),
+                Contact.display_name_bucket == letter.upper(),
+            )
+        )
 
-        if letter == "#":
-            # Match contacts starting with non-alphabetic characters
-            # Cross-database compatible: check first character is not alphabetic
-            from sqlalchemy import func
+        return self._paginate(query, limit, offset, sort_by_recent, after)
 
-            first_char = func.substr(Contact.display_name, 1, 1)
-            query = query.filter(
-                ~first_char.between("A", "Z"), ~first_char.between("a", "z")
-            )
-        else:
-            # Match contacts starting with specific letter (case-insensitive)
-            query = query.filter(Contact.display_name.ilike(f"{letter}%"))
+    def get_contact_rows(
+        self,
+        letter: Optional[str] = None,
+        limit: int = 30,
+        offset: int = 0,
+        sort_by_recent: bool = False,
+        after: Optional[tuple[Any, UUID]] = None,
+    ) -> List[Row]:
+        """Get one page of active contacts as rows of the list columns.
+
+        Pages exactly like ``get_contacts`` and ``get_contacts_by_letter_group``
+        but returns plain rows instead of ``Contact`` instances. Fetch their
+        phone numbers with ``get_phone_number_rows``.
 
+        Args:
+            letter: First letter to filter by (A-Z) or '#', or None for all
+            limit: Maximum number of contacts to return
+            offset: Number of contacts to skip (ignored when ``after`` is given)
+            sort_by_recent: If True, sort by updated_at desc; otherwise by display_name
+            after: Keyset cursor, the sort key and id of the last contact on
+                the previous page
+
+        Returns:
+            Rows with id, display_name, given_name, family_name, created_at
+            and updated_at
+        """
+        query = self.db.query(*_LIST_COLUMNS).filter(Contact.deleted.is_(False))
+        if letter is not None:
+            query = query.filter(Contact.display_name_bucket == letter.upper())
+
+        return self._paginate(query, limit, offset, sort_by_recent, after)
+
+    def get_phone_number_rows(
+        self, contact_ids: Sequence[UUID]
+    ) -> dict[UUID, List[Row]]:
+        """Get the phone numbers of several contacts with one ``IN`` query.
+
+        Args:
+            contact_ids: IDs of the contacts whose phone numbers to load
+
+        Returns:
+            Phone number rows grouped by contact ID; every requested ID is
+            present, mapping to an empty list if the contact has no phones
+        """
+        phones: dict[UUID, List[Row]] = {contact_id: [] for contact_id in contact_ids}
+        if phones:
+            for row in self.db.execute(
+                select(*_LIST_PHONE_COLUMNS).where(
+                    PhoneNumber.contact_id.in_(list(phones))
+                )
+            ):
+                phones[row.contact_id].append(row)
+        return phones
+
+    @staticmethod
+    def _paginate(
+        query: Query,
+        limit: int,
+        offset: int,
+        sort_by_recent: bool,
+        after: Optional[tuple[Any, UUID]],
+    ) -> List[Any]:
+        """Order a contact query and return one page of it.
+
+        Contacts are ordered by the sort key with id as a tie-breaker, which
+        matches the composite indexes. With a keyset cursor the page starts
+        right after that contact via an index seek, instead of scanning and
+        discarding ``offset`` rows.
+
+        Args:
+            query: Filtered query over contacts or contact columns
+            limit: Maximum number of contacts to return
+            offset: Number of contacts to skip when no cursor is given
+            sort_by_recent: If True, sort by updated_at desc; otherwise by display_name
+            after: Sort key and id of the last contact on the previous page
+
+        Returns:
+            Contacts (or rows, for a column query) on the page
+        """
         if sort_by_recent:
-            query = query.order_by(Contact.updated_at.desc())
+            key = tuple_(Contact.updated_at, Contact.id)
+            query = query.order_by(Contact.updated_at.desc(), Contact.id.desc())
+            if after is not None:
+                query = query.filter(key < after)
         else:
-            query = query.order_by(Contact.display_name.asc())
+            key = tuple_(Contact.display_name, Contact.id)
+            query = query.order_by(Contact.display_name.asc(), Contact.id.asc())
+            if after is not None:
+                query = query.filter(key > after)
 
-        return query.offset(offset).limit(limit).all()
+        if after is None:
+            query = query.offset(offset)
+        return query.limit(limit).all()
 
     def count_contacts(self) -> int:
         """Count all active (non-deleted) contacts.
@@ -364,9 +740,10 @@ class ContactRepository:
             Number of active contacts
         """
         return (
-            self.db.query(Contact)
-            .filter(Contact.deleted == False)  # noqa: E712
-            .count()
+            self.db.scalar(
+                select(func.count(Contact.id)).where(Contact.deleted.is_(False))
+            )
+            or 0
         )
 
     def count_contacts_by_letter_group(self, letter: str) -> int:
@@ -378,22 +755,15 @@ class ContactRepository:
         Returns:
             Number of active contacts starting with the specified letter
         """
-        query = self.db.query(Contact).filter(Contact.deleted == False)  # noqa: E712
-
-        if letter == "#":
-            # Count contacts starting with non-alphabetic characters
-            # Cross-database compatible: check first character is not alphabetic
-            from sqlalchemy import func
-
-            first_char = func.substr(Contact.display_name, 1, 1)
-            query = query.filter(
-                ~first_char.between("A", "Z"), ~first_char.between("a", "z")
+        return (
+            self.db.scalar(
+                select(func.count(Contact.id)).where(
+                    Contact.deleted.is_(False),
+                    Contact.display_name_bucket == letter.upper(),
+                )
             )
-        else:
-            # Count contacts starting with specific letter (case-insensitive)
-            query = query.filter(Contact.display_name.ilike(f"{letter}%"))
-
-        return query.count()
+            or 0
+        )
 
     def get_contact_by_id(self, contact_id: str) -> Optional[Contact]:
         """Get contact by ID (string format).
@@ -408,7 +778,8 @@ class ContactRepository:
             uuid_id = UUID(contact_id)
             return (
                 self.db.query(Contact)
-                .filter(Contact.id == uuid_id, Contact.deleted == False)  # noqa: E712
+                .options(*_phone_loader_options())
+                .filter(Contact.id == uuid_id, Contact.deleted.is_(False))
                 .first()
             )
         except (ValueError, AttributeError):
@@ -425,29 +796,20 @@ class ContactRepository:
             - total_phone_numbers: Total phone number records
             - total_emails: Total email records
         """
-        total_contacts = self.count_contacts()
-
-        # Count contacts with phone numbers
-        contacts_with_phone = (
-            self.db.query(Contact.id)
-            .join(PhoneNumber)
-            .filter(Contact.deleted == False)  # noqa: E712
-            .distinct()
-            .count()
-        )
+        # One pass over active contacts outer-joined to their phone numbers
+        total_contacts, contacts_with_phone, total_phone_numbers = self.db.execute(
+            select(
+                func.count(distinct(Contact.id)),
+                func.count(distinct(PhoneNumber.contact_id)),
+                func.count(PhoneNumber.id),
+            )
+            .select_from(Contact)
+            .outerjoin(Contact.phone_numbers)
+            .where(Contact.deleted.is_(False))
+        ).one()
 
-        # Count contacts with emails (not implemented - email model doesn't exist)
+        # Email counts are not implemented - email model doesn't exist
         contacts_with_email = 0
-
-        # Count total phone numbers
-        total_phone_numbers = (
-            self.db.query(PhoneNumber)
-            .join(Contact)
-            .filter(Contact.deleted == False)  # noqa: E712
-            .count()
-        )
-
-        # Count total emails (not implemented - email model doesn't exist)
         total_emails = 0
 
         return {
@@ -5,10 +5,13 @@ including CRUD operations and query methods for tracking synchronization state.
 """
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
+from uuid import UUID
 
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
+from ..models import transaction_cache
 from ..models.sync_state import SyncState, SyncStatus
 from ..utils.logger import get_logger
 
@@ -31,15 +34,38 @@ class SyncRepository:
         """
         self.db = db
 
+    @property
+    def _latest(self) -> Optional[SyncState]:
+        """Most recent sync state seen or written in the current transaction.
+
+        Kept in the session's transaction cache, which is dropped on
+        commit/rollback so other sessions' writes are picked up.
+        """
+        latest: Optional[SyncState] = transaction_cache(self.db).get(
+            "latest_sync_state"
+        )
+        return latest
+
+    @_latest.setter
+    def _latest(self, sync_state: Optional[SyncState]) -> None:
+        transaction_cache(self.db)["latest_sync_state"] = sync_state
+
     def get_latest_sync_state(self) -> Optional[SyncState]:
         """Get the most recent sync state.
 
+        Repeated calls within one transaction reuse the state found (or
+        written) earlier instead of querying again.
+
         Returns:
             Latest sync state or None if no syncs have occurred
         """
-        return self.db.query(SyncState).order_by(SyncState.last_sync_at.desc()).first()
+        if self._latest is None:
+            self._latest = self.db.scalar(
+                select(SyncState).order_by(SyncState.last_sync_at.desc()).limit(1)
+            )
+        return self._latest
 
-    def get_sync_state_by_id(self, sync_id) -> Optional[SyncState]:
+    def get_sync_state_by_id(self, sync_id: Union[UUID, str]) -> Optional[SyncState]:
         """Get sync state by ID.
 
         Args:
@@ -48,15 +74,13 @@ class SyncRepository:
         Returns:
             SyncState or None if not found
         """
-        from uuid import UUID
-
         # Convert string to UUID if needed
         if isinstance(sync_id, str):
             try:
                 sync_id = UUID(sync_id)
             except ValueError:
                 return None
-        return self.db.query(SyncState).filter(SyncState.id == sync_id).first()
+        return self.db.get(SyncState, sync_id)
 
     def create_sync_state(
         self,
@@ -81,6 +105,7 @@ class SyncRepository:
             error_message=error_message,
         )
         self.db.add(sync_state)
+        self._latest = sync_state
         logger.debug("Created sync state with status: %s", status.value)
         return sync_state
 
@@ -112,6 +137,7 @@ class SyncRepository:
             sync_state.error_message = error_message  # type: ignore[assignment]
 
         sync_state.last_sync_at = datetime.now(timezone.utc)  # type: ignore[assignment]
+        self._latest = sync_state
         logger.debug(
             "Updated sync state: status=%s, has_token=%s",
             sync_state.sync_status.value,
@@ -119,16 +145,36 @@ class SyncRepository:
         )
         return sync_state
 
+    def get_latest_status(self) -> tuple[Optional[SyncStatus], Optional[str]]:
+        """Get the status and token of the most recent sync state.
+
+        Reads just those two columns, so callers that need both answer from
+        one query without loading a SyncState. A state already cached for the
+        current transaction is answered from memory.
+
+        Returns:
+            Tuple of (status, sync token), or (None, None) if no syncs have
+            occurred
+        """
+        if self._latest is not None:
+            return self._latest.sync_status, self._latest.sync_token  # type: ignore[return-value]
+        latest = self.db.execute(
+            select(SyncState.sync_status, SyncState.sync_token)
+            .order_by(SyncState.last_sync_at.desc())
+            .limit(1)
+        ).first()
+        if latest is None:
+            return None, None
+        return latest.sync_status, latest.sync_token
+
     def get_current_sync_token(self) -> Optional[str]:
         """Get the current sync token for incremental sync.
 
         Returns:
             Sync token or None if no successful sync has occurred
         """
-        latest = self.get_latest_sync_state()
-        if latest and latest.sync_status != SyncStatus.ERROR:
-            return latest.sync_token  # type: ignore[return-value]
-        return None
+        status, token = self.get_latest_status()
+        return token if status != SyncStatus.ERROR else None
 
     def has_completed_sync(self) -> bool:
         """Check if a successful sync has ever been completed.
@@ -136,8 +182,7 @@ class SyncRepository:
         Returns:
             True if at least one successful sync has completed
         """
-        latest = self.get_latest_sync_state()
-        return latest is not None and latest.sync_status == SyncStatus.IDLE  # type: ignore[return-value]
+        return self.get_latest_status()[0] == SyncStatus.IDLE
 
     def is_sync_in_progress(self) -> bool:
         """Check if a sync is currently in progress.
@@ -145,15 +190,21 @@ class SyncRepository:
         Returns:
             True if a sync is currently running
         """
-        latest = self.get_latest_sync_state()
-        return latest is not None and latest.sync_status == SyncStatus.SYNCING  # type: ignore[return-value]
+        return self.get_latest_status()[0] == SyncStatus.SYNCING
 
     def delete_all(self) -> int:
         """Delete all sync states (for testing).
 
+        Sync states already loaded in the session are not updated and should
+        not be used afterwards.
+
         Returns:
             Number of sync states deleted
         """
-        count = self.db.query(SyncState).delete()
+        result = self.db.execute(
+            delete(SyncState), execution_options={"synchronize_session": False}
+        )
+        count: int = result.rowcount  # type: ignore[attr-defined]
+        self._latest = None
         logger.info("Deleted all sync states: %d", count)
         return count
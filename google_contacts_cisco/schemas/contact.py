@@ -5,7 +5,8 @@ separate from the Google API-specific schemas.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, model_validator
@@ -17,6 +18,51 @@ from ..config import get_settings
 from ..utils.datetime_utils import format_timestamp_for_display
 from ..utils.phone_utils import get_phone_normalizer
 
+# The normalizer is stateless, so one instance serves every validation
+_PHONE_NORMALIZER = get_phone_normalizer()
+
+# Deletes every non-digit Latin-1 character; see _digits_only
+_NON_DIGITS_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(256) if not chr(i).isdigit())
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone(
+    value: str, display_value: Optional[str]
+) -> Tuple[Optional[str], str]:
+    """Normalize a phone number, memoized on the raw input.
+
+    Office lines and shared numbers recur across a sync, and parsing with
+    phonenumbers is the slowest step of validation.
+
+    Args:
+        value: Raw phone number string
+        display_value: Optional display format
+
+    Returns:
+        Tuple of (normalized_value, display_value) as from the normalizer
+    """
+    return _PHONE_NORMALIZER.normalize(value, display_value)
+
+
+def _digits_only(value: str) -> str:
+    """Return the characters of ``value`` for which ``str.isdigit`` is true.
+
+    ``str.translate`` strips Latin-1 non-digits in C; the per-character scan
+    only runs for the rare input that still has other characters left.
+
+    Args:
+        value: String to extract digits from
+
+    Returns:
+        The digits of ``value`` in their original order
+    """
+    digits = value.translate(_NON_DIGITS_TABLE)
+    if digits.isdigit():
+        return digits
+    return "".join(c for c in digits if c.isdigit())
+
 
 class PhoneNumberSchema(BaseModel):
     """Phone number schema for internal use.
@@ -54,17 +100,16 @@ class PhoneNumberSchema(BaseModel):
             if not value:
                 raise ValueError("Phone number cannot be empty")
 
-            normalizer = get_phone_normalizer()
-            normalized, formatted_display = normalizer.normalize(value, display_value)
+            normalized, formatted_display = _normalize_phone(value, display_value)
 
             if normalized is None:
                 # Fallback to simple digit extraction if normalization fails
                 # This handles edge cases where phonenumbers library can't parse
                 # Reuse _clean_input to strip prefixes and extensions
-                cleaned_value, _detected_prefix = normalizer._clean_input(value)
+                cleaned_value, _detected_prefix = _PHONE_NORMALIZER._clean_input(value)
 
                 # Extract digits; keep a single leading '+' if present
-                digits_only = "".join(c for c in cleaned_value if c.isdigit())
+                digits_only = _digits_only(cleaned_value)
                 if cleaned_value.strip().startswith("+") and digits_only:
                     normalized = f"+{digits_only}"
                 else:
@@ -198,27 +243,60 @@ class ContactResponse(BaseModel):
         email_addresses = []
         if hasattr(contact, "email_addresses"):
             email_addresses = [
-                EmailAddressResponse.model_validate(e) for e in contact.email_addresses
+                EmailAddressResponse(
+                    id=e.id, value=e.value, type=e.type, primary=e.primary
+                )
+                for e in contact.email_addresses
             ]
 
+        return cls.from_row(contact, contact.phone_numbers, email_addresses)
+
+    @classmethod
+    def from_row(
+        cls,
+        contact: Any,
+        phone_numbers: Iterable[Any],
+        email_addresses: Optional[List[EmailAddressResponse]] = None,
+    ) -> "ContactResponse":
+        """Create response from contact and phone number rows.
+
+        Accepts anything exposing the column attributes, such as the rows
+        from ``ContactRepository.get_contact_rows`` and
+        ``get_phone_number_rows``, so list pages need no ORM instances.
+
+        Args:
+            contact: Row or object with the contact's id, names and timestamps
+            phone_numbers: Rows or objects with the phone number columns
+            email_addresses: Email address responses, if any
+
+        Returns:
+            ContactResponse with timezone-aware timestamps
+        """
         settings = get_settings()
 
         return cls(
             id=str(contact.id),
-            display_name=contact.display_name,  # type: ignore[arg-type]
-            given_name=contact.given_name,  # type: ignore[arg-type]
-            family_name=contact.family_name,  # type: ignore[arg-type]
+            display_name=contact.display_name,
+            given_name=contact.given_name,
+            family_name=contact.family_name,
             phone_numbers=[
-                PhoneNumberResponse.model_validate(p) for p in contact.phone_numbers
+                PhoneNumberResponse(
+                    id=p.id,
+                    value=p.value,
+                    display_value=p.display_value,
+                    type=p.type,
+                    primary=p.primary,
+                )
+                for p in phone_numbers
             ],
-            email_addresses=email_addresses,
+            email_addresses=email_addresses or [],
             updated_at=(
-                format_timestamp_for_display(contact.updated_at, settings.timezone)  # type: ignore[arg-type]
+                format_timestamp_for_display(contact.updated_at, settings.timezone)
                 if contact.updated_at
                 else None
             ),
             created_at=(
-                format_timestamp_for_display(contact.created_at, settings.timezone)  # type: ignore[arg-type]
+                format_timestamp_for_display(contact.created_at, settings.timezone)
                 if contact.created_at
                 else None
             ),
@@ -229,7 +307,8 @@ class ContactListResponse(BaseModel):
     """Paginated contact list response."""
 
     contacts: List[ContactResponse]
-    total: int
+    total: Optional[int]  # None for keyset (cursor) pages
     offset: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
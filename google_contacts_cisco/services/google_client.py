@@ -8,12 +8,16 @@ It handles:
 - Retry logic with exponential backoff for rate limits and server errors
 """
 
+import queue
+import threading
 import time
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, Callable, Iterator, Optional, Union
 
+import orjson
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import Resource, build  # type: ignore[import-untyped]
 from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
+from googleapiclient.model import JsonModel  # type: ignore[import-untyped]
 
 from ..auth.oauth import get_credentials
 from ..utils.logger import get_logger
@@ -61,6 +65,33 @@ class SyncTokenExpiredError(GoogleClientError):
     pass
 
 
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson.
+
+    Connection pages run to tens of kilobytes each; orjson parses them
+    straight from the response bytes in about half the time of the
+    stdlib json parser googleapiclient uses by default.
+    """
+
+    def deserialize(self, content: Union[bytes, str]) -> Any:
+        """Parse a response body.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Parsed JSON body, or the body as-is if it is not JSON
+        """
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the base class handle non-JSON bodies the usual way
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
 class GoogleContactsClient:
     """Client for Google People API.
 
@@ -112,7 +143,9 @@ class GoogleContactsClient:
             Service is lazily initialized on first access.
         """
         if self._service is None:
-            self._service = build("people", "v1", credentials=self.credentials)
+            self._service = build(
+                "people", "v1", credentials=self.credentials, model=_OrjsonModel()
+            )
         return self._service
 
     def list_connections(
@@ -126,6 +159,12 @@ class GoogleContactsClient:
         handling pagination automatically. Follows Google's recommendation
         for sequential requests to avoid rate limits.
 
+        Pages are fetched one ahead on a background thread, so the next
+        request is in flight while the caller processes the current page.
+        Requests are still issued one at a time. Closing the generator early
+        waits for the request in flight, including any retry backoff, so the
+        API service is never used by two threads at once.
+
         Args:
             page_size: Number of contacts per page (max 1000, recommended 100-500)
             sync_token: Token for incremental sync (if available)
@@ -139,6 +178,60 @@ class GoogleContactsClient:
             ServerError: If server errors persist after max retries
             HttpError: For other API errors
         """
+        # Holds the page fetched ahead, an error, or None once pages run out
+        pages: "queue.Queue[Union[dict[str, Any], BaseException, None]]" = queue.Queue(
+            maxsize=1
+        )
+        stop = threading.Event()
+
+        def fetch_pages() -> None:
+            try:
+                for response in self._iter_connection_pages(page_size, sync_token):
+                    pages.put(response)
+                    if stop.is_set():
+                        return
+                pages.put(None)
+            except BaseException as e:
+                # Hand every error to the caller, which would otherwise wait
+                # on the queue forever
+                pages.put(e)
+
+        worker = threading.Thread(
+            target=fetch_pages, name="google-connections-prefetch", daemon=True
+        )
+        worker.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            # Free the single slot so a blocked put returns and sees stop
+            try:
+                pages.get_nowait()
+            except queue.Empty:
+                pass
+            # Wait for any in-flight request so the service is not shared
+            worker.join()
+
+    def _iter_connection_pages(
+        self,
+        page_size: int,
+        sync_token: Optional[str],
+    ) -> Iterator[dict[str, Any]]:
+        """Request connection pages sequentially.
+
+        Args:
+            page_size: Number of contacts per page
+            sync_token: Token for incremental sync (if available)
+
+        Yields:
+            Dictionary containing 'connections' list and 'nextSyncToken'
+        """
         page_token: Optional[str] = None
         request_count = 0
 
@@ -287,7 +380,6 @@ class GoogleContactsClient:
     def _make_request_with_retry(
         self,
         request_func: Callable[[], dict[str, Any]],
-        retry_count: int = 0,
     ) -> dict[str, Any]:
         """Make API request with retry logic.
 
@@ -296,7 +388,6 @@ class GoogleContactsClient:
 
         Args:
             request_func: Function that makes the API request
-            retry_count: Current retry attempt (internal use)
 
         Returns:
             API response dictionary
@@ -306,13 +397,22 @@ class GoogleContactsClient:
             ServerError: If server errors persist after max retries
             HttpError: For other API errors (no retry)
         """
-        try:
-            return request_func()
-        except HttpError as e:
-            status = e.resp.status
-
-            if status == 429:  # Rate limit
-                if retry_count < self.max_retries:
+        retry_count = 0
+        while True:
+            try:
+                return request_func()
+            except HttpError as e:
+                status = e.resp.status
+
+                if status == 429:  # Rate limit
+                    if retry_count >= self.max_retries:
+                        logger.exception(
+                            "Max retries exceeded for rate limit after %d attempts",
+                            self.max_retries,
+                        )
+                        raise RateLimitError(
+                            f"Rate limit exceeded after {self.max_retries} retries"
+                        ) from e
                     backoff = self.initial_backoff * (2**retry_count)
                     logger.warning(
                         "Rate limit hit, backing off for %.1f seconds (attempt %d/%d)",
@@ -320,19 +420,18 @@ class GoogleContactsClient:
                         retry_count + 1,
                         self.max_retries,
                     )
-                    time.sleep(backoff)
-                    return self._make_request_with_retry(request_func, retry_count + 1)
-                else:
-                    logger.exception(
-                        "Max retries exceeded for rate limit after %d attempts",
-                        self.max_retries,
-                    )
-                    raise RateLimitError(
-                        f"Rate limit exceeded after {self.max_retries} retries"
-                    ) from e
 
-            elif status >= 500:  # Server error
-                if retry_count < self.max_retries:
+                elif status >= 500:  # Server error
+                    if retry_count >= self.max_retries:
+                        logger.exception(
+                            "Max retries exceeded for server error after %d attempts",
+                            self.max_retries,
+                        )
+                        msg = (
+                            f"Server error {status} persisted "
+                            f"after {self.max_retries} retries"
+                        )
+                        raise ServerError(msg) from e
                     backoff = self.initial_backoff * (2**retry_count)
                     logger.warning(
                         "Server error %d, retrying in %.1f seconds (attempt %d/%d)",
@@ -341,27 +440,20 @@ class GoogleContactsClient:
                         retry_count + 1,
                         self.max_retries,
                     )
-                    time.sleep(backoff)
-                    return self._make_request_with_retry(request_func, retry_count + 1)
-                else:
-                    logger.exception(
-                        "Max retries exceeded for server error after %d attempts",
-                        self.max_retries,
-                    )
-                    msg = (
-                        f"Server error {status} persisted "
-                        f"after {self.max_retries} retries"
-                    )
-                    raise ServerError(msg) from e
 
-            elif status == 401:  # Unauthorized
-                logger.exception("Unauthorized - credentials may have expired")
-                raise
+                elif status == 401:  # Unauthorized
+                    logger.exception("Unauthorized - credentials may have expired")
+                    raise
+
+                else:
+                    # Other errors - don't retry
+                    logger.exception("API error %d", status)
+                    raise
 
-            else:
-                # Other errors - don't retry
-                logger.exception("API error %d", status)
-                raise
+            # Back off outside the except block so retries don't chain
+            # each failed attempt onto the next one's exception context
+            time.sleep(backoff)
+            retry_count += 1
 
 
 def get_google_client(
@@ -193,7 +193,7 @@ class SearchService:
         stmt = (
             select(Contact)
             .options(joinedload(Contact.phone_numbers))
-            .where(~Contact.deleted)
+            .where(Contact.deleted.is_(False))
             .where(all_conditions)
             .distinct()
             .order_by(Contact.display_name)
@@ -264,18 +264,12 @@ class SearchService:
             # Suffix match on last 7+ digits
             digits_only = "".join(c for c in normalized if c.isdigit())
             if len(digits_only) >= 7:
-                # Escape digits for LIKE pattern
-                escaped_digits = self._escape_like_pattern(digits_only[-7:])
-                conditions.append(
-                    PhoneNumber.value.like(f"%{escaped_digits}", escape="\\")
-                )
+                conditions.append(PhoneNumber.value_endswith(digits_only[-7:]))
 
         # Fallback: digit-only suffix match
         digits = "".join(c for c in phone_number if c.isdigit())
         if digits and len(digits) >= 7:
-            # Escape digits for LIKE pattern
-            escaped_digits = self._escape_like_pattern(digits[-7:])
-            conditions.append(PhoneNumber.value.like(f"%{escaped_digits}", escape="\\"))
+            conditions.append(PhoneNumber.value_endswith(digits[-7:]))
 
         if not conditions:
             logger.warning(
@@ -288,7 +282,7 @@ class SearchService:
             select(Contact)
             .join(Contact.phone_numbers)
             .options(joinedload(Contact.phone_numbers))
-            .where(~Contact.deleted)
+            .where(Contact.deleted.is_(False))
             .where(or_(*conditions))
             .distinct()
             .order_by(Contact.display_name)
@@ -339,14 +333,14 @@ class SearchService:
                 select(func.count(func.distinct(Contact.id)))
                 .select_from(Contact)
                 .outerjoin(Contact.phone_numbers)
-                .where(~Contact.deleted)
+                .where(Contact.deleted.is_(False))
                 .where(all_conditions)
             )
         else:
             stmt = (
                 select(func.count(func.distinct(Contact.id)))
                 .select_from(Contact)
-                .where(~Contact.deleted)
+                .where(Contact.deleted.is_(False))
                 .where(all_conditions)
             )
 
@@ -404,14 +398,10 @@ class SearchService:
             # Exact match on normalized value
             conditions.append(PhoneNumber.value == normalized)
 
-            # Suffix matching on digits - escape for LIKE pattern
+            # Suffix matching on digits through the indexed reversed value
             digits_only = "".join(c for c in normalized if c.isdigit())
             if len(digits_only) >= 7:
-                # Extract digits only, which are safe (no special chars)
-                # But still escape in case of future changes
-                escaped_digits = self._escape_like_pattern(digits_only[-7:])
-                suffix_pattern = f"%{escaped_digits}"
-                conditions.append(PhoneNumber.value.like(suffix_pattern, escape="\\"))
+                conditions.append(PhoneNumber.value_endswith(digits_only[-7:]))
 
         # Fallback: digit-only matching for partial numbers
         digits = "".join(c for c in search_term if c.isdigit())
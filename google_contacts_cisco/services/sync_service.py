@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from threading import Lock
 from typing import Any, Optional
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from ..api.schemas import GoogleConnectionsResponse, GooglePerson
@@ -19,6 +19,7 @@ from ..models.phone_number import PhoneNumber
 from ..models.sync_state import SyncState, SyncStatus
 from ..repositories.contact_repository import ContactRepository
 from ..repositories.sync_repository import SyncRepository
+from ..schemas.contact import ContactCreateSchema
 from ..services.contact_transformer import transform_google_person_to_contact
 from ..services.google_client import (
     GoogleContactsClient,
@@ -291,46 +292,25 @@ class SyncService:
         Args:
             connections: List of GooglePerson from the API response
             stats: Statistics object to update
-            batch_size: Number of contacts between commits
+            batch_size: Number of contacts upserted per transaction
         """
+        upserts: dict[str, ContactCreateSchema] = {}
+        deletions: set[str] = set()
         for person in connections:
             try:
                 # Transform Google contact to internal format
                 contact_data = transform_google_person_to_contact(person)
+                resource_name = contact_data.resource_name
 
-                # Check if contact exists
-                existing = self.contact_repo.get_by_resource_name(
-                    contact_data.resource_name
-                )
+                # Keep stream order when a page repeats a resource name
+                if resource_name in upserts or resource_name in deletions:
+                    self._store_changes(upserts, deletions, stats, batch_size)
 
-                # Handle deleted contacts
+                # Deleted contacts unknown locally are skipped by the UPDATE
                 if contact_data.deleted:
-                    if existing:
-                        self.contact_repo.mark_as_deleted(contact_data.resource_name)
-                        stats.deleted += 1
-                    # Skip creating deleted contacts that don't exist locally
-                    continue
-
-                # Upsert contact
-                self.contact_repo.upsert_contact(contact_data)
-
-                if existing:
-                    stats.updated += 1
+                    deletions.add(resource_name)
                 else:
-                    stats.created += 1
-
-                stats.total_fetched += 1
-
-                # Commit in batches for performance and memory management
-                if stats.total_fetched % batch_size == 0:
-                    self.db.commit()
-                    # Clear SQLAlchemy identity map to prevent memory buildup
-                    # This removes all objects from the session that aren't dirty
-                    self.db.expunge_all()
-                    logger.debug(
-                        "Committed batch: %d contacts processed (memory cleared)",
-                        stats.total_fetched,
-                    )
+                    upserts[resource_name] = contact_data
 
             except Exception as e:
                 logger.error(
@@ -341,10 +321,80 @@ class SyncService:
                 stats.errors += 1
                 continue
 
-        # Commit remaining contacts in page
-        self.db.commit()
-        # Clear identity map after final commit for the page
-        self.db.expunge_all()
+        self._store_changes(upserts, deletions, stats, batch_size)
+
+    def _store_changes(
+        self,
+        upserts: dict[str, ContactCreateSchema],
+        deletions: set[str],
+        stats: SyncStatistics,
+        batch_size: int,
+    ) -> None:
+        """Apply and then clear pending deletions and upserts.
+
+        No resource name is in both collections, so the two may be applied
+        in either order. Every row written shares one sync timestamp.
+
+        Args:
+            upserts: Transformed contacts to insert or update, by resource name
+            deletions: Resource names of contacts deleted in Google
+            stats: Statistics object to update
+            batch_size: Number of contacts upserted per transaction
+        """
+        now = datetime.now(timezone.utc)
+        if deletions:
+            try:
+                stats.deleted += self.contact_repo.mark_many_as_deleted(
+                    list(deletions), now=now
+                )
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logger.error(
+                    "Error marking %d contacts as deleted: %s", len(deletions), e
+                )
+                stats.errors += len(deletions)
+            deletions.clear()
+
+        self._store_contacts(list(upserts.values()), stats, batch_size, now)
+        upserts.clear()
+
+    def _store_contacts(
+        self,
+        contacts: list[ContactCreateSchema],
+        stats: SyncStatistics,
+        batch_size: int,
+        now: datetime,
+    ) -> None:
+        """Upsert contacts in batches, committing once per batch.
+
+        Args:
+            contacts: Transformed contacts to insert or update
+            stats: Statistics object to update
+            batch_size: Number of contacts upserted per transaction
+            now: Sync timestamp to record on the contacts
+        """
+        for start in range(0, len(contacts), batch_size):
+            batch = contacts[start : start + batch_size]
+            try:
+                created, updated = self.contact_repo.upsert_contacts(batch, now=now)
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logger.error("Error storing batch of %d contacts: %s", len(batch), e)
+                stats.errors += len(batch)
+                continue
+            finally:
+                # Clear SQLAlchemy identity map to prevent memory buildup
+                self.db.expunge_all()
+
+            stats.created += created
+            stats.updated += updated
+            stats.total_fetched += len(batch)
+            logger.debug(
+                "Committed batch: %d contacts processed (memory cleared)",
+                stats.total_fetched,
+            )
 
     def get_sync_status(self) -> dict:
         """Get current sync status.
@@ -665,7 +715,7 @@ class SyncService:
         deleted_count = total_count - contact_count
 
         # Get phone number count
-        phone_count = self.db.query(PhoneNumber).count()
+        phone_count = self.db.scalar(select(func.count(PhoneNumber.id))) or 0
 
         # Get latest sync
         latest_sync = self.sync_repo.get_latest_sync_state()
@@ -1,11 +1,17 @@
 """Utilities package."""
 
-from .logger import DEFAULT_LOG_FORMAT, configure_root_logger, get_logger
+from .logger import (
+    DEFAULT_LOG_FORMAT,
+    configure_queue_logging,
+    configure_root_logger,
+    get_logger,
+)
 from .phone_utils import PhoneNumberNormalizer, get_phone_normalizer
 
 __all__ = [
     "get_logger",
     "configure_root_logger",
+    "configure_queue_logging",
     "DEFAULT_LOG_FORMAT",
     "PhoneNumberNormalizer",
     "get_phone_normalizer",
@@ -4,9 +4,30 @@ This module provides utilities for converting UTC timestamps to configured
 timezones and formatting them for display.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
 from typing import Optional
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+@lru_cache(maxsize=32)
+def _resolve_timezone(name: str) -> Optional[tzinfo]:
+    """Resolve an IANA timezone name, remembering failures as well as hits.
+
+    ``ZoneInfo`` caches the zones it loads but not lookups that fail, so an
+    invalid configured timezone would otherwise search the disk for every
+    timestamp formatted.
+
+    Args:
+        name: IANA timezone name
+
+    Returns:
+        The timezone, or None if it cannot be loaded
+    """
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, OSError, ValueError, KeyError):
+        return None
 
 
 def format_timestamp_for_display(
@@ -40,16 +61,12 @@ def format_timestamp_for_display(
         dt = dt.replace(tzinfo=timezone.utc)
 
     # Convert to target timezone
-    try:
-        from zoneinfo import ZoneInfoNotFoundError
-
-        target_tz = ZoneInfo(target_timezone)
-        dt_local = dt.astimezone(target_tz)
-        return dt_local.isoformat()
-    except (ZoneInfoNotFoundError, OSError, ValueError, KeyError):
-        # If conversion fails (invalid timezone, missing tzdata, etc),
-        # return UTC timestamp
+    target_tz = _resolve_timezone(target_timezone)
+    if target_tz is None:
+        # If the timezone cannot be loaded (invalid name, missing tzdata,
+        # etc), return UTC timestamp
         return dt.isoformat()
+    return dt.astimezone(target_tz).isoformat()
 
 
 def get_current_time_utc() -> datetime:
@@ -3,8 +3,11 @@
 Provides consistent logging configuration across the application.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from ..config import settings
@@ -59,3 +62,42 @@ def configure_root_logger(
         format=format_string,
         handlers=[logging.StreamHandler(sys.stdout)],
     )
+
+
+def configure_queue_logging(
+    level: Optional[str] = None,
+    format_string: Optional[str] = None,
+) -> Optional[QueueListener]:
+    """Configure the root logger to format and emit records on a background thread.
+
+    The root logger only enqueues records; a ``QueueListener`` thread applies
+    the formatter and writes to stderr, so ``asctime`` formatting and stream
+    I/O stay off the event loop thread. Like ``logging.basicConfig``, this does
+    nothing if the root logger already has handlers.
+
+    Args:
+        level: Log level (defaults to settings.log_level)
+        format_string: Log format string (defaults to standard format)
+
+    Returns:
+        The started listener, or None if the root logger was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    level = level or settings.log_level
+    format_string = format_string or DEFAULT_LOG_FORMAT
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(format_string))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(getattr(logging, level.upper()))
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -26,7 +26,7 @@ pytestmark = pytest.mark.skip(reason="TestClient dependency injection needs fixi
 class TestOAuthFlowIntegration:
     """Integration tests for OAuth authentication flow."""
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     def test_oauth_authorize_endpoint(self, mock_flow_class, integration_client):
         """Test OAuth authorization endpoint."""
         # Set up mock flow
@@ -51,7 +51,7 @@ class TestOAuthFlowIntegration:
             data = response.json()
             assert "authorization_url" in data or "url" in data
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     @patch("builtins.open", new_callable=mock_open)
     def test_oauth_callback_success(
         self, mock_file, mock_flow_class, integration_client
@@ -85,7 +85,7 @@ class TestOAuthFlowIntegration:
             status.HTTP_302_FOUND,
         ]
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     def test_oauth_callback_missing_code(self, mock_flow_class, integration_client):
         """Test OAuth callback without authorization code."""
         response = integration_client.get("/auth/callback?state=state_123")
@@ -96,7 +96,7 @@ class TestOAuthFlowIntegration:
             status.HTTP_422_UNPROCESSABLE_ENTITY,
         ]
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     def test_oauth_callback_error(self, mock_flow_class, integration_client):
         """Test OAuth callback with error parameter."""
         response = integration_client.get(
@@ -216,7 +216,7 @@ class TestOAuthTokenManagement:
 class TestOAuthErrorHandling:
     """Integration tests for OAuth error handling."""
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     def test_oauth_invalid_state(self, mock_flow_class, integration_client):
         """Test OAuth callback with invalid state parameter."""
         mock_flow = Mock()
@@ -234,7 +234,7 @@ class TestOAuthErrorHandling:
             status.HTTP_500_INTERNAL_SERVER_ERROR,
         ]
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     def test_oauth_network_error(self, mock_flow_class, integration_client):
         """Test OAuth handling network errors."""
         mock_flow = Mock()
@@ -272,7 +272,7 @@ class TestOAuthErrorHandling:
 class TestOAuthSecurityIntegration:
     """Integration tests for OAuth security aspects."""
 
-    @patch("google_contacts_cisco.auth.oauth.Flow")
+    @patch("google_auth_oauthlib.flow.Flow")
     def test_oauth_state_parameter_validation(
         self, mock_flow_class, integration_client
     ):
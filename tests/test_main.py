@@ -1,10 +1,31 @@
 """Test main application."""
 
+import asyncio
+import gzip
+import inspect
+import os
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, ORJSONResponse
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
+from google_contacts_cisco import main
 from google_contacts_cisco._version import __version__
-from google_contacts_cisco.config import settings
-from google_contacts_cisco.main import STATIC_DIR, app
+from google_contacts_cisco.config import Settings, settings
+from google_contacts_cisco.main import (
+    STATIC_DIR,
+    accepted_encodings,
+    app,
+    build_index_responder,
+    build_static_file_table,
+    etag_matches,
+    stat_etag,
+)
+from google_contacts_cisco.models import get_db
 
 client = TestClient(app)
 
@@ -43,6 +64,96 @@ def test_health():
     assert "config_errors" in data
 
 
+def test_health_reuses_cached_result_within_ttl(monkeypatch):
+    """Test /health skips re-validation while the cached result is fresh."""
+    validate = Mock(return_value=(True, []))
+    monkeypatch.setattr(main, "validate_configuration", validate)
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    first = client.get("/health")
+    second = client.get("/health")
+
+    assert validate.call_count == 1
+    assert first.json() == second.json()
+
+
+def test_health_revalidates_after_ttl(monkeypatch):
+    """Test /health re-validates once the TTL has elapsed."""
+    validate = Mock(side_effect=[(True, []), (False, ["GOOGLE_CLIENT_ID is not set"])])
+    clock = Mock(side_effect=[100.0, 100.0 + main.HEALTH_CACHE_TTL_SECONDS + 1])
+    monkeypatch.setattr(main, "validate_configuration", validate)
+    monkeypatch.setattr(main, "_monotonic", clock)
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    assert client.get("/health").json()["config_valid"] is True
+    data = client.get("/health").json()
+
+    assert validate.call_count == 2
+    assert data["config_valid"] is False
+    assert data["config_errors"] == ["GOOGLE_CLIENT_ID is not set"]
+
+
+def test_health_reuses_body_when_result_unchanged(monkeypatch):
+    """Test an unchanged validation result keeps the rendered body."""
+    monkeypatch.setattr(main, "validate_configuration", Mock(return_value=(True, [])))
+    clock = Mock(side_effect=[100.0, 100.0 + main.HEALTH_CACHE_TTL_SECONDS + 1])
+    monkeypatch.setattr(main, "_monotonic", clock)
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    client.get("/health")
+    body = main._health_cache[2]
+    client.get("/health")
+
+    assert main._health_cache[0] == 100.0 + main.HEALTH_CACHE_TTL_SECONDS + 1
+    assert main._health_cache[2] is body
+
+
+def test_health_returns_new_response_per_request(monkeypatch):
+    """Test cached health results are not shared as one Response object."""
+    monkeypatch.setattr(main, "validate_configuration", Mock(return_value=(True, [])))
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    first = asyncio.run(main.health())
+    second = asyncio.run(main.health())
+
+    assert first is not second
+    assert first.body == second.body
+
+
+def test_model_routes_keep_default_json_response():
+    """Test response_model routes keep FastAPI's native Pydantic serialization."""
+    assert app.router.default_response_class is not ORJSONResponse
+
+
+def test_health_renders_with_orjson(monkeypatch):
+    """Test /health, which has no response model, is rendered with orjson."""
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    response = client.get("/health")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == main._health_cache[2]
+    assert orjson.loads(main._health_cache[2]) == response.json()
+
+
+def test_database_routes_run_in_threadpool():
+    """Test routes using the sync DB session are plain functions.
+
+    FastAPI runs ``def`` endpoints in its threadpool; an ``async def``
+    endpoint doing blocking SQLAlchemy calls would stall the event loop.
+    """
+    db_routes = [
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and any(dep.call is get_db for dep in route.dependant.dependencies)
+    ]
+
+    assert db_routes
+    for route in db_routes:
+        assert not inspect.iscoroutinefunction(route.endpoint), route.path
+
+
 def test_health_version_matches():
     """Test that health endpoint returns the correct version from _version.py."""
     response = client.get("/health")
@@ -60,3 +171,373 @@ def test_version():
     assert __version__ is not None
     assert isinstance(__version__, str)
     assert len(__version__.split(".")) == 3  # Major.Minor.Patch
+
+
+def test_build_static_file_table_indexes_nested_files(tmp_path):
+    """Test static file table maps URL paths to files in the build tree."""
+    (tmp_path / "index.html").write_text("<html></html>")
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "logo.svg").write_text("<svg/>")
+
+    table = build_static_file_table(tmp_path.resolve())
+
+    assert table == {
+        "index.html": tmp_path.resolve() / "index.html",
+        "img/logo.svg": tmp_path.resolve() / "img" / "logo.svg",
+    }
+
+
+def test_build_static_file_table_skips_excluded_entries(tmp_path):
+    """Test excluded top-level directories and files are not indexed."""
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "app.js").write_text("")
+    (tmp_path / "favicon.ico").write_text("")
+    (tmp_path / "index.html").write_text("")
+
+    table = build_static_file_table(
+        tmp_path.resolve(), exclude=("assets", "index.html")
+    )
+
+    assert list(table) == ["favicon.ico"]
+
+
+def test_build_static_file_table_is_read_only(tmp_path):
+    """Test the table cannot be modified after startup."""
+    (tmp_path / "favicon.ico").write_text("")
+
+    table = build_static_file_table(tmp_path.resolve())
+
+    with pytest.raises(TypeError):
+        table["secret.txt"] = tmp_path / "secret.txt"  # type: ignore[index]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Symlinks require privileges on Windows")
+def test_build_static_file_table_skips_links_outside_root(tmp_path):
+    """Test symlinks resolving outside the static root are not indexed."""
+    root = tmp_path / "dist"
+    root.mkdir()
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret")
+    (root / "leak.txt").symlink_to(secret)
+
+    assert build_static_file_table(root.resolve()) == {}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Symlinks require privileges on Windows")
+def test_build_static_file_table_skips_links_inside_root(tmp_path):
+    """Test symlinks are skipped even when they point inside the root."""
+    root = tmp_path / "dist"
+    root.mkdir()
+    (root / "app.js").write_text("")
+    (root / "alias.js").symlink_to(root / "app.js")
+
+    assert list(build_static_file_table(root.resolve())) == ["app.js"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Symlinks require privileges on Windows")
+def test_build_static_file_table_does_not_follow_directory_links(tmp_path):
+    """Test a directory link looping back to the root does not recurse."""
+    root = tmp_path / "dist"
+    root.mkdir()
+    (root / "index.html").write_text("<html></html>")
+    (root / "loop").symlink_to(root, target_is_directory=True)
+
+    assert list(build_static_file_table(root.resolve())) == ["index.html"]
+
+
+def _request(headers=None):
+    """Build a bare GET request with the given headers."""
+    raw_headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+def test_index_responder_returns_body_with_etag(tmp_path):
+    """Test index.html is served with an ETag and no-cache."""
+    index = tmp_path / "index.html"
+    index.write_text("<html>app</html>")
+
+    response = build_index_responder(index)(_request())
+
+    assert response.status_code == 200
+    assert response.body == b"<html>app</html>"
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_index_responder_returns_304_for_matching_etag(tmp_path):
+    """Test a matching If-None-Match yields 304 Not Modified."""
+    index = tmp_path / "index.html"
+    index.write_text("<html>app</html>")
+    index_response = build_index_responder(index)
+    etag = index_response(_request()).headers["etag"]
+
+    response = index_response(_request({"If-None-Match": f'"other", {etag}'}))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+def test_index_responder_returns_304_for_wildcard(tmp_path):
+    """Test If-None-Match: * matches the index."""
+    index = tmp_path / "index.html"
+    index.write_text("<html>app</html>")
+
+    response = build_index_responder(index)(_request({"If-None-Match": "*"}))
+
+    assert response.status_code == 304
+
+
+def test_index_responder_matches_weak_etag(tmp_path):
+    """Test a proxy-weakened W/ ETag still matches (weak comparison)."""
+    index = tmp_path / "index.html"
+    index.write_text("<html>app</html>")
+    index_response = build_index_responder(index)
+    etag = index_response(_request()).headers["etag"]
+
+    response = index_response(_request({"If-None-Match": f"W/{etag}"}))
+
+    assert response.status_code == 304
+
+
+def test_index_responder_ignores_stale_etag(tmp_path):
+    """Test a non-matching If-None-Match gets the full body."""
+    index = tmp_path / "index.html"
+    index.write_text("<html>app</html>")
+
+    response = build_index_responder(index)(_request({"If-None-Match": '"stale"'}))
+
+    assert response.status_code == 200
+    assert response.body == b"<html>app</html>"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        (' "x" , W/"abc" ', True),
+        ("*", True),
+        ('"abcd"', False),
+        ('"ab"', False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(header, expected):
+    """Test If-None-Match matching ignores W/ prefixes on either side."""
+    assert etag_matches(header, '"abc"') is expected
+    assert etag_matches(header, 'W/"abc"') is expected
+
+
+@pytest.fixture
+def spa_client(tmp_path):
+    """Client for an app serving a small built frontend from tmp_path."""
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "index.html").write_text("<html>app</html>")
+    (dist / "vite.svg").write_text("<svg/>")
+    (dist / "assets" / "app.js").write_text("console.log(1)")
+    spa_app = FastAPI()
+    main._configure_spa(spa_app, dist.resolve())
+    return TestClient(spa_app)
+
+
+def test_spa_serves_index_for_client_routes(spa_client):
+    """Test unknown non-API paths fall back to index.html."""
+    for path in ("/", "/contacts/123", "/index.html"):
+        response = spa_client.get(path)
+        assert response.status_code == 200
+        assert response.text == "<html>app</html>"
+
+    assert (
+        spa_client.get("/").headers["etag"]
+        == spa_client.get("/index.html").headers["etag"]
+    )
+
+
+def test_spa_serves_static_files_and_assets(spa_client):
+    """Test indexed top-level files and the /assets mount are served."""
+    assert spa_client.get("/vite.svg").text == "<svg/>"
+    assert spa_client.get("/assets/app.js").text == "console.log(1)"
+
+
+def test_spa_static_files_support_conditional_get(spa_client):
+    """Test indexed files answer a matching If-None-Match with 304."""
+    first = spa_client.get("/vite.svg")
+    etag = first.headers["etag"]
+
+    cached = spa_client.get("/vite.svg", headers={"If-None-Match": etag})
+    stale = spa_client.get("/vite.svg", headers={"If-None-Match": '"stale"'})
+
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert stale.status_code == 200
+    assert stale.text == "<svg/>"
+
+
+def test_spa_assets_support_conditional_get(spa_client):
+    """Test the /assets mount answers a matching If-None-Match with 304."""
+    etag = spa_client.get("/assets/app.js").headers["etag"]
+
+    response = spa_client.get("/assets/app.js", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_stat_etag_matches_file_response(tmp_path):
+    """Test the precomputed ETag is the one FileResponse sends."""
+    path = tmp_path / "app.js"
+    path.write_text("console.log(1)")
+    stat_result = path.stat()
+
+    response = FileResponse(path, stat_result=stat_result)
+
+    assert stat_etag(stat_result) == response.headers["etag"]
+
+
+@pytest.fixture
+def precompressed_client(tmp_path):
+    """Client for an app whose /assets contain Brotli and gzip siblings."""
+    dist = tmp_path / "dist"
+    assets = dist / "assets"
+    assets.mkdir(parents=True)
+    (dist / "index.html").write_text("<html>app</html>")
+    source = b"console.log('app');" * 100
+    (assets / "app.js").write_bytes(source)
+    (assets / "app.js.br").write_bytes(b"brotli-bytes")
+    (assets / "app.js.gz").write_bytes(gzip.compress(source))
+    (assets / "plain.css").write_text("body{}")
+    spa_app = FastAPI()
+    main._configure_spa(spa_app, dist.resolve())
+    return TestClient(spa_app)
+
+
+def test_assets_prefer_brotli_when_accepted(precompressed_client):
+    """Test a Brotli-accepting client gets the .br file with its encoding."""
+    response = precompressed_client.get(
+        "/assets/app.js", headers={"Accept-Encoding": "gzip, br"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-length"] == str(len(b"brotli-bytes"))
+
+
+def test_assets_fall_back_to_gzip(precompressed_client):
+    """Test gzip is used when Brotli is refused or not offered."""
+    for accept in ("gzip", "gzip, br;q=0"):
+        response = precompressed_client.get(
+            "/assets/app.js", headers={"Accept-Encoding": accept}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "console.log('app');" * 100
+
+
+def test_assets_serve_raw_without_accepted_encoding(precompressed_client):
+    """Test clients without a matching coding get the original bytes."""
+    response = precompressed_client.get(
+        "/assets/app.js", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == b"console.log('app');" * 100
+
+
+def test_assets_range_request_serves_original_bytes(precompressed_client):
+    """Test a Range request gets a slice of the uncompressed file."""
+    response = precompressed_client.get(
+        "/assets/app.js",
+        headers={"Accept-Encoding": "gzip, br", "Range": "bytes=0-10"},
+    )
+
+    assert response.status_code == 206
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.content == b"console.log"
+
+
+def test_assets_without_variants_are_unchanged(precompressed_client):
+    """Test files with no precompressed siblings are served as before."""
+    response = precompressed_client.get(
+        "/assets/plain.css", headers={"Accept-Encoding": "gzip, br"}
+    )
+
+    assert response.text == "body{}"
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", {"gzip", "deflate", "br"}),
+        ("br;q=0, gzip;q=0.5", {"gzip"}),
+        ("GZIP;q=0.000", set()),
+        ("", set()),
+    ],
+)
+def test_accepted_encodings(header, expected):
+    """Test Accept-Encoding parsing drops codings refused with q=0."""
+    assert accepted_encodings(header) == expected
+
+
+def test_spa_returns_404_for_backend_paths(spa_client):
+    """Test unknown backend paths are not answered with the SPA."""
+    assert spa_client.get("/api/unknown").status_code == 404
+    assert spa_client.get("/healthz").status_code == 404
+
+
+def test_api_only_root_returns_app_info():
+    """Test the JSON root endpoint registered when no frontend is built."""
+    api_app = FastAPI()
+    main._configure_api_only(api_app)
+
+    data = TestClient(api_app).get("/").json()
+
+    assert data["version"] == __version__
+    assert data["docs"] == "/docs"
+
+
+def test_select_server_implementations_prefers_uvloop_and_httptools():
+    """Test uvloop and httptools are selected when importable."""
+    with patch.object(main.importlib, "import_module", return_value=Mock()):
+        assert main.select_server_implementations() == ("uvloop", "httptools")
+
+
+def test_select_server_implementations_requires_uvloop_in_production(
+    monkeypatch,
+):
+    """Test a missing uvloop is fatal outside debug mode."""
+    monkeypatch.setattr(main, "settings", Settings(debug=False))
+
+    with patch.object(main.importlib, "import_module", side_effect=ImportError):
+        with pytest.raises(RuntimeError, match="uvloop"):
+            main.select_server_implementations()
+
+
+def test_select_server_implementations_falls_back_in_debug(monkeypatch):
+    """Test debug mode falls back to asyncio and h11 when extras are missing."""
+    monkeypatch.setattr(main, "settings", Settings(debug=True))
+
+    with patch.object(main.importlib, "import_module", side_effect=ImportError):
+        assert main.select_server_implementations() == ("asyncio", "h11")
+
+
+def test_lifespan_starts_and_stops_scheduler_when_enabled(monkeypatch):
+    """Test the scheduler is only started and stopped when it is enabled."""
+    monkeypatch.setattr(main.settings, "sync_scheduler_enabled", True)
+
+    with (
+        patch("google_contacts_cisco.services.scheduler.start_sync_scheduler") as start,
+        patch("google_contacts_cisco.services.scheduler.stop_sync_scheduler") as stop,
+    ):
+        with TestClient(app):
+            start.assert_called_once_with(main.settings.sync_interval_minutes)
+        stop.assert_called_once()
@@ -10,11 +10,18 @@ from unittest.mock import Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from google_contacts_cisco.api.contacts import decode_cursor, encode_cursor
+from google_contacts_cisco.config import settings
 from google_contacts_cisco.main import app
-from google_contacts_cisco.models import get_db
+from google_contacts_cisco.models import Base, get_db
 from google_contacts_cisco.models.contact import Contact
 from google_contacts_cisco.models.phone_number import PhoneNumber
+from google_contacts_cisco.repositories.contact_repository import ContactRepository
+from google_contacts_cisco.schemas.contact import ContactCreateSchema
 
 
 @pytest.fixture
@@ -400,12 +407,21 @@ class TestListContacts:
     These tests verify the endpoint still works after the route was moved.
     """
 
+    @staticmethod
+    def _mock_repo(contacts):
+        """Create a repository mock serving contacts and their phone numbers."""
+        mock_repo = Mock()
+        mock_repo.get_contact_rows.return_value = contacts
+        mock_repo.get_phone_number_rows.side_effect = lambda ids: {
+            c.id: c.phone_numbers for c in contacts if c.id in ids
+        }
+        return mock_repo
+
     @patch("google_contacts_cisco.api.contacts.ContactRepository")
     def test_list_contacts_success(self, mock_repo_class, client, sample_contacts):
         """Should list all contacts with pagination."""
         # Setup mocks
-        mock_repo = Mock()
-        mock_repo.get_contacts.return_value = sample_contacts
+        mock_repo = self._mock_repo(sample_contacts)
         mock_repo.count_contacts.return_value = 2
         mock_repo_class.return_value = mock_repo
 
@@ -426,8 +442,7 @@ class TestListContacts:
     ):
         """Should handle pagination parameters."""
         # Setup mocks
-        mock_repo = Mock()
-        mock_repo.get_contacts.return_value = [sample_contacts[0]]
+        mock_repo = self._mock_repo([sample_contacts[0]])
         mock_repo.count_contacts.return_value = 10
         mock_repo_class.return_value = mock_repo
 
@@ -440,18 +455,89 @@ class TestListContacts:
         assert data["limit"] == 1
         assert data["offset"] == 5
         assert data["has_more"] is True  # 5 + 1 < 10
-        mock_repo.get_contacts.assert_called_once_with(
+        mock_repo.get_contact_rows.assert_called_once_with(
+            None,
             limit=1,
             offset=5,
             sort_by_recent=False,
         )
 
+    @patch("google_contacts_cisco.api.contacts.ContactRepository")
+    def test_list_contacts_returns_next_cursor(
+        self, mock_repo_class, client, sample_contacts
+    ):
+        """Should return a cursor for the next page when more contacts exist."""
+        mock_repo = self._mock_repo([sample_contacts[0]])
+        mock_repo.count_contacts.return_value = 10
+        mock_repo_class.return_value = mock_repo
+
+        response = client.get("/api/contacts?limit=1")
+
+        data = response.json()
+        assert data["has_more"] is True
+        assert decode_cursor(data["next_cursor"], sort_by_recent=False) == (
+            sample_contacts[0].display_name,
+            sample_contacts[0].id,
+        )
+
+    @patch("google_contacts_cisco.api.contacts.ContactRepository")
+    def test_list_contacts_with_cursor(self, mock_repo_class, client, sample_contacts):
+        """Should page by keyset without counting when given a cursor."""
+        mock_repo = self._mock_repo(sample_contacts)
+        mock_repo_class.return_value = mock_repo
+        cursor = encode_cursor(sample_contacts[0], sort_by_recent=True)
+
+        response = client.get(f"/api/contacts?limit=1&sort=recent&cursor={cursor}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_more"] is True
+        assert [c["id"] for c in data["contacts"]] == [str(sample_contacts[0].id)]
+        mock_repo.get_contact_rows.assert_called_once_with(
+            None,
+            limit=2,
+            sort_by_recent=True,
+            after=(sample_contacts[0].updated_at, sample_contacts[0].id),
+        )
+        mock_repo.count_contacts.assert_not_called()
+
+    @patch("google_contacts_cisco.api.contacts.ContactRepository")
+    def test_list_contacts_last_cursor_page(
+        self, mock_repo_class, client, sample_contacts
+    ):
+        """Should report no further pages when the cursor page is short."""
+        mock_repo = self._mock_repo([sample_contacts[1]])
+        mock_repo_class.return_value = mock_repo
+        cursor = encode_cursor(sample_contacts[0], sort_by_recent=False)
+
+        response = client.get(f"/api/contacts?group=j&cursor={cursor}")
+
+        data = response.json()
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+        mock_repo.get_contact_rows.assert_called_once_with(
+            "J",
+            limit=31,
+            sort_by_recent=False,
+            after=(sample_contacts[0].display_name, sample_contacts[0].id),
+        )
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "WzFd", "WyJhIiwgIngiXQ=="])
+    @patch("google_contacts_cisco.api.contacts.ContactRepository")
+    def test_list_contacts_invalid_cursor(self, mock_repo_class, client, cursor):
+        """Should reject malformed cursors with 400."""
+        response = client.get(f"/api/contacts?cursor={cursor}")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid pagination cursor"
+        mock_repo_class.return_value.get_contact_rows.assert_not_called()
+
     @patch("google_contacts_cisco.api.contacts.ContactRepository")
     def test_list_contacts_empty_result(self, mock_repo_class, client):
         """Should handle empty contact list."""
         # Setup mocks
-        mock_repo = Mock()
-        mock_repo.get_contacts.return_value = []
+        mock_repo = self._mock_repo([])
         mock_repo.count_contacts.return_value = 0
         mock_repo_class.return_value = mock_repo
 
@@ -480,9 +566,124 @@ class TestListContacts:
         assert response.status_code == 422
 
 
+class TestListContactsQueries:
+    """Tests for the SQL issued by the contact list endpoint."""
+
+    @pytest.fixture
+    def db_client(self, monkeypatch):
+        """Create a test client backed by a real database, recording SQL."""
+        monkeypatch.setattr(settings, "database_strict_loads", True)
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(autoflush=False, bind=engine)
+        with session_factory() as session:
+            for i in range(5):
+                contact = Contact(resource_name=f"people/c{i}", display_name=f"C{i}")
+                contact.phone_numbers = [
+                    PhoneNumber(value=f"+1202555{i:04d}", display_value="x"),
+                    PhoneNumber(value=f"+1303555{i:04d}", display_value="y"),
+                ]
+                session.add(contact)
+            session.commit()
+
+        statements: list[str] = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, sql, *args: statements.append(sql),
+        )
+
+        def override_get_db():
+            with session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_db] = override_get_db
+        with TestClient(app) as test_client:
+            yield test_client, statements
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+    def test_list_contacts_query_count_is_constant(self, db_client):
+        """Should load a page and its phone numbers without N+1 queries."""
+        client, statements = db_client
+
+        response = client.get("/api/contacts?limit=5")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["contacts"]) == 5
+        assert all(len(c["phone_numbers"]) == 2 for c in data["contacts"])
+        # Contacts page, phone numbers for the page, total count
+        assert len(statements) == 3
+
+
+class TestListContactsCursorPaging:
+    """Tests for following next_cursor through the contact list."""
+
+    @pytest.fixture
+    def db_client(self):
+        """Create a test client over contacts stored by a sync batch."""
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(autoflush=False, bind=engine)
+        with session_factory() as session:
+            ContactRepository(session).upsert_contacts(
+                [
+                    ContactCreateSchema(
+                        resource_name=f"people/n{i}", display_name=f"N{i}"
+                    )
+                    for i in range(6)
+                ]
+            )
+            session.commit()
+
+        def override_get_db():
+            with session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_db] = override_get_db
+        with TestClient(app) as test_client:
+            yield test_client
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+    @pytest.mark.parametrize("sort", ["recent", "name"])
+    def test_cursor_pages_reach_the_end(self, db_client, sort):
+        """Should visit every contact once and end with a null next_cursor."""
+        seen: list[str] = []
+        url = f"/api/contacts?limit=2&sort={sort}"
+        for _ in range(10):
+            data = db_client.get(url).json()
+            seen.extend(c["id"] for c in data["contacts"])
+            if data["next_cursor"] is None:
+                break
+            url = f"/api/contacts?limit=2&sort={sort}&cursor={data['next_cursor']}"
+        else:
+            pytest.fail(f"next_cursor never ran out; saw {seen}")
+
+        assert len(seen) == 6
+        assert len(set(seen)) == 6
+
+
 class TestResponseModels:
     """Tests for response model serialization."""
 
+    def test_phone_number_schema_is_shared(self, client):
+        """Should publish a single phone number schema for all contact routes."""
+        schemas = client.get("/openapi.json").json()["components"]["schemas"]
+
+        assert [name for name in schemas if "PhoneNumberResponse" in name] == [
+            "PhoneNumberResponse"
+        ]
+
     @patch("google_contacts_cisco.api.search_routes.get_search_service")
     def test_contact_response_format(self, mock_get_service, client, sample_contact):
         """Should format contact response correctly."""
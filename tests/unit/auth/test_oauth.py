@@ -40,6 +40,16 @@ from google_contacts_cisco.auth.oauth import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_oauth_caches():
+    """Clear settings-derived caches so each test sees its patched settings."""
+    get_scopes.cache_clear()
+    oauth._clear_credentials_cache()
+    yield
+    get_scopes.cache_clear()
+    oauth._clear_credentials_cache()
+
+
 class TestExceptions:
     """Test custom OAuth exceptions."""
 
@@ -71,7 +81,7 @@ class TestExceptions:
 class TestGetScopes:
     """Test get_scopes function."""
 
-    def test_get_scopes_returns_list(self, monkeypatch):
+    def test_get_scopes_returns_tuple(self, monkeypatch):
         """get_scopes should return the configured scopes."""
         mock_settings = Mock()
         mock_settings.google_oauth_scopes = [
@@ -81,7 +91,7 @@ class TestGetScopes:
 
         scopes = get_scopes()
 
-        assert isinstance(scopes, list)
+        assert isinstance(scopes, tuple)
         assert "https://www.googleapis.com/auth/contacts.readonly" in scopes
 
     def test_get_scopes_returns_settings_value(self, monkeypatch):
@@ -92,7 +102,20 @@ class TestGetScopes:
 
         scopes = get_scopes()
 
-        assert scopes == ["scope1", "scope2"]
+        assert scopes == ("scope1", "scope2")
+
+    def test_get_scopes_is_cached(self, monkeypatch):
+        """get_scopes should return the same object until the cache is cleared."""
+        mock_settings = Mock()
+        mock_settings.google_oauth_scopes = ["scope1"]
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+
+        first = get_scopes()
+        mock_settings.google_oauth_scopes = ["scope2"]
+
+        assert get_scopes() is first
+        get_scopes.cache_clear()
+        assert get_scopes() == ("scope2",)
 
 
 class TestGetTokenPath:
@@ -173,6 +196,21 @@ class TestGetOAuthClient:
         with pytest.raises(CredentialsNotConfiguredError):
             get_oauth_client()
 
+    def test_get_oauth_client_returns_fresh_flow_with_cached_config(self, monkeypatch):
+        """Should reuse the client config but never share Flow instances."""
+        mock_settings = Mock()
+        mock_settings.google_client_id = "cached_client_id"
+        mock_settings.google_client_secret = "cached_client_secret"
+        mock_settings.google_redirect_uri = "http://localhost:8000/auth/callback"
+        mock_settings.google_oauth_scopes = ["scope1"]
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+
+        flow1 = get_oauth_client()
+        flow2 = get_oauth_client()
+
+        assert flow1 is not flow2
+        assert flow1.client_config is flow2.client_config
+
 
 class TestSaveCredentials:
     """Test credential saving functionality."""
@@ -191,6 +229,21 @@ class TestSaveCredentials:
         assert token_path.exists()
         assert token_path.parent.exists()
 
+    def test_save_credentials_recreates_removed_directory(self, tmp_path, monkeypatch):
+        """Should recreate the token directory if it is removed after caching."""
+        token_path = tmp_path / "removed" / "token.json"
+        mock_settings = Mock()
+        mock_settings.token_path = token_path
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+
+        save_credentials(_create_mock_credentials())
+        token_path.unlink()
+        token_path.parent.rmdir()
+
+        save_credentials(_create_mock_credentials())
+
+        assert token_path.exists()
+
     def test_save_credentials_writes_json(self, tmp_path, monkeypatch):
         """Should write valid JSON to token file."""
         token_path = tmp_path / "token.json"
@@ -243,6 +296,41 @@ class TestSaveCredentials:
         mode = stat.S_IMODE(file_stat.st_mode)
         assert mode == 0o600
 
+    def test_save_credentials_uses_unique_temp_files(self, tmp_path, monkeypatch):
+        """Should write each save through its own temp file and leave none."""
+        token_path = tmp_path / "token.json"
+        mock_settings = Mock()
+        mock_settings.token_path = token_path
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+
+        temp_names = []
+        real_replace = os.replace
+
+        def recording_replace(src, dst):
+            temp_names.append(src)
+            real_replace(src, dst)
+
+        with patch.object(oauth.os, "replace", side_effect=recording_replace):
+            save_credentials(_create_mock_credentials())
+            save_credentials(_create_mock_credentials())
+
+        assert len(set(temp_names)) == 2
+        assert all(Path(name).parent == tmp_path for name in temp_names)
+        assert list(tmp_path.iterdir()) == [token_path]
+
+    def test_save_credentials_removes_temp_file_on_failure(self, tmp_path, monkeypatch):
+        """Should clean up the temp file when the rename fails."""
+        token_path = tmp_path / "token.json"
+        mock_settings = Mock()
+        mock_settings.token_path = token_path
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+
+        with patch.object(oauth.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                save_credentials(_create_mock_credentials())
+
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestGetCredentials:
     """Test credential retrieval functionality."""
@@ -417,6 +505,70 @@ class TestGetCredentials:
         assert result is None
 
 
+class TestCredentialsCache:
+    """Test in-memory caching of parsed credentials."""
+
+    @staticmethod
+    def _token_json(token: str = "test_access_token") -> str:
+        data = json.loads(_create_mock_credentials().to_json())
+        data["token"] = token
+        data["expiry"] = "2099-01-01T00:00:00Z"
+        return json.dumps(data)
+
+    def _setup(self, tmp_path, monkeypatch) -> Path:
+        token_path = tmp_path / "token.json"
+        token_path.write_text(self._token_json())
+        mock_settings = Mock()
+        mock_settings.token_path = token_path
+        mock_settings.google_oauth_scopes = [
+            "https://www.googleapis.com/auth/contacts.readonly"
+        ]
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+        return token_path
+
+    def test_unchanged_token_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Should reuse parsed credentials while the token file is unchanged."""
+        self._setup(tmp_path, monkeypatch)
+
+        with patch.object(
+            Credentials,
+            "from_authorized_user_file",
+            wraps=Credentials.from_authorized_user_file,
+        ) as mock_load:
+            first = get_credentials()
+            second = get_credentials()
+
+        assert first is not None
+        assert first is second
+        assert mock_load.call_count == 1
+
+    def test_modified_token_file_is_reloaded(self, tmp_path, monkeypatch):
+        """Should reload credentials when the token file changes on disk."""
+        token_path = self._setup(tmp_path, monkeypatch)
+        first = get_credentials()
+
+        token_path.write_text(self._token_json("new_access_token"))
+
+        second = get_credentials()
+
+        assert second is not first
+        assert second.token == "new_access_token"
+
+    def test_save_and_delete_invalidate_cache(self, tmp_path, monkeypatch):
+        """Should drop cached credentials when the token file is rewritten."""
+        self._setup(tmp_path, monkeypatch)
+        first = get_credentials()
+        assert first is not None
+
+        save_credentials(first)
+        second = get_credentials()
+        assert second is not None
+        assert second is not first
+
+        delete_token_file()
+        assert get_credentials() is None
+
+
 class TestDeleteTokenFile:
     """Test token file deletion."""
 
@@ -454,7 +606,8 @@ class TestIsAuthenticated:
         mock_creds.valid = True
 
         with patch(
-            "google_contacts_cisco.auth.oauth.get_credentials", return_value=mock_creds
+            "google_contacts_cisco.auth.oauth._load_credentials",
+            return_value=mock_creds,
         ):
             result = is_authenticated()
 
@@ -463,7 +616,7 @@ class TestIsAuthenticated:
     def test_is_authenticated_false_no_credentials(self, monkeypatch):
         """Should return False when no credentials exist."""
         with patch(
-            "google_contacts_cisco.auth.oauth.get_credentials", return_value=None
+            "google_contacts_cisco.auth.oauth._load_credentials", return_value=None
         ):
             result = is_authenticated()
 
@@ -473,14 +626,55 @@ class TestIsAuthenticated:
         """Should return False when credentials are invalid."""
         mock_creds = Mock(spec=Credentials)
         mock_creds.valid = False
+        mock_creds.expired = False
+        mock_creds.refresh_token = None
 
         with patch(
-            "google_contacts_cisco.auth.oauth.get_credentials", return_value=mock_creds
+            "google_contacts_cisco.auth.oauth._load_credentials",
+            return_value=mock_creds,
         ):
             result = is_authenticated()
 
         assert result is False
 
+    def test_is_authenticated_true_for_refreshable_expired_credentials(self):
+        """Should treat expired credentials with a refresh token as authenticated."""
+        mock_creds = Mock(spec=Credentials)
+        mock_creds.valid = False
+        mock_creds.expired = True
+        mock_creds.refresh_token = "refresh"
+
+        with patch(
+            "google_contacts_cisco.auth.oauth._load_credentials",
+            return_value=mock_creds,
+        ) as mock_load:
+            result = is_authenticated()
+
+        assert result is True
+        mock_load.assert_called_once_with(refresh=False)
+
+    def test_is_authenticated_does_not_refresh(self, tmp_path, monkeypatch):
+        """Should not contact Google to refresh an expired token."""
+        token_path = tmp_path / "token.json"
+        token_path.write_text("{}")
+        mock_settings = Mock()
+        mock_settings.token_path = token_path
+        mock_settings.google_oauth_scopes = ["scope1"]
+        monkeypatch.setattr(oauth, "settings", mock_settings)
+
+        mock_creds = Mock(spec=Credentials)
+        mock_creds.valid = False
+        mock_creds.expired = True
+        mock_creds.refresh_token = "refresh"
+
+        with patch.object(
+            Credentials, "from_authorized_user_file", return_value=mock_creds
+        ):
+            result = is_authenticated()
+
+        assert result is True
+        mock_creds.refresh.assert_not_called()
+
 
 class TestRevokeCredentials:
     """Test credential revocation."""
@@ -504,9 +698,9 @@ class TestRevokeCredentials:
             "google_contacts_cisco.auth.oauth.get_credentials", return_value=mock_creds
         ):
             with patch(
-                "google_contacts_cisco.auth.oauth.requests.post",
-                return_value=mock_response,
-            ):
+                "google_contacts_cisco.auth.oauth._get_http_session"
+            ) as mock_session:
+                mock_session.return_value.post.return_value = mock_response
                 result = revoke_credentials()
 
         assert result is True
@@ -538,26 +732,16 @@ class TestRevokeCredentials:
         mock_creds.token = "test_token"
         mock_creds.valid = True
 
-        # Need to patch requests at the module level where it's imported
-        import requests as requests_module
-
         with patch(
             "google_contacts_cisco.auth.oauth.get_credentials", return_value=mock_creds
         ):
-            with patch.object(
-                requests_module,
-                "post",
-                side_effect=Exception("Network error"),
-            ):
-                # Since the module imports requests directly,
-                # we also need to patch it there
-                with patch(
-                    "google_contacts_cisco.auth.oauth.requests.post",
-                ) as mock_post:
-                    mock_post.side_effect = oauth.requests.RequestException(
-                        "Network error"
-                    )
-                    result = revoke_credentials()
+            with patch(
+                "google_contacts_cisco.auth.oauth._get_http_session"
+            ) as mock_session:
+                mock_session.return_value.post.side_effect = (
+                    oauth.requests.RequestException("Network error")
+                )
+                result = revoke_credentials()
 
         assert result is True
         assert not token_path.exists()
@@ -582,14 +766,21 @@ class TestRevokeCredentials:
             "google_contacts_cisco.auth.oauth.get_credentials", return_value=mock_creds
         ):
             with patch(
-                "google_contacts_cisco.auth.oauth.requests.post",
-                return_value=mock_response,
-            ):
+                "google_contacts_cisco.auth.oauth._get_http_session"
+            ) as mock_session:
+                mock_session.return_value.post.return_value = mock_response
                 result = revoke_credentials()
 
         assert result is True
         assert not token_path.exists()
 
+    def test_http_session_is_reused(self):
+        """Should return the same pooled session on every call."""
+        session = oauth._get_http_session()
+
+        assert session is oauth._get_http_session()
+        assert session.get_adapter("https://oauth2.googleapis.com") is not None
+
 
 class TestGetAuthorizationUrl:
     """Test authorization URL generation."""
@@ -743,7 +934,7 @@ class TestGetAuthStatus:
         monkeypatch.setattr(oauth, "settings", mock_settings)
 
         with patch(
-            "google_contacts_cisco.auth.oauth.get_credentials", return_value=None
+            "google_contacts_cisco.auth.oauth._load_credentials", return_value=None
         ):
             status = get_auth_status()
 
@@ -766,7 +957,8 @@ class TestGetAuthStatus:
         mock_creds.scopes = ["scope1", "scope2"]
 
         with patch(
-            "google_contacts_cisco.auth.oauth.get_credentials", return_value=mock_creds
+            "google_contacts_cisco.auth.oauth._load_credentials",
+            return_value=mock_creds,
         ):
             status = get_auth_status()
 
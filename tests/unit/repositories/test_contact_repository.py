@@ -4,11 +4,17 @@ This module tests the ContactRepository implementation for database operations
 on Contact and PhoneNumber entities.
 """
 
+import gc
+import weakref
+from datetime import datetime
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 
-from google_contacts_cisco.models import Base, PhoneNumber
+from google_contacts_cisco.config import settings
+from google_contacts_cisco.models import Base, Contact, PhoneNumber
 from google_contacts_cisco.repositories.contact_repository import ContactRepository
 from google_contacts_cisco.schemas.contact import ContactCreateSchema, PhoneNumberSchema
 
@@ -30,6 +36,26 @@ def contact_repo(db_session):
     return ContactRepository(db_session)
 
 
+@pytest.fixture
+def statements(db_session):
+    """Record the SQL statements sent to the database during a test."""
+    recorded: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def strict_loads(monkeypatch):
+    """Make repository query results raise on unplanned relationship loads."""
+    monkeypatch.setattr(settings, "database_strict_loads", True)
+
+
 @pytest.fixture
 def sample_contact_data():
     """Create sample contact data for testing."""
@@ -109,6 +135,38 @@ class TestCreateContact:
         assert len(work_phones) == 1
         assert work_phones[0].value == "5559876543"
 
+    def test_create_contact_inserts_phone_numbers_in_one_statement(
+        self, contact_repo, db_session, sample_contact_data, statements
+    ):
+        """Test all phone numbers of a contact are inserted with one INSERT."""
+        contact_repo.create_contact(sample_contact_data)
+
+        phone_inserts = [
+            sql for sql in statements if sql.startswith("INSERT INTO phone_numbers")
+        ]
+        assert len(phone_inserts) == 1
+        assert db_session.query(PhoneNumber).count() == 2
+
+    def test_create_contact_without_phones_defers_insert(
+        self, contact_repo, db_session, statements
+    ):
+        """Test a contact without phones is written with the caller's flush."""
+        contacts = [
+            contact_repo.create_contact(
+                ContactCreateSchema(resource_name=f"people/c{i}", display_name="X")
+            )
+            for i in range(3)
+        ]
+
+        assert statements == []
+        assert all(contact.id is not None for contact in contacts)
+
+        db_session.commit()
+
+        inserts = [sql for sql in statements if sql.startswith("INSERT INTO contacts")]
+        assert len(inserts) == 1
+        assert contact_repo.count_all() == 3
+
     def test_create_contact_minimal(
         self, contact_repo, db_session, sample_contact_minimal
     ):
@@ -159,6 +217,72 @@ class TestGetContact:
         found = contact_repo.get_by_resource_name("people/nonexistent")
         assert found is None
 
+    def test_get_by_resource_name_cached_within_transaction(
+        self, contact_repo, db_session, sample_contact_data, statements
+    ):
+        """Test repeat lookups in one transaction issue a single query."""
+        contact_repo.create_contact(sample_contact_data)
+        db_session.commit()
+        statements.clear()
+
+        first = contact_repo.get_by_resource_name("people/c12345")
+        second = contact_repo.get_by_resource_name("people/c12345")
+
+        assert first is second
+        assert len(statements) == 1
+
+    @pytest.mark.parametrize("end_transaction", ["commit", "rollback"])
+    def test_get_by_resource_name_cache_cleared_when_transaction_ends(
+        self,
+        contact_repo,
+        db_session,
+        sample_contact_data,
+        statements,
+        end_transaction,
+    ):
+        """Test the lookup cache does not outlive the transaction."""
+        contact_repo.create_contact(sample_contact_data)
+        db_session.commit()
+        contact_repo.get_by_resource_name("people/c12345")
+
+        getattr(db_session, end_transaction)()
+        statements.clear()
+        contact_repo.get_by_resource_name("people/c12345")
+
+        assert len(statements) == 1
+
+    def test_get_by_resource_name_cache_shared_by_session(
+        self, db_session, sample_contact_data, statements
+    ):
+        """Test repositories on one session share the lookup cache."""
+        ContactRepository(db_session).create_contact(sample_contact_data)
+        statements.clear()
+
+        found = ContactRepository(db_session).get_by_resource_name("people/c12345")
+
+        assert found is not None
+        assert statements == []
+
+    def test_repository_not_kept_alive_by_session(self, db_session):
+        """Test a discarded repository is freed while its session lives on."""
+        repo = weakref.ref(ContactRepository(db_session))
+        gc.collect()
+
+        assert repo() is None
+
+    def test_get_by_resource_name_ignores_expunged_contact(
+        self, contact_repo, db_session, sample_contact_data
+    ):
+        """Test a cached contact removed from the session is looked up again."""
+        created = contact_repo.create_contact(sample_contact_data)
+        db_session.flush()
+        db_session.expunge_all()
+
+        contact = contact_repo.get_by_resource_name("people/c12345")
+
+        assert contact is not created
+        assert contact in db_session
+
     def test_get_by_id_exists(self, contact_repo, db_session, sample_contact_data):
         """Test getting contact by ID when it exists."""
         created = contact_repo.create_contact(sample_contact_data)
@@ -265,6 +389,186 @@ class TestUpsertContact:
         assert len(contact.phone_numbers) == 1
         assert contact.phone_numbers[0].value == "5552222222"
 
+    def test_upsert_reloads_replaced_phone_numbers(
+        self, contact_repo, db_session, sample_contact_data
+    ):
+        """Test a loaded phone collection reflects the replacement."""
+        contact = contact_repo.create_contact(sample_contact_data)
+        db_session.commit()
+        assert len(contact.phone_numbers) == 2
+
+        updated_data = ContactCreateSchema(
+            resource_name="people/c12345",
+            display_name="John Doe",
+            phone_numbers=[
+                PhoneNumberSchema(
+                    value="5552222222", display_value="(555) 222-2222", primary=True
+                ),
+            ],
+        )
+        contact = contact_repo.upsert_contact(updated_data)
+
+        assert [p.value for p in contact.phone_numbers] == ["5552222222"]
+
+    def test_update_contact_replaces_phones_without_session_sync(
+        self, contact_repo, db_session, sample_contact_data, statements
+    ):
+        """Test the fallback update path deletes old phones in one statement."""
+        contact = contact_repo.create_contact(sample_contact_data)
+        db_session.commit()
+        assert len(contact.phone_numbers) == 2
+        statements.clear()
+
+        contact_repo._update_contact(contact, sample_contact_data)
+
+        assert statements[0].startswith("UPDATE contacts")
+        assert statements[1].startswith("DELETE FROM phone_numbers")
+        assert statements[2].startswith("INSERT INTO phone_numbers")
+        assert len(statements) == 3
+
+    def test_upsert_uses_single_statement_for_contact_row(
+        self, contact_repo, db_session, sample_contact_data, statements
+    ):
+        """Test that upsert writes the contact without a preceding SELECT."""
+        contact_repo.create_contact(sample_contact_data)
+        db_session.commit()
+        statements.clear()
+
+        contact_repo.upsert_contact(sample_contact_data)
+
+        assert statements[0].startswith("INSERT INTO contacts")
+        assert "ON CONFLICT" in statements[0]
+        # Contact upsert, phone DELETE, phone INSERT
+        assert len(statements) == 3
+
+
+class TestUpsertContacts:
+    """Test batch contact upsert functionality."""
+
+    @staticmethod
+    def _contact(index, name, phone):
+        return ContactCreateSchema(
+            resource_name=f"people/c{index}",
+            display_name=name,
+            phone_numbers=[
+                PhoneNumberSchema(
+                    value=phone,
+                    display_value=phone,
+                    type="mobile",
+                    primary=True,
+                ),
+            ],
+        )
+
+    def test_upsert_contacts_creates_and_updates(self, contact_repo, db_session):
+        """Test that a batch creates new contacts and updates existing ones."""
+        existing = contact_repo.create_contact(
+            self._contact(1, "Old Name", "5550000001")
+        )
+        db_session.commit()
+        existing_id = existing.id
+
+        created, updated = contact_repo.upsert_contacts(
+            [
+                self._contact(1, "New Name", "5551111111"),
+                self._contact(2, "Second", "5552222222"),
+                self._contact(3, "Third", "5553333333"),
+            ]
+        )
+        db_session.commit()
+
+        assert (created, updated) == (2, 1)
+        assert contact_repo.count_all() == 3
+
+        contact = contact_repo.get_by_resource_name("people/c1")
+        assert contact.id == existing_id
+        assert contact.display_name == "New Name"
+        assert [phone.value for phone in contact.phone_numbers] == ["5551111111"]
+        assert db_session.query(PhoneNumber).count() == 3
+
+        second = contact_repo.get_by_resource_name("people/c2")
+        assert second.synced_at is not None
+        assert [phone.value for phone in second.phone_numbers] == ["5552222222"]
+
+    def test_upsert_contacts_last_duplicate_wins(self, contact_repo, db_session):
+        """Test that a resource name repeated in one batch is stored once."""
+        created, updated = contact_repo.upsert_contacts(
+            [
+                self._contact(1, "First", "5551111111"),
+                self._contact(1, "Second", "5552222222"),
+            ]
+        )
+        db_session.commit()
+
+        assert (created, updated) == (1, 0)
+        contact = contact_repo.get_by_resource_name("people/c1")
+        assert contact.display_name == "Second"
+        assert [phone.value for phone in contact.phone_numbers] == ["5552222222"]
+
+    def test_upsert_contacts_empty(self, contact_repo, statements):
+        """Test that an empty batch does not touch the database."""
+        assert contact_repo.upsert_contacts([]) == (0, 0)
+        assert statements == []
+
+    def test_upsert_contacts_statement_count_is_constant(
+        self, contact_repo, db_session, statements
+    ):
+        """Test that the number of statements does not grow with the batch."""
+        contact_repo.upsert_contacts(
+            [self._contact(i, f"Contact {i}", f"555{i:07d}") for i in range(50)]
+        )
+        db_session.commit()
+        statements.clear()
+
+        contact_repo.upsert_contacts(
+            [self._contact(i, f"Renamed {i}", f"556{i:07d}") for i in range(100)]
+        )
+
+        # SELECT existing, INSERT new, UPDATE existing, DELETE + INSERT phones
+        assert len(statements) == 5
+
+    def test_upsert_contacts_many_phone_numbers(self, contact_repo, db_session):
+        """Test phone rows beyond SQLite's bound-parameter limit are inserted."""
+        phones = [
+            PhoneNumberSchema(value=f"555{i:07d}", display_value=f"555{i:07d}")
+            for i in range(5000)
+        ]
+        contact_repo.upsert_contacts(
+            [
+                ContactCreateSchema(
+                    resource_name="people/c1",
+                    display_name="Switchboard",
+                    phone_numbers=phones,
+                )
+            ]
+        )
+        db_session.commit()
+
+        assert db_session.query(PhoneNumber).count() == 5000
+        assert contact_repo.search_by_phone("5550004999")[0].display_name == (
+            "Switchboard"
+        )
+
+    def test_upsert_contacts_records_given_timestamp(self, contact_repo, db_session):
+        """Test that every contact in a batch gets the same sync timestamp."""
+        contact_repo.create_contact(self._contact(1, "Old Name", "5550000001"))
+        db_session.commit()
+        now = datetime(2024, 1, 2, 3, 4, 5)
+
+        contact_repo.upsert_contacts(
+            [
+                self._contact(1, "New Name", "5551111111"),
+                self._contact(2, "Second", "5552222222"),
+            ],
+            now=now,
+        )
+        db_session.commit()
+
+        for contact in contact_repo.get_all_active():
+            assert contact.synced_at == now
+        updated = contact_repo.get_by_resource_name("people/c1")
+        assert updated.updated_at == now
+
 
 class TestMarkAsDeleted:
     """Test soft delete functionality."""
@@ -289,6 +593,55 @@ class TestMarkAsDeleted:
         assert result is None
 
 
+class TestMarkManyAsDeleted:
+    """Test batch soft delete functionality."""
+
+    def test_mark_many_as_deleted(self, contact_repo, db_session, statements):
+        """Test known contacts are soft deleted with a single UPDATE."""
+        for i in range(3):
+            contact_repo.create_contact(
+                ContactCreateSchema(resource_name=f"people/c{i}", display_name=f"C{i}")
+            )
+        db_session.commit()
+        statements.clear()
+
+        count = contact_repo.mark_many_as_deleted(
+            ["people/c0", "people/c2", "people/unknown"]
+        )
+        db_session.commit()
+
+        assert count == 2
+        assert len(statements) == 1
+        assert [c.resource_name for c in contact_repo.get_all_active()] == ["people/c1"]
+        deleted = contact_repo.get_by_resource_name("people/c0")
+        assert deleted.deleted is True
+        assert deleted.synced_at is not None
+
+    def test_mark_many_as_deleted_records_given_timestamp(
+        self, contact_repo, db_session
+    ):
+        """Test that the given sync timestamp is recorded on every row."""
+        for i in range(2):
+            contact_repo.create_contact(
+                ContactCreateSchema(resource_name=f"people/c{i}", display_name=f"C{i}")
+            )
+        db_session.commit()
+        now = datetime(2024, 1, 2, 3, 4, 5)
+
+        contact_repo.mark_many_as_deleted(["people/c0", "people/c1"], now=now)
+        db_session.commit()
+        db_session.expire_all()
+
+        for name in ("people/c0", "people/c1"):
+            contact = contact_repo.get_by_resource_name(name)
+            assert (contact.synced_at, contact.updated_at) == (now, now)
+
+    def test_mark_many_as_deleted_empty(self, contact_repo, statements):
+        """Test an empty batch does not touch the database."""
+        assert contact_repo.mark_many_as_deleted([]) == 0
+        assert statements == []
+
+
 class TestGetContacts:
     """Test bulk contact retrieval functionality."""
 
@@ -441,6 +794,228 @@ class TestGetContacts:
         expected_names = {"Contact 0", "Contact 1", "Contact 2"}
         assert display_names == expected_names
 
+    @pytest.mark.parametrize(
+        "method", ["get_all_active", "get_all_active_with_phones", "get_contacts"]
+    )
+    def test_phone_numbers_are_eager_loaded(
+        self, contact_repo, db_session, statements, method
+    ):
+        """Test that phone numbers load in one extra query, not one per contact."""
+        for i in range(5):
+            contact_repo.create_contact(
+                ContactCreateSchema(
+                    resource_name=f"people/contact{i}",
+                    display_name=f"Contact {i}",
+                    phone_numbers=[
+                        PhoneNumberSchema(
+                            value=f"+155512340{i}",
+                            display_value=f"+1-555-1234-0{i}",
+                            type="mobile",
+                            primary=True,
+                        ),
+                    ],
+                )
+            )
+        db_session.commit()
+        db_session.expunge_all()
+        statements.clear()
+
+        results = getattr(contact_repo, method)()
+        phones = [p.value for c in results for p in c.phone_numbers]
+
+        assert len(phones) == 5
+        assert len(statements) == 2
+
+
+class TestKeysetPagination:
+    """Test keyset (cursor) pagination of contact lists."""
+
+    @pytest.fixture(autouse=True)
+    def contacts(self, contact_repo, db_session):
+        """Store contacts with duplicate display names and distinct timestamps."""
+        for i, name in enumerate(["Alice", "Bob", "Bob", "Carol", "Bob", "Dave"]):
+            contact = contact_repo.create_contact(
+                ContactCreateSchema(resource_name=f"people/c{i}", display_name=name)
+            )
+            contact.updated_at = datetime(2026, 1, 1 + i % 3, i)
+        db_session.commit()
+
+    @staticmethod
+    def _walk(fetch, key):
+        """Collect every page by following the cursor of each page's last row."""
+        seen, after = [], None
+        while page := fetch(after):
+            seen.extend(page)
+            after = (key(page[-1]), page[-1].id)
+        return seen
+
+    @pytest.mark.parametrize("sort_by_recent", [False, True])
+    def test_keyset_pages_match_offset_order(self, contact_repo, sort_by_recent):
+        """Test following cursors visits every contact once in sort order."""
+        key = (lambda c: c.updated_at) if sort_by_recent else (lambda c: c.display_name)
+
+        walked = self._walk(
+            lambda after: contact_repo.get_contacts(
+                limit=2, sort_by_recent=sort_by_recent, after=after
+            ),
+            key,
+        )
+
+        expected = contact_repo.get_contacts(limit=100, sort_by_recent=sort_by_recent)
+        assert [c.id for c in walked] == [c.id for c in expected]
+        assert len(walked) == 6
+
+    def test_keyset_pages_letter_group(self, contact_repo):
+        """Test cursors page through a letter group including name ties."""
+        walked = self._walk(
+            lambda after: contact_repo.get_contacts_by_letter_group(
+                "B", limit=1, after=after
+            ),
+            lambda c: c.display_name,
+        )
+
+        assert [c.resource_name for c in walked] == sorted(
+            ["people/c1", "people/c2", "people/c4"],
+            key=lambda rn: contact_repo.get_by_resource_name(rn).id,
+        )
+
+    def test_cursor_ignores_offset(self, contact_repo):
+        """Test offset has no effect once a cursor is given."""
+        first = contact_repo.get_contacts(limit=1)[0]
+
+        page = contact_repo.get_contacts(
+            limit=1, offset=3, after=(first.display_name, first.id)
+        )
+
+        assert [c.display_name for c in page] == ["Bob"]
+
+
+class TestLetterGroups:
+    """Test letter group filtering via the stored display name bucket."""
+
+    @pytest.fixture(autouse=True)
+    def contacts(self, contact_repo, db_session):
+        """Store contacts through each write path."""
+        contact_repo.create_contact(
+            ContactCreateSchema(resource_name="people/c1", display_name="alice")
+        )
+        contact_repo.upsert_contact(
+            ContactCreateSchema(resource_name="people/c2", display_name="Adam")
+        )
+        contact_repo.upsert_contacts(
+            [
+                ContactCreateSchema(
+                    resource_name="people/c3", display_name="123 Pizza"
+                ),
+                ContactCreateSchema(resource_name="people/c4", display_name="Émile"),
+                ContactCreateSchema(resource_name="people/c5", display_name="Bob"),
+            ]
+        )
+        db_session.commit()
+
+    @pytest.mark.parametrize(
+        "letter,expected",
+        [
+            ("A", ["Adam", "alice"]),
+            ("a", ["Adam", "alice"]),
+            ("B", ["Bob"]),
+            ("#", ["123 Pizza", "Émile"]),
+            ("Z", []),
+        ],
+    )
+    def test_get_and_count_by_letter_group(self, contact_repo, letter, expected):
+        """Test listing and counting contacts in a letter group."""
+        contacts = contact_repo.get_contacts_by_letter_group(letter)
+
+        assert [c.display_name for c in contacts] == expected
+        assert contact_repo.count_contacts_by_letter_group(letter) == len(expected)
+        rows = contact_repo.get_contact_rows(letter)
+        assert [row.display_name for row in rows] == expected
+
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_rename_moves_contact_between_groups(self, contact_repo, db_session, batch):
+        """Test updating a display name also updates its letter group."""
+        renamed = ContactCreateSchema(resource_name="people/c5", display_name="Zed")
+        if batch:
+            contact_repo.upsert_contacts([renamed])
+        else:
+            contact_repo.upsert_contact(renamed)
+        db_session.commit()
+
+        assert contact_repo.count_contacts_by_letter_group("B") == 0
+        assert [
+            c.display_name for c in contact_repo.get_contacts_by_letter_group("Z")
+        ] == ["Zed"]
+
+    def test_directly_added_contact_gets_bucket(self, db_session):
+        """Test the column default fills the bucket outside the repository."""
+        contact = Contact(resource_name="people/c9", display_name="quinn")
+        db_session.add(contact)
+        db_session.commit()
+
+        assert contact.display_name_bucket == "Q"
+
+
+class TestContactRows:
+    """Test the column-only contact list queries."""
+
+    def test_contact_rows_match_contact_pages(self, contact_repo, db_session):
+        """Test rows page like the ORM queries without loading instances."""
+        for i, name in enumerate(["Cy", "Al", "Bo", "Di"]):
+            contact_repo.create_contact(
+                ContactCreateSchema(
+                    resource_name=f"people/c{i}",
+                    display_name=name,
+                    deleted=(name == "Di"),
+                )
+            )
+        db_session.commit()
+        db_session.expunge_all()
+
+        rows = contact_repo.get_contact_rows(limit=2, offset=1)
+
+        assert [row.display_name for row in rows] == ["Bo", "Cy"]
+        assert [row.id for row in rows] == [
+            c.id for c in contact_repo.get_contacts(limit=2, offset=1)
+        ]
+        assert rows[0].created_at is not None
+        assert rows[0].updated_at is not None
+
+    def test_phone_number_rows_grouped_by_contact(
+        self, contact_repo, db_session, statements
+    ):
+        """Test phone rows for several contacts come back from one query."""
+        with_phones = contact_repo.create_contact(
+            ContactCreateSchema(
+                resource_name="people/c1",
+                display_name="Phones",
+                phone_numbers=[
+                    PhoneNumberSchema(value="+12025551234", display_value="a"),
+                    PhoneNumberSchema(value="+12025555678", display_value="b"),
+                ],
+            )
+        )
+        without_phones = contact_repo.create_contact(
+            ContactCreateSchema(resource_name="people/c2", display_name="None")
+        )
+        db_session.commit()
+        ids = [with_phones.id, without_phones.id]
+        statements.clear()
+
+        phones = contact_repo.get_phone_number_rows(ids)
+
+        assert len(statements) == 1
+        assert sorted(row.value for row in phones[ids[0]]) == [
+            "+12025551234",
+            "+12025555678",
+        ]
+        assert phones[ids[1]] == []
+
+    def test_phone_number_rows_empty(self, contact_repo, statements):
+        """Test no contact IDs means no query."""
+        assert contact_repo.get_phone_number_rows([]) == {}
+        assert statements == []
+
 
 class TestCountContacts:
     """Test contact counting functionality."""
@@ -479,6 +1054,59 @@ class TestCountContacts:
         """Test counting active contacts when none exist."""
         assert contact_repo.count_active() == 0
 
+    def test_counts_do_not_wrap_a_subquery(self, contact_repo, statements):
+        """Test counts aggregate the table directly instead of a subquery."""
+        contact_repo.count_all()
+        contact_repo.count_active()
+        contact_repo.count_contacts_by_letter_group("a")
+
+        assert len(statements) == 3
+        assert all("FROM (SELECT" not in sql for sql in statements)
+
+
+class TestContactStatistics:
+    """Test aggregate contact statistics."""
+
+    def test_get_contact_statistics(self, contact_repo, db_session):
+        """Test counts skip deleted contacts and handle contacts without phones."""
+
+        def phone(value):
+            return PhoneNumberSchema(
+                value=value, display_value=value, type="mobile", primary=False
+            )
+
+        for resource_name, phones, deleted in [
+            ("people/c1", [phone("5551111111"), phone("5552222222")], False),
+            ("people/c2", [phone("5553333333")], False),
+            ("people/c3", [], False),
+            ("people/c4", [phone("5554444444")], True),
+        ]:
+            contact_repo.create_contact(
+                ContactCreateSchema(
+                    resource_name=resource_name,
+                    display_name=resource_name,
+                    phone_numbers=phones,
+                    deleted=deleted,
+                )
+            )
+        db_session.commit()
+
+        assert contact_repo.get_contact_statistics() == {
+            "total_contacts": 3,
+            "contacts_with_phone": 2,
+            "contacts_with_email": 0,
+            "total_phone_numbers": 3,
+            "total_emails": 0,
+        }
+
+    def test_get_contact_statistics_empty(self, contact_repo):
+        """Test statistics for an empty database."""
+        stats = contact_repo.get_contact_statistics()
+
+        assert stats["total_contacts"] == 0
+        assert stats["contacts_with_phone"] == 0
+        assert stats["total_phone_numbers"] == 0
+
 
 class TestDeleteAllContacts:
     """Test bulk delete functionality."""
@@ -673,6 +1301,98 @@ class TestSearchByPhone:
         # The fallback uses %digits pattern
         assert isinstance(results, list)
 
+    def test_search_by_phone_matches_unnormalized_stored_value(
+        self, contact_repo, db_session, statements
+    ):
+        """Test a normalizable query still finds values stored in another format."""
+        contact = contact_repo.create_contact(
+            ContactCreateSchema(resource_name="people/c1", display_name="Legacy")
+        )
+        db_session.add(
+            PhoneNumber(
+                contact_id=contact.id,
+                value="5551234567",
+                display_value="555-123-4567",
+            )
+        )
+        db_session.commit()
+        statements.clear()
+
+        results = contact_repo.search_by_phone("(555) 123-4567")
+
+        assert [c.display_name for c in results] == ["Legacy"]
+        # Contact query plus the phone number selectinload
+        assert len(statements) == 2
+
+    def test_phone_value_reversed_is_populated(self, contact_repo, db_session):
+        """Test that stored phone numbers carry their reversed value."""
+        contact_repo.upsert_contacts(
+            [
+                ContactCreateSchema(
+                    resource_name="people/c1",
+                    display_name="Test Contact",
+                    phone_numbers=[
+                        PhoneNumberSchema(
+                            value="+15551234567",
+                            display_value="(555) 123-4567",
+                            type="mobile",
+                            primary=True,
+                        ),
+                    ],
+                )
+            ]
+        )
+        db_session.add(
+            PhoneNumber(
+                contact_id=contact_repo.get_by_resource_name("people/c1").id,
+                value="+15559876543",
+                display_value="(555) 987-6543",
+            )
+        )
+        db_session.commit()
+
+        reversed_values = {
+            phone.value: phone.value_reversed
+            for phone in db_session.query(PhoneNumber).all()
+        }
+        assert reversed_values == {
+            "+15551234567": "76543215551+",
+            "+15559876543": "34567895551+",
+        }
+
+    @pytest.mark.parametrize(
+        "digits,expected",
+        [
+            ("1234567", ["+15551234567"]),
+            ("4567", ["+15551234567"]),
+            ("7", ["+15551234567"]),
+            ("9", ["+15551234569"]),
+            ("123456", []),
+        ],
+    )
+    def test_phone_value_endswith(self, db_session, contact_repo, digits, expected):
+        """Test suffix matching through the reversed value range."""
+        for i, value in enumerate(["+15551234567", "+15551234569"]):
+            contact_repo.create_contact(
+                ContactCreateSchema(
+                    resource_name=f"people/c{i}",
+                    display_name=f"Contact {i}",
+                    phone_numbers=[
+                        PhoneNumberSchema(
+                            value=value, display_value=value, type="mobile"
+                        ),
+                    ],
+                )
+            )
+        db_session.commit()
+
+        matches = (
+            db_session.query(PhoneNumber.value)
+            .filter(PhoneNumber.value_endswith(digits))
+            .all()
+        )
+        assert [value for (value,) in matches] == expected
+
     def test_search_by_phone_empty_database(self, contact_repo):
         """Test searching in empty database."""
         results = contact_repo.search_by_phone("5551234567")
@@ -725,3 +1445,58 @@ class TestSearchByPhone:
         # Should return contact only once even with multiple matching phones
         assert len(results) == 1
         assert results[0].display_name == "Multi Phone"
+
+
+@pytest.mark.usefixtures("strict_loads")
+class TestStrictLoads:
+    """Test query counts with lazy relationship loading disabled."""
+
+    @pytest.fixture(autouse=True)
+    def contacts(self, contact_repo, db_session):
+        """Store a few contacts with phone numbers and clear the session."""
+        for i in range(3):
+            contact_repo.create_contact(
+                ContactCreateSchema(
+                    resource_name=f"people/c{i}",
+                    display_name=f"Contact {i}",
+                    phone_numbers=[
+                        PhoneNumberSchema(
+                            value=f"+1555123456{i}",
+                            display_value=f"(555) 123-456{i}",
+                            type="mobile",
+                            primary=True,
+                        ),
+                    ],
+                )
+            )
+        db_session.commit()
+        db_session.expunge_all()
+
+    def test_get_contacts_query_count(self, contact_repo, statements):
+        """Test that listing contacts with phones takes two queries."""
+        results = contact_repo.get_contacts()
+
+        assert [len(c.phone_numbers) for c in results] == [1, 1, 1]
+        assert len(statements) == 2
+
+    def test_search_by_phone_query_count(self, contact_repo, statements):
+        """Test that a phone search with phones takes two queries."""
+        results = contact_repo.search_by_phone("+15551234561")
+
+        assert [p.value for c in results for p in c.phone_numbers] == ["+15551234561"]
+        assert len(statements) == 2
+
+    def test_get_contact_statistics_query_count(self, contact_repo, statements):
+        """Test that contact statistics are computed in a single query."""
+        stats = contact_repo.get_contact_statistics()
+
+        assert stats["total_contacts"] == 3
+        assert stats["total_phone_numbers"] == 3
+        assert len(statements) == 1
+
+    def test_unplanned_lazy_load_raises(self, contact_repo):
+        """Test that relationships not eager-loaded raise when touched."""
+        phone = contact_repo.get_contacts()[0].phone_numbers[0]
+
+        with pytest.raises(InvalidRequestError):
+            phone.contact
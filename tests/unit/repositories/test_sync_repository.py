@@ -4,10 +4,12 @@ This module tests the SyncRepository implementation for managing
 synchronization state in the database.
 """
 
+import gc
+import weakref
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from google_contacts_cisco.models import Base
@@ -117,6 +119,31 @@ class TestGetSyncState:
         found = sync_repo.get_sync_state_by_id(str(uuid.uuid4()))
         assert found is None
 
+    def test_get_sync_state_by_id_invalid_string(self, sync_repo):
+        """Test a malformed ID string returns None."""
+        assert sync_repo.get_sync_state_by_id("not-a-uuid") is None
+
+    def test_get_sync_state_by_id_uses_identity_map(self, sync_repo, db_session):
+        """Test a state already in the session is returned without SQL."""
+        created = sync_repo.create_sync_state(sync_token="test")
+        db_session.commit()
+        assert created.sync_token == "test"  # refresh after commit expiry
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            found = sync_repo.get_sync_state_by_id(created.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert found is created
+        assert statements == []
+
 
 class TestUpdateSyncState:
     """Test sync state update functionality."""
@@ -268,6 +295,109 @@ class TestSyncStatusChecks:
         """Test is_sync_in_progress returns False with no syncs."""
         assert sync_repo.is_sync_in_progress() is False
 
+    def test_get_latest_status(self, sync_repo, db_session):
+        """Test status and token come from the most recent sync state."""
+        older = sync_repo.create_sync_state(sync_token="old", status=SyncStatus.IDLE)
+        older.last_sync_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        sync_repo.create_sync_state(sync_token="new", status=SyncStatus.ERROR)
+        db_session.commit()
+
+        assert sync_repo.get_latest_status() == (SyncStatus.ERROR, "new")
+
+    def test_get_latest_status_no_syncs(self, sync_repo):
+        """Test get_latest_status with no syncs."""
+        assert sync_repo.get_latest_status() == (None, None)
+
+    def test_status_checks_do_not_load_sync_states(self, sync_repo, db_session):
+        """Test status checks read columns without loading SyncState objects."""
+        sync_repo.create_sync_state(sync_token="token", status=SyncStatus.IDLE)
+        db_session.commit()
+        db_session.expunge_all()
+
+        assert sync_repo.get_current_sync_token() == "token"
+        assert sync_repo.has_completed_sync() is True
+        assert sync_repo.is_sync_in_progress() is False
+        assert len(db_session.identity_map) == 0
+
+
+class TestLatestSyncStateCache:
+    """Test reuse of the latest sync state within a transaction."""
+
+    @pytest.fixture
+    def statements(self, db_session):
+        """Record the SQL statements sent to the database during a test."""
+        recorded = []
+        engine = db_session.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            recorded.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        yield recorded
+        event.remove(engine, "before_cursor_execute", listener)
+
+    def test_repeated_lookups_query_once(self, sync_repo, db_session, statements):
+        """Test the latest state is fetched once per transaction."""
+        sync_repo.create_sync_state(sync_token="token")
+        db_session.commit()
+        statements.clear()
+
+        latest = sync_repo.get_latest_sync_state()
+        assert sync_repo.get_latest_sync_state() is latest
+        assert sync_repo.is_sync_in_progress() is False
+        assert sync_repo.get_current_sync_token() == "token"
+
+        assert len(statements) == 1
+
+    def test_written_state_is_latest(self, sync_repo, db_session, statements):
+        """Test created and updated states become the latest without SQL."""
+        created = sync_repo.create_sync_state(status=SyncStatus.SYNCING)
+
+        assert sync_repo.get_latest_sync_state() is created
+        assert sync_repo.is_sync_in_progress() is True
+
+        sync_repo.update_sync_state(created, status=SyncStatus.IDLE)
+        assert sync_repo.has_completed_sync() is True
+        assert statements == []
+
+    def test_commit_drops_cache(self, sync_repo, db_session):
+        """Test states written by other sessions are seen after a commit."""
+        sync_repo.create_sync_state(sync_token="mine")
+        db_session.commit()
+        assert sync_repo.get_current_sync_token() == "mine"
+
+        other = sessionmaker(bind=db_session.get_bind())()
+        SyncRepository(other).create_sync_state(sync_token="theirs")
+        other.commit()
+        other.close()
+        db_session.commit()
+
+        assert sync_repo.get_current_sync_token() == "theirs"
+
+    def test_rollback_drops_cache(self, sync_repo, db_session):
+        """Test a rolled-back state is not reported as the latest."""
+        sync_repo.create_sync_state(sync_token="kept")
+        db_session.commit()
+
+        sync_repo.create_sync_state(sync_token="discarded")
+        db_session.rollback()
+
+        assert sync_repo.get_current_sync_token() == "kept"
+
+    def test_cache_shared_by_session(self, sync_repo, db_session, statements):
+        """Test repositories on one session share the latest state."""
+        created = sync_repo.create_sync_state(sync_token="token")
+
+        assert SyncRepository(db_session).get_latest_sync_state() is created
+        assert statements == []
+
+    def test_repository_not_kept_alive_by_session(self, db_session):
+        """Test a discarded repository is freed while its session lives on."""
+        repo = weakref.ref(SyncRepository(db_session))
+        gc.collect()
+
+        assert repo() is None
+
 
 class TestDeleteAllSyncStates:
     """Test bulk delete functionality."""
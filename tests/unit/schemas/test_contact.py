@@ -9,8 +9,11 @@ from datetime import datetime, timezone
 import pytest
 from pydantic import ValidationError
 
+from google_contacts_cisco.models import Contact, PhoneNumber
+from google_contacts_cisco.schemas import contact as contact_schemas
 from google_contacts_cisco.schemas.contact import (
     ContactCreateSchema,
+    ContactResponse,
     ContactSchema,
     ContactSearchResultSchema,
     PhoneNumberSchema,
@@ -189,6 +192,31 @@ class TestPhoneNumberSchema:
         assert phone.value == "+12025551234"
         assert "*67" in phone.display_value
 
+    def test_repeated_phone_number_is_parsed_once(self, monkeypatch):
+        """Test that normalizing the same raw number again reuses the result."""
+        calls = []
+        normalize = contact_schemas._PHONE_NORMALIZER.normalize
+        monkeypatch.setattr(
+            contact_schemas._PHONE_NORMALIZER,
+            "normalize",
+            lambda *args: calls.append(args) or normalize(*args),
+        )
+        contact_schemas._normalize_phone.cache_clear()
+
+        first = PhoneNumberSchema(value="202-555-0199", display_value="")
+        second = PhoneNumberSchema(value="202-555-0199", display_value="")
+        contact_schemas._normalize_phone.cache_clear()
+
+        assert first == second
+        assert first.value == "+12025550199"
+        assert len(calls) == 1
+
+    def test_phone_number_fallback_strips_non_latin_characters(self):
+        """Test that the fallback drops symbols outside Latin-1 too."""
+        phone = PhoneNumberSchema(value="12 \u260e 34", display_value="12 34")
+
+        assert phone.value == "1234"
+
 
 class TestContactCreateSchema:
     """Test ContactCreateSchema."""
@@ -357,3 +385,37 @@ class TestContactSearchResultSchema:
         assert result.family_name == "Doe"
         assert result.organization == "Acme Corp"
         assert len(result.phone_numbers) == 1
+
+
+class TestContactResponse:
+    """Test ContactResponse built from ORM contacts."""
+
+    def test_from_orm_matches_validated_response(self):
+        """Test the unvalidated response serializes like a validated one."""
+        created = datetime(2026, 1, 9, 20, 30, 0, tzinfo=timezone.utc)
+        contact = Contact(
+            id=uuid.uuid4(),
+            resource_name="people/c123",
+            display_name="John Doe",
+            given_name="John",
+            created_at=created,
+            updated_at=created,
+            phone_numbers=[
+                PhoneNumber(
+                    id=uuid.uuid4(),
+                    value="+15551234567",
+                    display_value="(555) 123-4567",
+                    type="mobile",
+                    primary=True,
+                )
+            ],
+        )
+
+        response = ContactResponse.from_orm(contact)
+
+        assert (
+            response.model_dump()
+            == ContactResponse.model_validate(response.model_dump()).model_dump()
+        )
+        assert response.phone_numbers[0].value == "+15551234567"
+        assert response.created_at == "2026-01-09T20:30:00+00:00"
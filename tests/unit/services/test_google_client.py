@@ -9,11 +9,14 @@ This module tests all Google client functionality including:
 - Error handling for various API errors
 """
 
-from unittest.mock import MagicMock, Mock, patch
+import sys
+import threading
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
 from google_contacts_cisco.services import google_client as google_client_module
 from google_contacts_cisco.services.google_client import (
@@ -173,7 +176,11 @@ class TestGoogleContactsClientService:
             client = GoogleContactsClient(mock_creds)
             _ = client.service
 
-            mock_build.assert_called_once_with("people", "v1", credentials=mock_creds)
+            mock_build.assert_called_once_with(
+                "people", "v1", credentials=mock_creds, model=ANY
+            )
+            model = mock_build.call_args.kwargs["model"]
+            assert isinstance(model, google_client_module._OrjsonModel)
 
     def test_service_returns_same_instance(self):
         """Should return same service instance on repeated access."""
@@ -191,6 +198,32 @@ class TestGoogleContactsClientService:
             mock_build.assert_called_once()
 
 
+class TestOrjsonModel:
+    """Test the response model used to parse API bodies."""
+
+    def test_deserialize_parses_json_bytes(self):
+        """Should parse JSON response bytes into Python objects."""
+        model = google_client_module._OrjsonModel()
+
+        body = model.deserialize(b'{"connections": [{"resourceName": "people/1"}]}')
+
+        assert body == {"connections": [{"resourceName": "people/1"}]}
+
+    def test_deserialize_matches_default_model(self):
+        """Should parse bodies the same way as googleapiclient's JsonModel."""
+        content = '{"names": [{"displayName": "Zo\u00eb \u00c5berg"}], "n": 1.5}'
+
+        assert google_client_module._OrjsonModel().deserialize(
+            content.encode()
+        ) == JsonModel().deserialize(content.encode())
+
+    def test_deserialize_returns_non_json_body_as_text(self):
+        """Should fall back to the raw body when it is not JSON."""
+        model = google_client_module._OrjsonModel()
+
+        assert model.deserialize(b"Service Unavailable") == "Service Unavailable"
+
+
 class TestListConnections:
     """Test listing connections functionality."""
 
@@ -333,6 +366,73 @@ class TestListConnections:
 
             mock_sleep.assert_called_with(0.1)
 
+    def test_list_connections_prefetches_next_page(self):
+        """Should request the next page while the current one is processed."""
+        mock_creds = _create_mock_credentials()
+        mock_service = _create_mock_service()
+
+        page2_requested = threading.Event()
+        responses = iter(
+            [
+                {"connections": [{}], "nextPageToken": "page2"},
+                {"connections": [{}]},
+            ]
+        )
+
+        def execute():
+            response = next(responses)
+            if "nextPageToken" not in response:
+                page2_requested.set()
+            return response
+
+        mock_service.people().connections().list().execute.side_effect = execute
+
+        with patch.object(google_client_module, "build", return_value=mock_service):
+            with patch("time.sleep"):
+                client = GoogleContactsClient(mock_creds)
+                pages = client.list_connections()
+
+                first = next(pages)
+                assert page2_requested.wait(timeout=5)
+                rest = list(pages)
+
+        assert first["nextPageToken"] == "page2"
+        assert len(rest) == 1
+
+    def test_list_connections_reraises_worker_base_exception(self):
+        """Should surface errors outside Exception instead of hanging."""
+        mock_creds = _create_mock_credentials()
+        mock_service = _create_mock_service()
+
+        mock_service.people().connections().list().execute.side_effect = SystemExit(3)
+
+        with patch.object(google_client_module, "build", return_value=mock_service):
+            client = GoogleContactsClient(mock_creds)
+
+            with pytest.raises(SystemExit):
+                list(client.list_connections())
+
+    def test_list_connections_close_stops_fetching(self):
+        """Should stop requesting pages once the caller stops iterating."""
+        mock_creds = _create_mock_credentials()
+        mock_service = _create_mock_service()
+
+        execute_mock = mock_service.people().connections().list().execute
+        execute_mock.return_value = {"connections": [{}], "nextPageToken": "more"}
+
+        with patch.object(google_client_module, "build", return_value=mock_service):
+            with patch("time.sleep"):
+                client = GoogleContactsClient(mock_creds)
+                pages = client.list_connections()
+                next(pages)
+                pages.close()
+
+        # At most the page held in the queue and the one in flight
+        assert execute_mock.call_count <= 3
+        assert not any(
+            t.name == "google-connections-prefetch" for t in threading.enumerate()
+        )
+
 
 class TestGetPerson:
     """Test getting a single person."""
@@ -630,6 +730,50 @@ class TestRetryLogic:
         assert "500" in str(exc_info.value)
         assert "2 retries" in str(exc_info.value)
 
+    def test_many_retries_do_not_nest(self):
+        """Should retry in a loop rather than growing the call stack."""
+        mock_creds = _create_mock_credentials()
+        mock_service = _create_mock_service()
+
+        error_response = Mock()
+        error_response.status = 503
+        retries = sys.getrecursionlimit() + 10
+
+        mock_service.people().connections().list().execute.side_effect = [
+            HttpError(error_response, b"Service unavailable")
+        ] * retries + [{"connections": []}]
+
+        with patch.object(google_client_module, "build", return_value=mock_service):
+            with patch("time.sleep"):
+                client = GoogleContactsClient(
+                    mock_creds, max_retries=retries, initial_backoff=0.0
+                )
+                results = list(client.list_connections())
+
+        assert results == [{"connections": []}]
+
+    def test_final_error_does_not_chain_earlier_attempts(self):
+        """Should raise with only the last attempt's error attached."""
+        mock_creds = _create_mock_credentials()
+        mock_service = _create_mock_service()
+
+        error_response = Mock()
+        error_response.status = 429
+
+        mock_service.people().connections().list().execute.side_effect = HttpError(
+            error_response, b"Rate limit"
+        )
+
+        with patch.object(google_client_module, "build", return_value=mock_service):
+            with patch("time.sleep"):
+                client = GoogleContactsClient(mock_creds, max_retries=2)
+
+                with pytest.raises(RateLimitError) as exc_info:
+                    list(client.list_connections())
+
+        assert isinstance(exc_info.value.__cause__, HttpError)
+        assert exc_info.value.__cause__.__context__ is None
+
     def test_no_retry_on_401(self):
         """Should not retry on 401 unauthorized error."""
         mock_creds = _create_mock_credentials()
@@ -263,6 +263,46 @@ class TestFullSync:
         contact = db_session.query(Contact).first()
         assert contact.deleted is True
 
+    def test_full_sync_applies_repeated_resource_names_in_order(
+        self, sync_service, db_session, mock_google_client
+    ):
+        """Test a page that deletes and re-creates contacts keeps stream order."""
+        db_session.add(Contact(resource_name="people/c1", display_name="Old"))
+        db_session.commit()
+
+        def person(resource_name, name, deleted=False):
+            data = {"resourceName": resource_name, "names": [{"displayName": name}]}
+            if deleted:
+                data["metadata"] = {"deleted": True}
+            return data
+
+        mock_google_client.list_connections.return_value = [
+            {
+                "connections": [
+                    person("people/c1", "Old", deleted=True),
+                    person("people/c2", "Gone", deleted=True),
+                    person("people/c1", "Back"),
+                    person("people/c3", "New"),
+                    person("people/c3", "Gone Again", deleted=True),
+                ],
+                "nextSyncToken": "token",
+            }
+        ]
+
+        stats = sync_service.full_sync()
+
+        # people/c2 was never stored locally, so only two deletions count
+        assert stats.deleted == 2
+        assert (stats.created, stats.updated) == (1, 1)
+        contacts = {
+            c.resource_name: (c.display_name, c.deleted)
+            for c in db_session.query(Contact).all()
+        }
+        assert contacts == {
+            "people/c1": ("Back", False),
+            "people/c3": ("New", True),
+        }
+
     def test_full_sync_empty_response(
         self, sync_service, db_session, mock_google_client
     ):
@@ -50,6 +50,19 @@ class TestSettingsDefaults:
         settings = Settings()
         assert settings.database_echo is False
 
+    def test_database_strict_loads_default(self):
+        """Test strict relationship loading is disabled by default."""
+        settings = Settings()
+        assert settings.database_strict_loads is False
+
+    def test_database_pool_defaults(self):
+        """Test connection pool defaults."""
+        settings = Settings()
+        assert settings.database_pool_size == 10
+        assert settings.database_max_overflow == 20
+        assert settings.database_pool_timeout == 30
+        assert settings.database_pool_recycle == 3600
+
     def test_google_credentials_default_none(self):
         """Test Google credentials are None by default."""
         settings = Settings()
@@ -355,6 +368,21 @@ class TestSettingsProperties:
         settings = Settings(google_token_file="./custom/token.json")
         assert settings.token_path == Path("./custom/token.json")
 
+    def test_token_path_is_reused(self):
+        """Test token_path returns the same Path object for the same setting."""
+        settings = Settings(google_token_file="./custom/token.json")
+        assert settings.token_path is settings.token_path
+        assert (
+            settings.token_path
+            is Settings(google_token_file="./custom/token.json").token_path
+        )
+
+    def test_token_path_follows_setting_changes(self):
+        """Test token_path reflects updates to google_token_file."""
+        settings = Settings(google_token_file="./custom/token.json")
+        settings.google_token_file = "./other/token.json"
+        assert settings.token_path == Path("./other/token.json")
+
     def test_ensure_directories_creates_dirs(self, tmp_path):
         """Test ensure_directories creates required directories."""
         db_dir = tmp_path / "db_data"
@@ -385,17 +413,28 @@ class TestGetSettings:
         settings = get_settings()
         assert isinstance(settings, Settings)
 
-    def test_get_settings_returns_new_instance_each_call(self):
-        """Test get_settings returns a new instance each time."""
+    def test_get_settings_returns_cached_instance(self):
+        """Test get_settings returns the same cached instance."""
+        settings1 = get_settings()
+        settings2 = get_settings()
+        assert settings1 is settings2
+
+    def test_get_settings_cache_clear_creates_new_instance(self):
+        """Test cache_clear forces a new Settings instance."""
         settings1 = get_settings()
+        get_settings.cache_clear()
         settings2 = get_settings()
         assert settings1 is not settings2
 
     def test_get_settings_respects_env_vars(self, monkeypatch):
         """Test get_settings loads from environment."""
         monkeypatch.setenv("DEBUG", "true")
-        settings = get_settings()
-        assert settings.debug is True
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+            assert settings.debug is True
+        finally:
+            get_settings.cache_clear()
 
 
 class TestSettingsModelConfig:
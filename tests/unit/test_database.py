@@ -3,14 +3,22 @@
 This module tests the database setup implementation from Task 02.
 """
 
+import sqlite3
 import uuid
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, select, text
 from sqlalchemy.orm import sessionmaker
 
-from google_contacts_cisco.models import Base, Contact, PhoneNumber, SyncState
+from google_contacts_cisco.models import (
+    Base,
+    Contact,
+    PhoneNumber,
+    SyncState,
+    pool_options,
+    set_sqlite_pragma,
+)
 from google_contacts_cisco.models.db_utils import (
     check_connection,
     create_tables,
@@ -449,3 +457,187 @@ def test_sync_state_default_status(db_session):
     db_session.commit()
 
     assert sync_state.sync_status == SyncStatus.IDLE
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """Test SQLite connections get foreign keys, WAL and relaxed syncing."""
+    conn = sqlite3.connect(tmp_path / "contacts.db")
+    try:
+        set_sqlite_pragma(conn, None)
+
+        assert conn.execute("PRAGMA foreign_keys").fetchone() == (1,)
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        # 1 == NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone() == (1,)
+        assert conn.execute("PRAGMA cache_size").fetchone() == (-65536,)
+    finally:
+        conn.close()
+
+
+def test_contact_resource_name_has_single_unique_index():
+    """Test resource_name is covered by exactly one (unique) index."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    indexes = [
+        index
+        for index in inspect(engine).get_indexes("contacts")
+        if index["column_names"] == ["resource_name"]
+    ]
+    unique_constraints = inspect(engine).get_unique_constraints("contacts")
+
+    assert [index["name"] for index in indexes] == ["idx_contact_resource_name"]
+    assert indexes[0]["unique"]
+    assert unique_constraints == []
+
+
+def test_phone_value_lookup_uses_covering_index():
+    """Test a phone value lookup joined to contacts never reads phone rows."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT contacts.id FROM contacts "
+            "JOIN phone_numbers ON contacts.id = phone_numbers.contact_id "
+            "WHERE phone_numbers.value = ?",
+            ("+15551234567",),
+        ).all()
+
+    details = [row[-1] for row in plan]
+    assert any(
+        "COVERING INDEX idx_phone_number_value_contact" in detail for detail in details
+    )
+
+
+@pytest.mark.parametrize(
+    "order_by,index",
+    [
+        ((Contact.display_name, Contact.id), "idx_contact_active_name"),
+        ((Contact.updated_at.desc(), Contact.id.desc()), "idx_contact_active_updated"),
+    ],
+)
+def test_active_contact_lists_use_partial_indexes(order_by, index):
+    """Test active contact list queries are served by the partial indexes."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    stmt = (
+        select(Contact.id)
+        .where(Contact.deleted.is_(False))
+        .order_by(*order_by)
+        .limit(30)
+    )
+
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {stmt.compile(engine)}", (30, 0)
+        ).all()
+
+    assert any(index in row[-1] for row in plan)
+
+
+def test_latest_sync_state_lookup_uses_index():
+    """Test the newest sync state is read from the index, not a sort."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT sync_status FROM sync_states "
+            "ORDER BY last_sync_at DESC LIMIT 1"
+        ).all()
+
+    details = [row[-1] for row in plan]
+    assert any("idx_sync_state_last_sync_at" in detail for detail in details)
+    assert not any("TEMP B-TREE" in detail for detail in details)
+
+
+def test_contact_timestamps_default_on_bulk_insert(db_session):
+    """Test a bulk insert without timestamps stores microsecond timestamps."""
+    db_session.execute(
+        Contact.__table__.insert(),
+        [
+            {"id": uuid.uuid4(), "resource_name": f"people/{i}", "display_name": "X"}
+            for i in range(3)
+        ],
+    )
+    db_session.commit()
+
+    contacts = db_session.query(Contact).all()
+    assert len(contacts) == 3
+    assert all(isinstance(contact.created_at, datetime) for contact in contacts)
+    assert all(isinstance(contact.updated_at, datetime) for contact in contacts)
+    # Same text format SQLAlchemy binds for datetimes, so comparisons hold
+    stored = db_session.execute(
+        text("SELECT created_at, updated_at FROM contacts")
+    ).all()
+    assert {len(value) for row in stored for value in row} == {26}
+
+
+def test_contact_timestamps_default_in_database_for_raw_inserts(db_session):
+    """Test rows inserted outside SQLAlchemy still get timestamps."""
+    db_session.execute(
+        text(
+            "INSERT INTO contacts (id, resource_name, display_name, deleted) "
+            "VALUES (:id, 'people/raw', 'Raw', 0)"
+        ),
+        {"id": uuid.uuid4().hex},
+    )
+    db_session.commit()
+
+    contact = db_session.query(Contact).one()
+    assert isinstance(contact.created_at, datetime)
+    assert isinstance(contact.updated_at, datetime)
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("sqlite://", {}),
+        ("sqlite:///:memory:", {}),
+        (
+            "sqlite:///./data/contacts.db",
+            {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30},
+        ),
+        (
+            "postgresql://user@db/contacts",
+            {
+                "pool_size": 10,
+                "max_overflow": 20,
+                "pool_timeout": 30,
+                "pool_pre_ping": True,
+                "pool_recycle": 3600,
+            },
+        ),
+    ],
+)
+def test_pool_options(monkeypatch, url, expected):
+    """Test pool sizing applies to pooled engines and pre-ping to servers only."""
+    from google_contacts_cisco.config import settings
+
+    for name, value in [
+        ("database_pool_size", 10),
+        ("database_max_overflow", 20),
+        ("database_pool_timeout", 30),
+        ("database_pool_recycle", 3600),
+    ]:
+        monkeypatch.setattr(settings, name, value)
+
+    assert pool_options(url) == expected
+
+
+def test_file_engine_accepts_pool_options(tmp_path):
+    """Test the pool options are valid for a file-backed SQLite engine."""
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **pool_options(url))
+
+    assert engine.pool.size() == pool_options(url)["pool_size"]
+    engine.dispose()
+
+
+def test_engine_echo_follows_database_echo_setting():
+    """Test SQL echo is controlled by DATABASE_ECHO, not DEBUG."""
+    from google_contacts_cisco.config import settings
+    from google_contacts_cisco.models import engine
+
+    assert engine.echo == settings.database_echo
@@ -1,19 +1,89 @@
 """Tests for proxy headers middleware and OAuth callback with reverse proxy."""
 
+import logging
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from google_contacts_cisco import main
 from google_contacts_cisco.config import Settings
 from google_contacts_cisco.main import app
 
 
-def test_proxy_headers_middleware_not_enabled_by_default():
-    """Test that proxy headers middleware is not enabled by default."""
-    # The app is created with default settings (behind_proxy=False)
-    # Just verify the middleware count
-    assert len(app.user_middleware) >= 1  # At least CORS middleware
+def test_proxy_headers_middleware_not_added_to_app():
+    """Test that proxy headers are left to the server, not an app middleware."""
+    middleware_classes = [middleware.cls for middleware in app.user_middleware]
+    assert ProxyHeadersMiddleware not in middleware_classes
+
+
+def test_run_enables_proxy_headers_for_trusted_proxies(monkeypatch):
+    """Test run() passes trusted proxies to uvicorn's proxy header handling."""
+    monkeypatch.setattr(
+        main, "settings", Settings(trusted_proxies=["127.0.0.1", "10.0.0.0/8"])
+    )
+
+    with patch("uvicorn.run") as mock_run:
+        main.run()
+
+    kwargs = mock_run.call_args.kwargs
+    assert mock_run.call_args.args == (app,)
+    assert kwargs["proxy_headers"] is True
+    assert kwargs["forwarded_allow_ips"] == ["127.0.0.1", "10.0.0.0/8"]
+    assert kwargs["access_log"] is False
+
+
+def test_run_disables_proxy_headers_without_trusted_proxies(monkeypatch):
+    """Test run() turns off proxy header parsing when no proxies are trusted."""
+    monkeypatch.setattr(main, "settings", Settings(trusted_proxies=[]))
+
+    with patch("uvicorn.run") as mock_run:
+        main.run()
+
+    assert mock_run.call_args.kwargs["proxy_headers"] is False
+
+
+def test_warns_when_trusted_proxies_set_outside_run(monkeypatch, caplog):
+    """Test a warning is logged when another launcher ignores TRUSTED_PROXIES."""
+    monkeypatch.setattr(main, "settings", Settings(trusted_proxies=["10.0.0.1"]))
+    monkeypatch.setitem(sys.modules, "__main__", SimpleNamespace(__spec__=None))
+
+    with caplog.at_level(logging.WARNING, logger=main.__name__):
+        main.warn_if_trusted_proxies_unapplied()
+
+    assert "--forwarded-allow-ips=10.0.0.1" in caplog.text
+
+
+def test_no_proxy_warning_when_started_by_run(monkeypatch, caplog):
+    """Test no warning is logged under python -m google_contacts_cisco."""
+    monkeypatch.setattr(main, "settings", Settings(trusted_proxies=["10.0.0.1"]))
+    main_spec = SimpleNamespace(name="google_contacts_cisco.__main__")
+    monkeypatch.setitem(sys.modules, "__main__", SimpleNamespace(__spec__=main_spec))
+
+    with caplog.at_level(logging.WARNING, logger=main.__name__):
+        main.warn_if_trusted_proxies_unapplied()
+
+    assert caplog.text == ""
+
+
+def test_no_proxy_warning_without_trusted_proxies(monkeypatch, caplog):
+    """Test no warning is logged when TRUSTED_PROXIES is empty."""
+    monkeypatch.setattr(main, "settings", Settings(trusted_proxies=[]))
+
+    with caplog.at_level(logging.WARNING, logger=main.__name__):
+        main.warn_if_trusted_proxies_unapplied()
+
+    assert caplog.text == ""
+
+
+def test_cors_middleware_not_enabled_outside_debug():
+    """Test that CORS middleware is only added in debug mode."""
+    middleware_classes = [middleware.cls for middleware in app.user_middleware]
+    assert (CORSMiddleware in middleware_classes) is main.settings.debug
 
 
 def test_proxy_headers_middleware_enabled_with_setting():
@@ -1,7 +1,9 @@
 """Test datetime utilities."""
 
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfoNotFoundError
 
+from google_contacts_cisco.utils import datetime_utils
 from google_contacts_cisco.utils.datetime_utils import (
     format_timestamp_for_display,
     get_current_time_utc,
@@ -71,6 +73,26 @@ class TestFormatTimestampForDisplay:
         # Should fall back to UTC format
         assert result == "2026-01-09T20:30:00+00:00"
 
+    def test_invalid_timezone_is_looked_up_once(self, monkeypatch):
+        """Test a failed timezone lookup is remembered, not retried."""
+        lookups = []
+
+        def fake_zoneinfo(name):
+            lookups.append(name)
+            raise ZoneInfoNotFoundError(name)
+
+        monkeypatch.setattr(datetime_utils, "ZoneInfo", fake_zoneinfo)
+        datetime_utils._resolve_timezone.cache_clear()
+        dt = datetime(2026, 1, 9, 20, 30, 0, tzinfo=timezone.utc)
+
+        try:
+            results = {format_timestamp_for_display(dt, "Nowhere/Zone") for _ in "ab"}
+        finally:
+            datetime_utils._resolve_timezone.cache_clear()
+
+        assert results == {"2026-01-09T20:30:00+00:00"}
+        assert lookups == ["Nowhere/Zone"]
+
     def test_format_preserves_microseconds(self):
         """Test formatting preserves microseconds."""
         dt = datetime(2026, 1, 9, 20, 30, 0, 123456, tzinfo=timezone.utc)
@@ -7,13 +7,17 @@ This module tests the logging functionality including:
 - Root logger configuration
 """
 
+import io
 import logging
 import sys
+from contextlib import contextmanager
+from logging.handlers import QueueHandler
 from unittest.mock import Mock, patch
 
 from google_contacts_cisco.utils import logger as logger_module
 from google_contacts_cisco.utils.logger import (
     DEFAULT_LOG_FORMAT,
+    configure_queue_logging,
     configure_root_logger,
     get_logger,
 )
@@ -240,6 +244,86 @@ class TestConfigureRootLogger:
             assert isinstance(handlers[0], logging.StreamHandler)
 
 
+@contextmanager
+def bare_root_logger():
+    """Temporarily give the root logger an empty handler list.
+
+    Entered inside the test body so pytest's own capture handlers, which are
+    installed per test phase, are left alone.
+    """
+    root = logging.getLogger()
+    saved_level = root.level
+    try:
+        with patch.object(root, "handlers", []):
+            yield root
+    finally:
+        root.setLevel(saved_level)
+
+
+class TestConfigureQueueLogging:
+    """Test configure_queue_logging function."""
+
+    def test_installs_queue_handler(self, monkeypatch):
+        """Should route root records through a QueueHandler."""
+        mock_settings = Mock()
+        mock_settings.log_level = "WARNING"
+        monkeypatch.setattr(logger_module, "settings", mock_settings)
+
+        with bare_root_logger() as root, patch("atexit.register"):
+            listener = configure_queue_logging()
+            try:
+                assert listener is not None
+                assert len(root.handlers) == 1
+                assert isinstance(root.handlers[0], QueueHandler)
+                assert root.level == logging.WARNING
+            finally:
+                if listener is not None:
+                    listener.stop()
+
+    def test_listener_formats_records(self, monkeypatch):
+        """Should format records with the requested format on the listener."""
+        mock_settings = Mock()
+        mock_settings.log_level = "INFO"
+        monkeypatch.setattr(logger_module, "settings", mock_settings)
+        stream = io.StringIO()
+
+        with bare_root_logger(), patch("atexit.register"):
+            listener = configure_queue_logging(
+                format_string="%(levelname)s:%(message)s"
+            )
+            assert listener is not None
+            listener.handlers[0].setStream(stream)  # type: ignore[attr-defined]
+
+            logging.getLogger("queue.test").info("hello %s", "world")
+            listener.stop()
+
+        assert stream.getvalue() == "INFO:hello world\n"
+
+    def test_registers_listener_stop_at_exit(self, monkeypatch):
+        """Should stop the listener at interpreter exit."""
+        mock_settings = Mock()
+        mock_settings.log_level = "INFO"
+        monkeypatch.setattr(logger_module, "settings", mock_settings)
+
+        with bare_root_logger(), patch("atexit.register") as mock_register:
+            listener = configure_queue_logging()
+            try:
+                assert listener is not None
+                mock_register.assert_called_once_with(listener.stop)
+            finally:
+                if listener is not None:
+                    listener.stop()
+
+    def test_noop_when_root_already_configured(self):
+        """Should leave an already configured root logger untouched."""
+        existing = logging.NullHandler()
+
+        with bare_root_logger() as root:
+            root.addHandler(existing)
+            assert configure_queue_logging(level="DEBUG") is None
+            assert root.handlers == [existing]
+
+
 class TestLoggerIntegration:
     """Integration tests for logger functionality."""
 